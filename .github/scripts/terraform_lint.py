@@ -37,6 +37,7 @@ import re
 import fnmatch
 import subprocess
 import time
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Set, Optional, Tuple, Any, NamedTuple
 import traceback
 
@@ -139,6 +140,49 @@ def deep_checks_enabled_from_env() -> bool:
     return os.environ.get("HCBP_DEEP_CHECKS", "").strip().lower() in ("1", "true", "yes")
 
 
+# Rules manager of a worker process, created on its first file
+_worker_rules_manager = None
+
+
+def _validate_directory_in_worker(files: List[Tuple[str, str]], rule_filter: Dict[str, Any]) -> List[Tuple]:
+    """
+    Run the rules for the files of one directory in a worker process.
+
+    A directory is handled by a single worker because ST.013 and ST.014
+    check each directory once per process, and ST.002 reuses the parsed
+    variables.tf of the directory. The log callback cannot cross the
+    process boundary, so reported errors are collected as
+    (file_path, rule_id, message, line_number) tuples for the parent to
+    replay through its own log_error.
+
+    Args:
+        files: (file_path, content) pairs, in lint order
+        rule_filter: Rule filter built by the parent linter
+
+    Returns:
+        One (batch execution summary, error reports, failure) tuple per file;
+        on an exception the summary is None and failure holds
+        (message, formatted traceback)
+    """
+    global _worker_rules_manager
+    if _worker_rules_manager is None:
+        _worker_rules_manager = RulesManager()
+
+    results = []
+    for file_path, content in files:
+        reports = []
+
+        def collect_error(path: str, rule_id: str, message: str, line_number: Optional[int] = None):
+            reports.append((path, rule_id, message, line_number))
+
+        try:
+            batch_summary = _worker_rules_manager.validate_file(file_path, content, collect_error, rule_filter)
+            results.append((batch_summary, reports, None))
+        except Exception as e:
+            results.append((None, reports, (str(e), traceback.format_exc())))
+    return results
+
+
 class TerraformLinter:
     """
     Enhanced Terraform Scripts Linter using Unified Rules Management System
@@ -159,7 +203,7 @@ class TerraformLinter:
                  exclude_paths: List[str] = None, changed_files_only: bool = False,
                  base_ref: str = None, rule_categories: List[str] = None,
                  enable_performance_monitoring: bool = True,
-                 deep_checks: bool = False):
+                 deep_checks: bool = False, jobs: int = 1):
         """
         Initialize the enhanced Terraform linter with unified rules management.
 
@@ -172,6 +216,7 @@ class TerraformLinter:
             rule_categories: List of rule categories to execute (ST, IO, DC, SC). If None, all categories are used.
             enable_performance_monitoring: Whether to enable detailed performance monitoring
             deep_checks: Enable deep integration checks (SC.004 GitHub + terraform validate)
+            jobs: Number of worker processes used to lint files (1 lints sequentially)
         """
         # Initialize unified rules manager
         self.rules_manager = RulesManager()
@@ -185,6 +230,7 @@ class TerraformLinter:
         self.rule_categories = rule_categories or ["ST", "IO", "DC", "SC"]
         self.enable_performance_monitoring = enable_performance_monitoring
         self.deep_checks = deep_checks
+        self.jobs = max(1, jobs)
 
         # Error and warning tracking - using structured records
         self.errors: List[ErrorRecord] = []
@@ -216,6 +262,8 @@ class TerraformLinter:
             print("- Deep checks enabled (SC.004)")
         else:
             print("- Deep checks disabled (SC.004 skipped; pass --deep or set HCBP_DEEP_CHECKS=1)")
+        if self.jobs > 1:
+            print(f"- Worker processes: {self.jobs}")
 
     def get_excluded_rules(self) -> Set[str]:
         """Return rules excluded for this run (user ignores + default deep rules)."""
@@ -472,38 +520,18 @@ class TerraformLinter:
             return False
 
         # Update performance metrics
-        self.files_processed += 1
-        lines_count = len(content.split('\n'))
-        self.total_lines_processed += lines_count
+        self._count_file_lines(content)
 
         try:
-            # Create rule filter based on configuration
-            # Calculate excluded categories (all categories except the ones we want to include)
-            all_categories = ["ST", "IO", "DC", "SC"]
-            excluded_categories = [cat for cat in all_categories if cat not in self.rule_categories]
-
-            rule_filter = {
-                "excluded_categories": excluded_categories,
-                "excluded_rules": list(self.get_excluded_rules())
-            }
-
             # Execute rules using unified system
             batch_summary = self.rules_manager.validate_file(
                 file_path, 
                 content, 
                 self.log_error,
-                rule_filter
+                self._build_rule_filter()
             )
 
-            # Store execution results for reporting
-            self.execution_results.append(batch_summary)
-
-            # Update violation counts by category - sync with actual error/warning counts
-            for category in ["ST", "IO", "DC", "SC"]:
-                # Calculate violations for this category as errors + warnings
-                category_violations = self.errors_by_category[category] + self.warnings_by_category[category]
-                self.violations_by_category[category] = category_violations
-
+            self._record_batch_summary(batch_summary)
             return batch_summary.failed_rules == 0
 
         except Exception as e:
@@ -511,6 +539,113 @@ class TerraformLinter:
             traceback.print_exc()
             return False
 
+    def lint_files_parallel(self, tf_files: List[str]) -> bool:
+        """
+        Lint files on a pool of worker processes.
+
+        Files are read here and each directory's files are linted by one
+        worker. Results are replayed in file order, so console output,
+        reports and counters match a sequential run.
+
+        Args:
+            tf_files: Paths of the files to lint
+
+        Returns:
+            True if no errors found, False otherwise
+        """
+        rule_filter = self._build_rule_filter()
+        success = True
+
+        contents = {}
+        files_by_directory: Dict[str, List[Tuple[str, str]]] = {}
+        for file_path in tf_files:
+            content = self.read_file_content(file_path)
+            contents[file_path] = content
+            if content is not None:
+                files_by_directory.setdefault(os.path.dirname(file_path), []).append((file_path, content))
+
+        results = {}
+
+        def fail_directory(files: List[Tuple[str, str]], error: Exception):
+            # A worker that died (BrokenProcessPool) takes its directory with it;
+            # its files are reported like any other processing error
+            failure = (str(error), traceback.format_exc())
+            for file_path, _ in files:
+                results[file_path] = (None, [], failure)
+
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            futures = []
+            for files in files_by_directory.values():
+                try:
+                    futures.append((files, executor.submit(_validate_directory_in_worker, files, rule_filter)))
+                except Exception as e:
+                    fail_directory(files, e)
+
+            for files, future in futures:
+                try:
+                    directory_results = future.result()
+                except Exception as e:
+                    fail_directory(files, e)
+                    continue
+                for (file_path, _), result in zip(files, directory_results):
+                    results[file_path] = result
+
+        for file_path in tf_files:
+            print(f"Linting file: {file_path}")
+            content = contents[file_path]
+            if content is None:
+                success = False
+                continue
+
+            self._count_file_lines(content)
+            batch_summary, reports, failure = results[file_path]
+            for report in reports:
+                self.log_error(*report)
+            if failure is not None:
+                message, formatted_traceback = failure
+                print(f"Error processing file {file_path}: {message}")
+                sys.stderr.write(formatted_traceback)
+                success = False
+                continue
+
+            self._record_batch_summary(batch_summary)
+            if batch_summary.failed_rules != 0:
+                success = False
+
+        return success
+
+    def _build_rule_filter(self) -> Dict[str, List[str]]:
+        """
+        Build the rule filter for the configured categories and excluded rules.
+
+        Returns:
+            Rule filter accepted by RulesManager.validate_file
+        """
+        # Calculate excluded categories (all categories except the ones we want to include)
+        all_categories = ["ST", "IO", "DC", "SC"]
+        excluded_categories = [cat for cat in all_categories if cat not in self.rule_categories]
+
+        return {
+            "excluded_categories": excluded_categories,
+            "excluded_rules": list(self.get_excluded_rules())
+        }
+
+    def _count_file_lines(self, content: str):
+        """Update the file and line counters for one linted file."""
+        self.files_processed += 1
+        self.total_lines_processed += len(content.split('\n'))
+
+    def _record_batch_summary(self, batch_summary: BatchExecutionSummary):
+        """Store a file's execution summary and resync the violation counts."""
+        # Store execution results for reporting
+        self.execution_results.append(batch_summary)
+
+        # Update violation counts by category - sync with actual error/warning counts
+        for category in ["ST", "IO", "DC", "SC"]:
+            # Calculate violations for this category as errors + warnings
+            category_violations = self.errors_by_category[category] + self.warnings_by_category[category]
+            self.violations_by_category[category] = category_violations
+
     def lint_directory(self, directory: str) -> bool:
         """
         Lint all Terraform files in a directory using unified rules management.
@@ -542,10 +677,13 @@ class TerraformLinter:
                 return True
             print(f"Found {len(tf_files)} .tf files to check")
 
-        success = True
-        for file_path in tf_files:
-            if not self.lint_file(file_path):
-                success = False
+        if self.jobs > 1 and len(tf_files) > 1:
+            success = self.lint_files_parallel(tf_files)
+        else:
+            success = True
+            for file_path in tf_files:
+                if not self.lint_file(file_path):
+                    success = False
 
         self.end_time = time.time()
         return success
@@ -1282,6 +1420,9 @@ def main():
     parser.add_argument('--report-file', action='store_true',
                        help='Generate report files (default: console-only)')
 
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                       help='Number of worker processes used to lint files (default: 1, sequential)')
+
     parser.add_argument('-u', '--upgrade', action='store_true',
                        help='Pull the latest release from origin (git install only; exits without linting)')
 
@@ -1309,6 +1450,10 @@ def main():
     
     enable_performance_monitoring = perf_monitoring_value == 'true'
 
+    if args.jobs < 1:
+        print(f"Error: Invalid value for --jobs: {args.jobs}. Must be at least 1.")
+        sys.exit(1)
+
     # Display performance monitoring status
     if not enable_performance_monitoring:
         print("Performance monitoring disabled")
@@ -1360,6 +1505,7 @@ def main():
         rule_categories=rule_categories,
         enable_performance_monitoring=enable_performance_monitoring,
         deep_checks=deep_checks,
+        jobs=args.jobs,
     )
 
     print(f"Starting enhanced Terraform lint check in: {target_directory}")
@@ -0,0 +1,13 @@
+resource "null_resource" "test" {
+}
+
+# IO.002 bad: output block with nested blocks belongs in outputs.tf
+output "resource_info" {
+  description = "The information of the resource"
+  value       = {
+    id       = null_resource.test.id
+    triggers = {
+      source = "terraform"
+    }
+  }
+}
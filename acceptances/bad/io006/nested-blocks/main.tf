@@ -0,0 +1,5 @@
+resource "null_resource" "test" {
+  triggers = {
+    name = var.subnet_config.name
+  }
+}
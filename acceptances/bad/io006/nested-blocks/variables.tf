@@ -0,0 +1,18 @@
+# IO.006 bad: the description is missing from a variable with nested blocks
+variable "subnet_config" {
+  type    = object({
+    name = string
+    tags = map(string)
+  })
+  default = {
+    name = "demo"
+    tags = {
+      owner = "terraform"
+    }
+  }
+
+  validation {
+    condition     = length(var.subnet_config.name) > 0
+    error_message = "The subnet name must not be empty."
+  }
+}
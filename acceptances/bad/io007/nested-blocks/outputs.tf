@@ -0,0 +1,10 @@
+# IO.007 bad: empty description on an output with nested blocks
+output "resource_info" {
+  description = ""
+  value       = {
+    id       = null_resource.test.id
+    triggers = {
+      source = "terraform"
+    }
+  }
+}
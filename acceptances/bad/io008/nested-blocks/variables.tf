@@ -0,0 +1,15 @@
+# IO.008 bad: the type is missing from a variable with nested blocks
+variable "subnet_config" {
+  description = "The configuration of the subnet"
+  default     = {
+    name = "demo"
+    tags = {
+      owner = "terraform"
+    }
+  }
+
+  validation {
+    condition     = length(var.subnet_config.name) > 0
+    error_message = "The subnet name must not be empty."
+  }
+}
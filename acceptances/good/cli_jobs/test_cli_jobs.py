@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Tests for linting files on worker processes with --jobs."""
+
+import contextlib
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+LINT_SCRIPT = REPO_ROOT / ".github" / "scripts" / "terraform_lint.py"
+sys.path.insert(0, str(REPO_ROOT))
+
+# Output lines that legitimately differ between runs
+_VARYING_PREFIXES = ("Execution Time:", "- Worker processes:")
+
+
+def _load_lint_module():
+    spec = importlib.util.spec_from_file_location("terraform_lint", str(LINT_SCRIPT))
+    module = importlib.util.module_from_spec(spec)
+    # Registered so worker processes can unpickle the module's functions
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _exit_worker(files, rule_filter):
+    """Stand-in worker that dies like a crashed process."""
+    os._exit(1)
+
+
+def _run_lint(*extra_args):
+    completed = subprocess.run(
+        ["python3", str(LINT_SCRIPT), "--directory", "acceptances/bad", *extra_args],
+        cwd=str(REPO_ROOT),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=False,
+    )
+    lines = [line for line in completed.stdout.splitlines() if not line.startswith(_VARYING_PREFIXES)]
+    return completed.returncode, lines
+
+
+class JobsCliTest(unittest.TestCase):
+    def test_parallel_output_matches_sequential(self):
+        sequential_code, sequential_lines = _run_lint()
+        parallel_code, parallel_lines = _run_lint("--jobs", "2")
+
+        self.assertEqual(parallel_code, sequential_code)
+        self.assertEqual(parallel_lines, sequential_lines)
+        self.assertTrue(any(line.startswith("ERROR:") for line in parallel_lines))
+
+    def test_jobs_must_be_positive(self):
+        code, lines = _run_lint("--jobs", "0")
+        self.assertEqual(code, 1)
+        self.assertIn("Error: Invalid value for --jobs: 0. Must be at least 1.", lines)
+
+
+class WorkerFailureTest(unittest.TestCase):
+    def test_dead_worker_is_reported_per_file(self):
+        lint_module = _load_lint_module()
+        tf_files = [
+            str(REPO_ROOT / "acceptances" / "bad" / "io006" / "missing-description" / "main.tf"),
+            str(REPO_ROOT / "acceptances" / "bad" / "io008" / "missing-type" / "variables.tf"),
+        ]
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            linter = lint_module.TerraformLinter(jobs=2)
+            with mock.patch.object(lint_module, "_validate_directory_in_worker", _exit_worker):
+                success = linter.lint_files_parallel(tf_files)
+
+        self.assertFalse(success)
+        for file_path in tf_files:
+            self.assertIn(f"Error processing file {file_path}:", output.getvalue())
+        self.assertEqual(linter.files_processed, len(tf_files))
+        self.assertEqual(linter.execution_results, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
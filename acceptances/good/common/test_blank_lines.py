@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Tests for the shared blank-line index used by ST.006 / ST.007 / ST.008."""
+
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from rules.common.blank_lines import BlankLineIndex, get_blank_line_index  # noqa: E402
+
+
+LINES = [
+    'name = "a"',   # 0 content
+    '',             # 1 blank
+    '   ',          # 2 blank (whitespace only)
+    '# comment',    # 3 comment
+    '',             # 4 blank
+    'type = "b"',   # 5 content
+    '\t',           # 6 blank
+]
+
+
+def _count_blank(lines, start, end):
+    return sum(1 for line in lines[start:end] if not line.strip())
+
+
+class BlankLineIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = BlankLineIndex(LINES)
+
+    def test_count_blank_matches_direct_count(self):
+        for start in range(len(LINES) + 1):
+            for end in range(len(LINES) + 1):
+                self.assertEqual(
+                    self.index.count_blank(start, end),
+                    _count_blank(LINES, start, end) if end > start else 0,
+                )
+
+    def test_count_blank_clamps_end(self):
+        self.assertEqual(self.index.count_blank(0, 100), 4)
+
+    def test_count_blank_empty_range(self):
+        self.assertEqual(self.index.count_blank(4, 2), 0)
+
+    def test_comment_lines_do_not_reset_count(self):
+        # Blank lines on both sides of the comment count, none before 'name'
+        self.assertEqual(self.index.count_blank_after_content(0, 5), 3)
+
+    def test_content_line_resets_count(self):
+        self.assertEqual(self.index.count_blank_after_content(0, 7), 1)
+        self.assertEqual(self.index.count_blank_after_content(0, 6), 0)
+
+    def test_empty_lines(self):
+        index = BlankLineIndex([])
+        self.assertEqual(index.count_blank(0, 3), 0)
+        self.assertEqual(index.count_blank_after_content(0, 3), 0)
+
+
+class GetBlankLineIndexTest(unittest.TestCase):
+    def test_index_built_from_content_lines(self):
+        index = get_blank_line_index('a = 1\n\n\nb = 2\n')
+        self.assertEqual(index.count_blank(0, 5), 3)
+        self.assertEqual(index.count_blank_after_content(0, 3), 2)
+
+    def test_index_cached_per_content(self):
+        content = 'x = 1\n\ny = 2\n'
+        self.assertIs(get_blank_line_index(content), get_blank_line_index(content))
+
+
+if __name__ == "__main__":
+    unittest.main()
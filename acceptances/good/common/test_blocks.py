@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Tests for the shared brace-matching block scanner and the IO rules using it."""
+
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from rules.common.blocks import VARIABLE_HEADER_RE, find_block_end, iter_blocks  # noqa: E402
+from rules.io_rules.rule_002 import check_io002_output_file_location  # noqa: E402
+from rules.io_rules.rule_006 import check_io006_variable_description  # noqa: E402
+from rules.io_rules.rule_007 import check_io007_output_description  # noqa: E402
+from rules.io_rules.rule_008 import check_io008_variable_type  # noqa: E402
+
+
+class FindBlockEndTest(unittest.TestCase):
+    def test_nested_braces(self):
+        content = 'a { b { c { } } } d'
+        self.assertEqual(find_block_end(content, 2), 16)
+
+    def test_braces_inside_strings_are_ignored(self):
+        content = '{ x = "}" y = "\\"{" }'
+        self.assertEqual(find_block_end(content, 0), len(content) - 1)
+
+    def test_unterminated_block(self):
+        self.assertEqual(find_block_end('{ a = { b = 1 }', 0), -1)
+
+
+class IterBlocksTest(unittest.TestCase):
+    def test_nested_body_and_line_number(self):
+        content = '\nvariable "a" {\n  default = {\n    tags = {\n      k = "v"\n    }\n  }\n}\n'
+        blocks = list(iter_blocks(content, VARIABLE_HEADER_RE))
+        self.assertEqual(len(blocks), 1)
+        header, body, line_number = blocks[0]
+        self.assertEqual(header.group(1), "a")
+        self.assertEqual(line_number, 2)
+        self.assertTrue(body.rstrip().endswith("}"))
+        self.assertIn('k = "v"', body)
+
+    def test_unterminated_block_is_skipped(self):
+        content = 'variable "a" {\n  type = string\n\nvariable "b" {\n  type = string\n}\n'
+        blocks = list(iter_blocks(content, VARIABLE_HEADER_RE))
+        self.assertEqual([(header.group(1), line) for header, _, line in blocks], [("b", 4)])
+
+
+class NestedBlockRulesTest(unittest.TestCase):
+    def _run_rule(self, check_function, rel_path: str):
+        file_path = REPO_ROOT / rel_path
+        content = file_path.read_text(encoding="utf-8")
+        errors = []
+
+        def log_error(path, rule_id, message, line_num):
+            errors.append((rule_id, message, line_num))
+
+        check_function(str(file_path), content, log_error)
+        return errors
+
+    def test_nested_variable_examples_pass(self):
+        rel_path = "acceptances/good/io006/nested-blocks/variables.tf"
+        self.assertEqual(self._run_rule(check_io006_variable_description, rel_path), [])
+        self.assertEqual(self._run_rule(check_io008_variable_type, rel_path), [])
+
+    def test_nested_variable_missing_description_fails(self):
+        errors = self._run_rule(
+            check_io006_variable_description, "acceptances/bad/io006/nested-blocks/variables.tf"
+        )
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], "IO.006")
+        self.assertIn("subnet_config", errors[0][1])
+        self.assertEqual(errors[0][2], 2)
+
+    def test_nested_variable_missing_type_fails(self):
+        errors = self._run_rule(
+            check_io008_variable_type, "acceptances/bad/io008/nested-blocks/variables.tf"
+        )
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], "IO.008")
+        self.assertIn("subnet_config", errors[0][1])
+
+    def test_nested_output_examples_pass(self):
+        errors = self._run_rule(
+            check_io007_output_description, "acceptances/good/io007/nested-blocks/outputs.tf"
+        )
+        self.assertEqual(errors, [])
+
+    def test_nested_output_empty_description_fails(self):
+        errors = self._run_rule(
+            check_io007_output_description, "acceptances/bad/io007/nested-blocks/outputs.tf"
+        )
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], "IO.007")
+        self.assertIn("resource_info", errors[0][1])
+
+    def test_nested_output_outside_outputs_tf_fails(self):
+        errors = self._run_rule(
+            check_io002_output_file_location, "acceptances/bad/io002/nested-blocks/main.tf"
+        )
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], "IO.002")
+        self.assertEqual(errors[0][2], 5)
+
+    def test_unterminated_variable_block_is_skipped(self):
+        rel_path = "acceptances/good/io006/unterminated-block/variables.tf"
+        self.assertEqual(self._run_rule(check_io006_variable_description, rel_path), [])
+        self.assertEqual(self._run_rule(check_io008_variable_type, rel_path), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
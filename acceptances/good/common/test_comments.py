@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Tests for the shared comment stripping helpers."""
+
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from rules.common.comments import remove_comments_for_parsing, strip_comments  # noqa: E402
+
+
+class StripCommentsTest(unittest.TestCase):
+    def test_line_comment_removed(self):
+        self.assertEqual(strip_comments('a = 1 # comment'), 'a = 1 ')
+
+    def test_full_line_comments_keep_line_breaks(self):
+        self.assertEqual(strip_comments('# full\n  # indented\nq = 1'), '\n  \nq = 1')
+
+    def test_text_without_comment_unchanged(self):
+        text = 'name = "demo"\n'
+        self.assertEqual(strip_comments(text), text)
+
+    def test_hash_inside_double_quotes_kept(self):
+        self.assertEqual(strip_comments('x = "abc # not" # real'), 'x = "abc # not" ')
+
+    def test_hash_inside_single_quotes_kept(self):
+        self.assertEqual(strip_comments("x = 'abc # not' # real"), "x = 'abc # not' ")
+
+    def test_escaped_double_quote_does_not_close_string(self):
+        self.assertEqual(strip_comments('y = "a \\" # b" # c'), 'y = "a \\" # b" ')
+
+    def test_escaped_single_quote_does_not_close_string(self):
+        self.assertEqual(strip_comments("z = 'it\\'s # x' # y"), "z = 'it\\'s # x' ")
+
+    def test_unterminated_string_ends_at_line_break(self):
+        text = 'u = "abc # open\n# comment\nv = 2'
+        self.assertEqual(strip_comments(text), 'u = "abc # open\n\nv = 2')
+
+    def test_crlf_line_structure_preserved(self):
+        text = 'w = 1 # comment\r\nk = 2\r\n'
+        stripped = strip_comments(text)
+        self.assertEqual(stripped, 'w = 1 \nk = 2\r\n')
+        self.assertEqual(stripped.count('\n'), text.count('\n'))
+
+
+class RemoveCommentsForParsingTest(unittest.TestCase):
+    def test_matches_strip_comments(self):
+        content = 'variable "a" { # comment\n  default = "#1" # other\n}\n'
+        self.assertEqual(remove_comments_for_parsing(content), strip_comments(content))
+
+    def test_result_cached_per_content(self):
+        content = 'locals { # cached\n}\n'
+        self.assertIs(remove_comments_for_parsing(content), remove_comments_for_parsing(content))
+
+
+if __name__ == "__main__":
+    unittest.main()
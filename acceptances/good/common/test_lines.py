@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Tests for the shared content line splitting."""
+
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from rules.common.lines import get_content_lines  # noqa: E402
+
+
+class GetContentLinesTest(unittest.TestCase):
+    def test_split_on_newlines(self):
+        self.assertEqual(get_content_lines('a\nb\n'), ['a', 'b', ''])
+
+    def test_crlf_keeps_carriage_returns(self):
+        self.assertEqual(get_content_lines('a\r\nb'), ['a\r', 'b'])
+
+    def test_other_line_separators_do_not_split(self):
+        # Unlike str.splitlines, only '\n' ends a line
+        self.assertEqual(get_content_lines('# a\x0cb c\nd'), ['# a\x0cb c', 'd'])
+
+    def test_lines_cached_per_content(self):
+        content = 'x = 1\ny = 2\n'
+        self.assertIs(get_content_lines(content), get_content_lines(content))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Tests for the shared snake_case name validation used by IO.004 / IO.005."""
+
+import sys
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(REPO_ROOT))
+
+from rules.common.naming import is_snake_case_name  # noqa: E402
+from rules.io_rules.rule_004 import _is_valid_variable_name  # noqa: E402
+from rules.io_rules.rule_005 import _is_valid_name  # noqa: E402
+
+
+VALID_NAMES = [
+    "a",
+    "vpc",
+    "vpc_name",
+    "subnet_cidr_v4_list",
+    "az2_name_x",
+    "name_",
+]
+
+INVALID_NAMES = [
+    "",
+    "VpcName",
+    "vpc_Name",
+    "vpcName",
+    "_vpc",
+    "1vpc",
+    "vpc-name",
+    "vpc name",
+    "vpc__name",
+    "vpc_name2",
+    "vpc2",
+    "vpc.name",
+    "vpc_näme",
+]
+
+
+class IsSnakeCaseNameTest(unittest.TestCase):
+    def test_valid_names(self):
+        for name in VALID_NAMES:
+            with self.subTest(name=name):
+                self.assertTrue(is_snake_case_name(name))
+
+    def test_invalid_names(self):
+        for name in INVALID_NAMES:
+            with self.subTest(name=name):
+                self.assertFalse(is_snake_case_name(name))
+
+    def test_rules_delegate_to_shared_check(self):
+        for name in VALID_NAMES + INVALID_NAMES:
+            with self.subTest(name=name):
+                expected = is_snake_case_name(name)
+                self.assertEqual(_is_valid_variable_name(name), expected)
+                self.assertEqual(_is_valid_name(name), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+variable "subnet_config" {
+  description = "The configuration of the subnet"
+  type        = object({
+    name = string
+    tags = map(string)
+  })
+  default     = {
+    name = "demo"
+    tags = {
+      owner = "terraform"
+    }
+  }
+
+  validation {
+    condition     = length(var.subnet_config.name) > 0
+    error_message = "The subnet name must not be empty."
+  }
+}
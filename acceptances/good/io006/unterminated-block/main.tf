@@ -0,0 +1,6 @@
+resource "null_resource" "test" {
+  triggers = {
+    vpc_name    = var.vpc_name
+    subnet_name = var.subnet_name
+  }
+}
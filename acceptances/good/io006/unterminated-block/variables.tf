@@ -0,0 +1,9 @@
+# The first block is never closed, so it is skipped; the next one is still checked
+variable "vpc_name" {
+  type = string
+
+variable "subnet_name" {
+  description = "The name of the subnet"
+  type        = string
+  default     = "demo"
+}
@@ -0,0 +1,9 @@
+output "resource_info" {
+  description = "The information of the resource"
+  value       = {
+    id       = null_resource.test.id
+    triggers = {
+      source = "terraform"
+    }
+  }
+}
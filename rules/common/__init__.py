@@ -1,5 +1,16 @@
 """Shared helpers used across ST / IO / SC / DC rules."""
 
+from .blank_lines import BlankLineIndex, get_blank_line_index
+from .blocks import (
+    OUTPUT_HEADER_RE,
+    VARIABLE_HEADER_RE,
+    find_block_end,
+    get_blocks,
+    iter_blocks,
+)
+from .comments import remove_comments_for_parsing, strip_comments
+from .lines import get_content_lines
+from .naming import is_snake_case_name
 from .provider_variables import (
     PROVIDER_REGION_EXACT,
     PROVIDER_REGION_PREFIX,
@@ -23,6 +34,17 @@ from .sensitive_patterns import (
 )
 
 __all__ = [
+    "BlankLineIndex",
+    "get_blank_line_index",
+    "OUTPUT_HEADER_RE",
+    "VARIABLE_HEADER_RE",
+    "find_block_end",
+    "get_blocks",
+    "iter_blocks",
+    "remove_comments_for_parsing",
+    "strip_comments",
+    "get_content_lines",
+    "is_snake_case_name",
     "PROVIDER_REGION_EXACT",
     "PROVIDER_REGION_PREFIX",
     "PROVIDER_VARIABLE_NAMES",
@@ -0,0 +1,61 @@
+"""
+Shared blank-line counting for the ST.006 / ST.007 / ST.008 spacing checks.
+"""
+
+import functools
+from typing import List
+
+from .lines import get_content_lines
+
+
+class BlankLineIndex:
+    """
+    Prefix sums over a file's lines that answer blank-line range queries in O(1).
+
+    A line is blank when it is empty after stripping; a content line is any
+    non-blank line that is not a ``#`` comment.
+    """
+
+    def __init__(self, lines: List[str]) -> None:
+        # blank_prefix[k]: blank lines in lines[:k]
+        # last_content[i]: index of the last content line at or before i, or -1
+        blank_prefix = [0]
+        last_content = []
+        blanks = 0
+        last = -1
+        for idx, line in enumerate(lines):
+            stripped = line.strip()
+            if not stripped:
+                blanks += 1
+            elif not stripped.startswith('#'):
+                last = idx
+            blank_prefix.append(blanks)
+            last_content.append(last)
+        self._blank_prefix = blank_prefix
+        self._last_content = last_content
+
+    def count_blank(self, start_idx: int, end_idx: int) -> int:
+        """Count blank lines in lines[start_idx:end_idx]."""
+        end_idx = min(end_idx, len(self._last_content))
+        if end_idx <= start_idx:
+            return 0
+        return self._blank_prefix[end_idx] - self._blank_prefix[start_idx]
+
+    def count_blank_after_content(self, start_idx: int, end_idx: int) -> int:
+        """
+        Count blank lines in lines[start_idx:end_idx] after the last content line.
+
+        Comment lines neither count nor reset the count; a content line resets
+        it, so only the blank lines directly above the next parameter remain.
+        """
+        end_idx = min(end_idx, len(self._last_content))
+        if end_idx <= start_idx:
+            return 0
+        start_idx = max(start_idx, self._last_content[end_idx - 1] + 1)
+        return self._blank_prefix[end_idx] - self._blank_prefix[start_idx]
+
+
+@functools.lru_cache(maxsize=8)
+def get_blank_line_index(content: str) -> BlankLineIndex:
+    """Build the blank-line index once per file content (shared by ST.006-ST.008)."""
+    return BlankLineIndex(get_content_lines(content))
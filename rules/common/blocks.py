@@ -0,0 +1,88 @@
+"""
+Shared brace-matching block scanner for rules that read whole block bodies.
+"""
+
+import functools
+import re
+from typing import Iterator, Match, Pattern, Tuple
+
+
+# Variable and output headers up to the opening brace, shared by the IO rules
+# so their parses land on the same get_blocks() cache entry
+VARIABLE_HEADER_RE = re.compile(
+    r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{'
+)
+OUTPUT_HEADER_RE = re.compile(
+    r'output\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{'
+)
+# A single-line double-quoted string (braces inside it are not counted) or a brace
+_STRING_OR_BRACE_RE = re.compile(r'"(?:\\.|[^"\\\n])*"|[{}]')
+
+
+def find_block_end(content: str, open_brace: int) -> int:
+    """
+    Return the index of the '}' closing the '{' at *open_brace*, or -1.
+
+    Args:
+        content (str): The Terraform content
+        open_brace (int): Index of an opening brace in content
+
+    Returns:
+        int: Index of the matching closing brace, or -1 when unterminated
+    """
+    depth = 0
+    for token in _STRING_OR_BRACE_RE.finditer(content, open_brace):
+        brace = token.group()
+        if brace == '{':
+            depth += 1
+        elif brace == '}':
+            depth -= 1
+            if depth == 0:
+                return token.start()
+    return -1
+
+
+def iter_blocks(content: str, header_re: Pattern[str]) -> Iterator[Tuple[Match, str, int]]:
+    """
+    Yield each block whose header matches *header_re*, with its body.
+
+    The header pattern must end with the block's opening '{'. Bodies may nest
+    to any depth and the scan is linear in the content length; an
+    unterminated block is skipped. Scanning resumes after each block, so
+    headers inside a block body are not reported separately.
+
+    Args:
+        content (str): The cleaned Terraform content
+        header_re (Pattern[str]): Compiled block header pattern
+
+    Yields:
+        Tuple[Match, str, int]: (header match, body between the braces,
+        1-based line number of the header)
+    """
+    pos = 0
+    line_number = 1
+    counted_to = 0  # content[:counted_to] holds line_number - 1 newlines
+    while True:
+        header = header_re.search(content, pos)
+        if not header:
+            return
+        block_end = find_block_end(content, header.end() - 1)
+        if block_end == -1:
+            pos = header.end()
+            continue
+        line_number += content.count('\n', counted_to, header.start())
+        counted_to = header.start()
+        yield header, content[header.end():block_end], line_number
+        pos = block_end + 1
+
+
+@functools.lru_cache(maxsize=16)
+def get_blocks(content: str, header_re: Pattern[str]) -> Tuple[Tuple[Match, str, int], ...]:
+    """
+    Return the iter_blocks() results once per content and header pattern.
+
+    IO.006 and IO.008 scan the same variable blocks, and IO.002 and IO.007
+    the same output blocks, back to back on each file; the second rule
+    reuses the first scan.
+    """
+    return tuple(iter_blocks(content, header_re))
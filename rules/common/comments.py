@@ -0,0 +1,49 @@
+"""
+Shared comment stripping used by rules that parse HCL on cleaned content.
+"""
+
+import functools
+import re
+
+
+# A quoted segment (group 1) or a ``#`` comment running to end of line.
+# Strings never span lines and may be unterminated; a quote preceded by a
+# backslash neither opens nor closes a string.
+_COMMENT_STRIP_RE = re.compile(
+    r'((?<!\\)"(?:\\"|[^"\n])*"?|(?<!\\)\'(?:\\\'|[^\'\n])*\'?)|#[^\n]*'
+)
+
+
+def strip_comments(text: str) -> str:
+    """
+    Remove ``#`` comments outside quotes from *text*, keeping line breaks.
+
+    Uncached; use remove_comments_for_parsing() for whole file contents.
+
+    Args:
+        text (str): Terraform text, one line or many
+
+    Returns:
+        str: Text with comments removed
+    """
+    # Quoted strings are kept verbatim, so only a '#' can change the text
+    if '#' not in text:
+        return text
+    return _COMMENT_STRIP_RE.sub(r'\1', text)
+
+
+@functools.lru_cache(maxsize=8)
+def remove_comments_for_parsing(content: str) -> str:
+    """
+    Remove ``#`` comments outside quotes while preserving line structure.
+
+    ST.002 and IO.002-IO.008 all clean the same file content in turn, so
+    the result is cached per content and computed once per file.
+
+    Args:
+        content (str): The original file content
+
+    Returns:
+        str: Content with comments removed
+    """
+    return strip_comments(content)
@@ -0,0 +1,18 @@
+"""
+Shared line splitting so rules run on the same content reuse one line list.
+"""
+
+import functools
+from typing import List
+
+
+@functools.lru_cache(maxsize=8)
+def get_content_lines(content: str) -> List[str]:
+    """
+    Split *content* on newlines once per content string.
+
+    The ST rules run one after another on the same file content and each
+    needs its lines. The returned list is shared between callers; treat it
+    as read-only.
+    """
+    return content.split('\n')
@@ -0,0 +1,23 @@
+"""
+Shared snake_case name validation for IO.004 (variables) and IO.005 (outputs).
+"""
+
+_LOWERCASE_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyz")
+_SNAKE_CASE_CHARS = _LOWERCASE_LETTERS | frozenset("0123456789_")
+
+
+def is_snake_case_name(name: str) -> bool:
+    """
+    Return True when *name* is lowercase snake_case.
+
+    The name must start with a letter, contain only ``[a-z0-9_]``, not end
+    with a digit and not contain consecutive underscores. Names are short,
+    so set membership is cheaper here than a regex match.
+    """
+    if not name or name[0] not in _LOWERCASE_LETTERS:
+        return False
+    if not _SNAKE_CASE_CHARS.issuperset(name):
+        return False
+    if name[-1].isdigit():
+        return False
+    return "__" not in name
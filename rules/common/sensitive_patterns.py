@@ -4,8 +4,11 @@ Shared sensitive-name patterns and placeholder helpers for SC.005 / SC.006 / SC.
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Pattern, Tuple
+
+from .comments import strip_comments
 
 
 NON_SENSITIVE_ALLOWLIST = frozenset({
@@ -86,6 +89,34 @@ def split_segments(var_name: str) -> List[str]:
     return [segment for segment in var_name.lower().split("_") if segment]
 
 
+@functools.lru_cache(maxsize=8)
+def _compile_sensitive_patterns(
+    exact: Tuple[str, ...],
+    segment: Tuple[str, ...],
+    contains: Tuple[str, ...],
+) -> Tuple[FrozenSet[str], Tuple[str, ...], Optional[Pattern[str]], Optional[Pattern[str]]]:
+    """
+    Build the matchers for a pattern set.
+
+    Returns the exact-name set, the segment patterns, a combined regex for
+    the contains patterns, and a combined regex for segment and contains
+    patterns. A segment or contains match implies the name contains one of
+    those patterns, so the last regex rejects most names before they are
+    split into segments.
+    """
+    def _alternation(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+        if not patterns:
+            return None
+        return re.compile("|".join(re.escape(pattern) for pattern in patterns))
+
+    return (
+        frozenset(exact),
+        segment,
+        _alternation(contains),
+        _alternation(segment + contains),
+    )
+
+
 def get_sensitive_match(
     var_name: str,
     patterns: Optional[Dict[str, List[str]]] = None,
@@ -99,46 +130,43 @@ def get_sensitive_match(
     if patterns is None:
         patterns = get_sensitive_variable_patterns()
 
+    exact_set, segment_patterns, contains_re, any_pattern_re = _compile_sensitive_patterns(
+        tuple(patterns["exact"]),
+        tuple(patterns["segment"]),
+        tuple(patterns["contains"]),
+    )
     var_name_lower = var_name.lower()
 
-    for exact_pattern in patterns["exact"]:
-        if var_name_lower == exact_pattern:
-            return exact_pattern, "exact"
+    if var_name_lower in exact_set:
+        return var_name_lower, "exact"
+
+    # Segment and contains matches both need a pattern somewhere in the name
+    if any_pattern_re is None or not any_pattern_re.search(var_name_lower):
+        return None
 
-    segments = split_segments(var_name_lower)
-    for segment_pattern in patterns["segment"]:
-        if segment_pattern in segments:
-            if var_name_lower in NON_SENSITIVE_ALLOWLIST:
-                continue
-            return segment_pattern, "segment"
+    if segment_patterns and var_name_lower not in NON_SENSITIVE_ALLOWLIST:
+        segments = split_segments(var_name_lower)
+        for segment_pattern in segment_patterns:
+            if segment_pattern in segments:
+                return segment_pattern, "segment"
 
-    for contains_pattern in patterns["contains"]:
-        if contains_pattern in var_name_lower:
-            return contains_pattern, "contains"
+    # One regex pass rejects most names; on a hit, report patterns in list order
+    if contains_re is not None and contains_re.search(var_name_lower):
+        for contains_pattern in patterns["contains"]:
+            if contains_pattern in var_name_lower:
+                return contains_pattern, "contains"
 
     return None
 
 
 def strip_line_comment(line: str) -> str:
     """Remove ``#`` comments outside of simple quoted segments (best-effort)."""
-    in_single = False
-    in_double = False
-    result = []
-    i = 0
-    while i < len(line):
-        ch = line[i]
-        if ch == '"' and not in_single and (i == 0 or line[i - 1] != "\\"):
-            in_double = not in_double
-            result.append(ch)
-        elif ch == "'" and not in_double and (i == 0 or line[i - 1] != "\\"):
-            in_single = not in_single
-            result.append(ch)
-        elif ch == "#" and not in_single and not in_double:
-            break
-        else:
-            result.append(ch)
-        i += 1
-    return "".join(result).strip()
+    # Most lines have no comment, or no quote that could hide one
+    if "#" not in line:
+        return line.strip()
+    if '"' not in line and "'" not in line:
+        return line.partition("#")[0].strip()
+    return strip_comments(line).strip()
 
 
 def is_placeholder_literal(value: str) -> bool:
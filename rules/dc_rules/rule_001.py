@@ -39,6 +39,11 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Tuple, Optional, Dict, Any
 
+# Heredoc opener at the end of a line (<<EOT, <<EOF, ...)
+_HEREDOC_START_RE = re.compile(r'<<([A-Z]+)\s*$')
+# From the first '#' on a line to its end, plus the whitespace before it
+_LINE_COMMENT_RE = re.compile(r'[^\S\n]*#[^\n]*')
+
 
 def check_dc001_comment_format(file_path: str, content: str, 
                               log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
@@ -169,12 +174,10 @@ def _check_heredoc_state(line: str, current_in_heredoc: bool, current_terminator
     Returns:
         Dict[str, Any]: Dictionary with 'in_heredoc' and 'terminator' keys
     """
-    line_stripped = line.strip()
-    
     # Check for heredoc start pattern (<<EOT, <<EOF, etc.)
     # This can appear at the end of a line like: locals = <<EOT
     if not current_in_heredoc:
-        heredoc_match = re.search(r'<<([A-Z]+)\s*$', line)
+        heredoc_match = _HEREDOC_START_RE.search(line) if '<<' in line else None
         if heredoc_match:
             return {
                 "in_heredoc": True,
@@ -183,7 +186,7 @@ def _check_heredoc_state(line: str, current_in_heredoc: bool, current_terminator
 
     # Check for heredoc end pattern
     # The terminator must be at the beginning of the line (after stripping)
-    elif current_terminator and line_stripped == current_terminator:
+    elif current_terminator and line.strip() == current_terminator:
         return {
             "in_heredoc": False,
             "terminator": None
@@ -238,19 +241,9 @@ def _remove_comments_for_parsing(content: str) -> str:
     Returns:
         str: Content with comments removed
     """
-    lines = content.split('\n')
-    cleaned_lines = []
-    
-    for line in lines:
-        # Find comment start position
-        comment_pos = line.find('#')
-        if comment_pos != -1:
-            # Keep everything before the comment
-            cleaned_lines.append(line[:comment_pos].rstrip())
-        else:
-            cleaned_lines.append(line)
-    
-    return '\n'.join(cleaned_lines)
+    if '#' not in content:
+        return content
+    return _LINE_COMMENT_RE.sub('', content)
 
 
 def _get_comment_statistics(content: str) -> Dict[str, Any]:
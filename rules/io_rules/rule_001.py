@@ -81,10 +81,14 @@ def check_io001_variable_file_location(file_path: str, content: str, log_error_f
         >>> check_io001_variable_file_location("main.tf", content, sample_log_func)
         IO.001 at main.tf: Variable 'example' should be defined in 'variables.tf'
     """
+    # Only variable blocks outside variables.tf are reported
+    if 'variable' not in content or file_path.endswith('variables.tf'):
+        return
+
     variables = _extract_variables_with_lines(content)
     
     # Check if non-variables.tf files contain variable definitions
-    if variables and not file_path.endswith('variables.tf'):
+    if variables:
         for variable in variables:
             log_error_func(
                 file_path,
@@ -94,44 +98,6 @@ def check_io001_variable_file_location(file_path: str, content: str, log_error_f
             )
 
 
-def _remove_comments_for_parsing(content: str) -> str:
-    """
-    Remove comments from content for parsing, but preserve line structure.
-
-    This helper function removes all comments from the Terraform content
-    while maintaining the line structure for accurate parsing.
-
-    Args:
-        content (str): The original file content
-
-    Returns:
-        str: Content with comments removed
-    """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
-
-
 def _extract_variables_with_lines(content: str) -> List[Tuple[str, int]]:
     """
     Extract variable names from the content with their line numbers.
@@ -35,6 +35,11 @@ import re
 import os
 from typing import Callable, List, Dict, Any, Optional
 
+from rules.common.blocks import OUTPUT_HEADER_RE, get_blocks
+from rules.common.comments import remove_comments_for_parsing
+
+_DESCRIPTION_ASSIGNMENT_RE = re.compile(r'description\s*=')
+
 
 def check_io002_output_file_location(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -81,6 +86,10 @@ def check_io002_output_file_location(file_path: str, content: str, log_error_fun
         >>> check_io002_output_file_location("main.tf", content, sample_log_func)
         IO.002 at main.tf: Output 'example' should be defined in 'outputs.tf'
     """
+    # Only output blocks outside outputs.tf are reported
+    if 'output' not in content or file_path.endswith('outputs.tf'):
+        return
+
     outputs = _extract_outputs(content)
     
     # Check if non-outputs.tf files contain output definitions
@@ -94,44 +103,6 @@ def check_io002_output_file_location(file_path: str, content: str, log_error_fun
             )
 
 
-def _remove_comments_for_parsing(content: str) -> str:
-    """
-    Remove comments from content for parsing, but preserve line structure.
-
-    This helper function removes all comments from the Terraform content
-    while maintaining the line structure for accurate parsing.
-
-    Args:
-        content (str): The original file content
-
-    Returns:
-        str: Content with comments removed
-    """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
-
-
 def _extract_outputs(content: str) -> List[Dict[str, Any]]:
     """
     Extract output definitions with their metadata from the content.
@@ -146,22 +117,13 @@ def _extract_outputs(content: str) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: List of output definitions with metadata including line numbers
     """
     outputs = []
-    clean_content = _remove_comments_for_parsing(content)
+    clean_content = remove_comments_for_parsing(content)
     original_lines = content.split('\n')
     
-    # Pattern to match output blocks - support quoted, single-quoted, and unquoted syntax
-    output_pattern = r'output\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}'
-    
-    # Find all output matches with their positions
-    for match in re.finditer(output_pattern, clean_content, re.DOTALL):
+    # Find all output blocks (quoted, single-quoted, or unquoted names) with their positions
+    for match, output_body, line_number in get_blocks(clean_content, OUTPUT_HEADER_RE):
         # Extract output name from quoted, single-quoted, or unquoted group
         output_name = match.group(1) if match.group(1) else (match.group(2) if match.group(2) else match.group(3))
-        output_body = match.group(4)
-        
-        # Find the line number where this output starts
-        # Count newlines before the match start to get line number
-        preceding_text = clean_content[:match.start()]
-        line_number = preceding_text.count('\n') + 1
         
         # Find the actual line number in original content by matching the output declaration
         actual_line_number = None
@@ -173,7 +135,7 @@ def _extract_outputs(content: str) -> List[Dict[str, Any]]:
         output_info = {
             'name': output_name,
             'line_number': actual_line_number or line_number,
-            'has_description': bool(re.search(r'description\s*=', output_body)),
+            'has_description': bool(_DESCRIPTION_ASSIGNMENT_RE.search(output_body)),
             'body': output_body.strip()
         }
         outputs.append(output_info)
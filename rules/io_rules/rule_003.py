@@ -55,6 +55,7 @@ import re
 import os
 from typing import Callable, List, Set, Optional, Tuple
 
+from rules.common.comments import remove_comments_for_parsing
 from rules.common.provider_variables import is_provider_related_variable
 
 _IO003_MSG = (
@@ -77,6 +78,10 @@ def check_io003_required_variables(file_path: str, content: str,
         content (str): The complete content of the Terraform file as a string.
         log_error_func (Callable): Callback ``(file_path, rule_id, message, line_number)``.
     """
+    # Nothing to check without variable blocks
+    if 'variable' not in content:
+        return
+
     file_dir = os.path.dirname(file_path)
     required_variables = _extract_required_variables_with_lines(content)
     
@@ -184,7 +189,7 @@ def _extract_declared_variables(content: str) -> Set[str]:
         Set[str]: Set of declared variable names
     """
     declared_vars = set()
-    clean_content = _remove_comments_for_parsing(content)
+    clean_content = remove_comments_for_parsing(content)
     
     # Pattern to match variable declarations in tfvars
     # Matches: variable_name = value
@@ -200,41 +205,6 @@ def _extract_declared_variables(content: str) -> Set[str]:
     return declared_vars
 
 
-def _remove_comments_for_parsing(content: str) -> str:
-    """
-    Remove comments from content for parsing, but preserve line structure.
-
-    Args:
-        content (str): The original file content
-
-    Returns:
-        str: Content with comments removed
-    """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
-
-
 def get_rule_description() -> dict:
     """
     Retrieve detailed information about the IO.003 rule.
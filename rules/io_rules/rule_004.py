@@ -30,6 +30,9 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Optional, Tuple
 
+from rules.common.comments import remove_comments_for_parsing
+from rules.common.naming import is_snake_case_name
+
 
 def check_io004_variable_naming(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -67,7 +70,11 @@ def check_io004_variable_naming(file_path: str, content: str, log_error_func: Ca
         >>> check_io004_variable_naming("variables.tf", content, mock_logger)
         IO.004 at line 1: Variable 'BadName' should use snake_case naming convention
     """
-    clean_content = _remove_comments_for_parsing(content)
+    # Nothing to check without variable blocks
+    if 'variable' not in content:
+        return
+
+    clean_content = remove_comments_for_parsing(content)
     
     # Extract variables with their line numbers
     variables_with_lines = _extract_variables_with_lines(clean_content)
@@ -85,41 +92,6 @@ def check_io004_variable_naming(file_path: str, content: str, log_error_func: Ca
             )
 
 
-def _remove_comments_for_parsing(content: str) -> str:
-    """
-    Remove comments from content for parsing, but preserve line structure.
-
-    Args:
-        content (str): The original file content
-
-    Returns:
-        str: Content with comments removed but line numbers preserved
-    """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
-
-
 def _extract_variables_with_lines(content: str) -> List[Tuple[str, int]]:
     """
     Extract variable names from the content with their line numbers.
@@ -158,22 +130,7 @@ def _is_valid_variable_name(name: str) -> bool:
     Returns:
         bool: True if the name is valid, False otherwise
     """
-    # Must not be empty
-    if not name:
-        return False
-
-    # Must be lowercase snake_case: start with a letter, only [a-z0-9_],
-    # must not end with a digit, and must not contain consecutive underscores.
-    if not re.match(r'^[a-z][a-z0-9_]*$', name):
-        return False
-
-    if name.endswith(tuple('0123456789')):
-        return False
-
-    if '__' in name:
-        return False
-
-    return True
+    return is_snake_case_name(name)
 
 
 def get_rule_description() -> dict:
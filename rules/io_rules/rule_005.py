@@ -29,6 +29,9 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Optional
 
+from rules.common.comments import remove_comments_for_parsing
+from rules.common.naming import is_snake_case_name
+
 
 def check_io005_output_naming(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -65,7 +68,11 @@ def check_io005_output_naming(file_path: str, content: str, log_error_func: Call
         >>> check_io005_output_naming("outputs.tf", content, mock_logger)
         IO.005 at line 1: Output 'BadName' should use snake_case naming convention
     """
-    clean_content = _remove_comments_for_parsing(content)
+    # Nothing to check without output blocks
+    if 'output' not in content:
+        return
+
+    clean_content = remove_comments_for_parsing(content)
     
     # Check output names with line numbers
     outputs_with_lines = _extract_outputs_with_lines(clean_content)
@@ -81,41 +88,6 @@ def check_io005_output_naming(file_path: str, content: str, log_error_func: Call
             )
 
 
-def _remove_comments_for_parsing(content: str) -> str:
-    """
-    Remove comments from content for parsing, but preserve line structure.
-
-    Args:
-        content (str): The original file content
-
-    Returns:
-        str: Content with comments removed
-    """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
-
-
 def _extract_outputs_with_lines(content: str) -> List[tuple]:
     """
     Extract output names from the content with their line numbers.
@@ -154,19 +126,7 @@ def _is_valid_name(name: str) -> bool:
     Returns:
         bool: True if the name is valid, False otherwise
     """
-    if not name:
-        return False
-
-    if not re.match(r'^[a-z][a-z0-9_]*$', name):
-        return False
-
-    if name.endswith(tuple('0123456789')):
-        return False
-
-    if '__' in name:
-        return False
-
-    return True
+    return is_snake_case_name(name)
 
 
 def get_rule_description() -> dict:
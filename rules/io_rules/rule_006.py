@@ -47,6 +47,13 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Dict, Any, Optional
 
+from rules.common.blocks import VARIABLE_HEADER_RE, get_blocks
+from rules.common.comments import remove_comments_for_parsing
+
+_DESCRIPTION_VALUE_RE = re.compile(r'description\s*=\s*"([^"]*)"')
+_TYPE_ASSIGNMENT_RE = re.compile(r'type\s*=')
+_DEFAULT_ASSIGNMENT_RE = re.compile(r'default\s*=')
+
 
 def check_io006_variable_description(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -94,6 +101,10 @@ def check_io006_variable_description(file_path: str, content: str, log_error_fun
         >>> check_io006_variable_description("variables.tf", content, mock_logger)
         IO.006: Variable 'example' is missing a description
     """
+    # Nothing to check without variable blocks
+    if 'variable' not in content:
+        return
+
     variables = _extract_variables(content)
     
     for variable in variables:
@@ -113,44 +124,6 @@ def check_io006_variable_description(file_path: str, content: str, log_error_fun
             )
 
 
-def _remove_comments_for_parsing(content: str) -> str:
-    """
-    Remove comments from content for parsing, but preserve line structure.
-
-    This helper function removes all comments from the Terraform content
-    while maintaining the line structure for accurate parsing.
-
-    Args:
-        content (str): The original file content
-
-    Returns:
-        str: Content with comments removed
-    """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
-
-
 def _extract_variables(content: str) -> List[Dict[str, Any]]:
     """
     Extract variable definitions with their metadata from the content.
@@ -165,23 +138,15 @@ def _extract_variables(content: str) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: List of variable definitions with metadata
     """
     variables = []
-    clean_content = _remove_comments_for_parsing(content)
+    clean_content = remove_comments_for_parsing(content)
 
-    # Pattern to match variable blocks - support quoted, single-quoted, and unquoted syntax
-    variable_pattern = r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}'
-    
-    # Find all variable matches with their positions
-    for match in re.finditer(variable_pattern, clean_content, re.DOTALL):
+    # Find all variable blocks (quoted, single-quoted, or unquoted names) with their positions
+    for match, variable_body, line_number in get_blocks(clean_content, VARIABLE_HEADER_RE):
         # Get variable name from quoted, single-quoted, or unquoted group
         variable_name = match.group(1) if match.group(1) else (match.group(2) if match.group(2) else match.group(3))
-        variable_body = match.group(4)
-        
-        # Find line number by counting newlines before match
-        preceding_text = clean_content[:match.start()]
-        line_number = preceding_text.count('\n') + 1
         
         # Check for description field
-        description_match = re.search(r'description\s*=\s*"([^"]*)"', variable_body)
+        description_match = _DESCRIPTION_VALUE_RE.search(variable_body)
         has_description = description_match is not None
         
         # Check if description is empty or whitespace only
@@ -194,8 +159,8 @@ def _extract_variables(content: str) -> List[Dict[str, Any]]:
             'name': variable_name,
             'has_description': has_description,
             'description_empty': description_empty,
-            'has_type': bool(re.search(r'type\s*=', variable_body)),
-            'has_default': bool(re.search(r'default\s*=', variable_body)),
+            'has_type': bool(_TYPE_ASSIGNMENT_RE.search(variable_body)),
+            'has_default': bool(_DEFAULT_ASSIGNMENT_RE.search(variable_body)),
             'body': variable_body.strip(),
             'line_number': line_number
         }
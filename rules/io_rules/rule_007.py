@@ -46,6 +46,13 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Dict, Any, Optional
 
+from rules.common.blocks import OUTPUT_HEADER_RE, get_blocks
+from rules.common.comments import remove_comments_for_parsing
+
+_DESCRIPTION_VALUE_RE = re.compile(r'description\s*=\s*"([^"]*)"')
+_VALUE_ASSIGNMENT_RE = re.compile(r'value\s*=')
+_SENSITIVE_ASSIGNMENT_RE = re.compile(r'sensitive\s*=')
+
 
 def check_io007_output_description(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -93,6 +100,10 @@ def check_io007_output_description(file_path: str, content: str, log_error_func:
         >>> check_io007_output_description("outputs.tf", content, sample_log_func)
         IO.007 at outputs.tf:None: Output 'example' must have a meaningful description
     """
+    # Nothing to check without output blocks
+    if 'output' not in content:
+        return
+
     outputs = _extract_outputs(content)
     
     for output in outputs:
@@ -112,44 +123,6 @@ def check_io007_output_description(file_path: str, content: str, log_error_func:
             )
 
 
-def _remove_comments_for_parsing(content: str) -> str:
-    """
-    Remove comments from content for parsing, but preserve line structure.
-
-    This helper function removes all comments from the Terraform content
-    while maintaining the line structure for accurate parsing.
-
-    Args:
-        content (str): The original file content
-
-    Returns:
-        str: Content with comments removed
-    """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
-
-
 def _extract_outputs(content: str) -> List[Dict[str, Any]]:
     """
     Extract output definitions with their metadata from the content.
@@ -164,23 +137,13 @@ def _extract_outputs(content: str) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: List of output definitions with metadata including line numbers
     """
     outputs = []
-    clean_content = _remove_comments_for_parsing(content)
+    clean_content = remove_comments_for_parsing(content)
     original_lines = content.split('\n')
 
-    # Pattern to match output blocks with their full content
-    # Updated to handle double quotes, single quotes, and unquoted names
-    output_pattern = r'output\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}'
-    
-    # Find all output matches with their positions
-    for match in re.finditer(output_pattern, clean_content, re.DOTALL):
+    # Find all output blocks (quoted, single-quoted, or unquoted names) with their positions
+    for match, output_body, line_number in get_blocks(clean_content, OUTPUT_HEADER_RE):
         # Extract output name from different quote patterns
         output_name = match.group(1) or match.group(2) or match.group(3)
-        output_body = match.group(4)
-        
-        # Find the line number where this output starts
-        # Count newlines before the match start to get line number
-        preceding_text = clean_content[:match.start()]
-        line_number = preceding_text.count('\n') + 1
         
         # Find the actual line number in original content by matching the output declaration
         actual_line_number = None
@@ -193,7 +156,7 @@ def _extract_outputs(content: str) -> List[Dict[str, Any]]:
                 break
         
         # Check for description field
-        description_match = re.search(r'description\s*=\s*"([^"]*)"', output_body)
+        description_match = _DESCRIPTION_VALUE_RE.search(output_body)
         has_description = description_match is not None
         
         # Check if description is empty or whitespace only
@@ -207,8 +170,8 @@ def _extract_outputs(content: str) -> List[Dict[str, Any]]:
             'line_number': actual_line_number or line_number,
             'has_description': has_description,
             'description_empty': description_empty,
-            'has_value': bool(re.search(r'value\s*=', output_body)),
-            'has_sensitive': bool(re.search(r'sensitive\s*=', output_body)),
+            'has_value': bool(_VALUE_ASSIGNMENT_RE.search(output_body)),
+            'has_sensitive': bool(_SENSITIVE_ASSIGNMENT_RE.search(output_body)),
             'body': output_body.strip()
         }
         outputs.append(output_info)
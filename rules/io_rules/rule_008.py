@@ -49,6 +49,14 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Dict, Any, Optional
 
+from rules.common.blocks import VARIABLE_HEADER_RE, get_blocks
+from rules.common.comments import remove_comments_for_parsing
+
+_TYPE_ASSIGNMENT_RE = re.compile(r'type\s*=')
+_TYPE_VALUE_RE = re.compile(r'type\s*=\s*([^\n]+)')
+_DESCRIPTION_ASSIGNMENT_RE = re.compile(r'description\s*=')
+_DEFAULT_ASSIGNMENT_RE = re.compile(r'default\s*=')
+
 
 def check_io008_variable_type(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -102,6 +110,10 @@ def check_io008_variable_type(file_path: str, content: str, log_error_func: Call
         >>> check_io008_variable_type("variables.tf", content, mock_logger)
         IO.008: Variable 'example' must include a type declaration
     """
+    # Nothing to check without variable blocks
+    if 'variable' not in content:
+        return
+
     variables = _extract_variables(content)
     
     for variable in variables:
@@ -114,44 +126,6 @@ def check_io008_variable_type(file_path: str, content: str, log_error_func: Call
             )
 
 
-def _remove_comments_for_parsing(content: str) -> str:
-    """
-    Remove comments from content for parsing, but preserve line structure.
-
-    This helper function removes all comments from the Terraform content
-    while maintaining the line structure for accurate parsing.
-
-    Args:
-        content (str): The original file content
-
-    Returns:
-        str: Content with comments removed
-    """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
-
-
 def _extract_variables(content: str) -> List[Dict[str, Any]]:
     """
     Extract variable definitions with their metadata from the content.
@@ -166,34 +140,26 @@ def _extract_variables(content: str) -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: List of variable definitions with metadata
     """
     variables = []
-    clean_content = _remove_comments_for_parsing(content)
+    clean_content = remove_comments_for_parsing(content)
 
-    # Pattern to match variable blocks - support quoted, single-quoted, and unquoted syntax
-    variable_pattern = r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}'
-    
-    # Find all variable matches with their positions
-    for match in re.finditer(variable_pattern, clean_content, re.DOTALL):
+    # Find all variable blocks (quoted, single-quoted, or unquoted names) with their positions
+    for match, variable_body, line_number in get_blocks(clean_content, VARIABLE_HEADER_RE):
         # Get variable name from quoted, single-quoted, or unquoted group
         variable_name = match.group(1) if match.group(1) else (match.group(2) if match.group(2) else match.group(3))
-        variable_body = match.group(4)
-        
-        # Find line number by counting newlines before match
-        preceding_text = clean_content[:match.start()]
-        line_number = preceding_text.count('\n') + 1
         
         # Check for type field
-        has_type = bool(re.search(r'type\s*=', variable_body))
+        has_type = bool(_TYPE_ASSIGNMENT_RE.search(variable_body))
         
         # Extract type if present
-        type_match = re.search(r'type\s*=\s*([^\n]+)', variable_body)
+        type_match = _TYPE_VALUE_RE.search(variable_body)
         type_value = type_match.group(1).strip() if type_match else ""
         
         variable_info = {
             'name': variable_name,
             'has_type': has_type,
             'type': type_value,
-            'has_description': bool(re.search(r'description\s*=', variable_body)),
-            'has_default': bool(re.search(r'default\s*=', variable_body)),
+            'has_description': bool(_DESCRIPTION_ASSIGNMENT_RE.search(variable_body)),
+            'has_default': bool(_DEFAULT_ASSIGNMENT_RE.search(variable_body)),
             'body': variable_body.strip(),
             'line_number': line_number
         }
@@ -16,6 +16,7 @@ Author: Lance
 License: Apache 2.0
 """
 
+import functools
 import re
 import os
 import glob
@@ -23,6 +24,13 @@ from typing import Callable, List, Set, Optional, Tuple
 
 from rules.common.provider_variables import is_provider_related_variable
 
+_VAR_REFERENCE_RE = re.compile(r'var\.([a-zA-Z_][a-zA-Z0-9_]*)')
+# A quoted string (kept; a quote after a backslash does not close it) or a
+# ``#`` / ``//`` comment running to the end of the line (dropped)
+_COMMENT_STRIP_RE = re.compile(
+    r'("(?:[^"\n]|(?<=\\)")*"?|\'(?:[^\'\n]|(?<=\\)\')*\'?)|(?:#|//)[^\n]*'
+)
+
 
 def check_io009_unused_variables(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -97,8 +105,7 @@ def _check_undeclared_variable_references(
         except OSError:
             continue
 
-        clean_content = _remove_comments_for_parsing(tf_content)
-        for var_name, line_number in _extract_variable_references_with_lines(clean_content):
+        for var_name, line_number in _get_variable_references(tf_content):
             if var_name in defined_names or var_name in reported:
                 continue
 
@@ -159,25 +166,33 @@ def _get_used_variables_in_directory(
         except OSError:
             continue
 
-        clean_content = _remove_comments_for_parsing(tf_content)
-        used_variables.update(_extract_variable_usage(clean_content))
+        used_variables.update(var_name for var_name, _ in _get_variable_references(tf_content))
 
     return used_variables
 
 
-def _extract_variable_usage(content: str) -> Set[str]:
-    """Extract unique variable names referenced as var.<name>."""
-    return {var_name for var_name, _ in _extract_variable_references_with_lines(content)}
+@functools.lru_cache(maxsize=32)
+def _get_variable_references(tf_content: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Return the var.<name> references in raw file content, comments removed.
+
+    Both directory scans read every sibling .tf file, so each file is
+    cleaned and scanned once per check instead of twice.
+    """
+    return tuple(_extract_variable_references_with_lines(_remove_comments_for_parsing(tf_content)))
 
 
 def _extract_variable_references_with_lines(content: str) -> List[Tuple[str, int]]:
     """Extract variable references with their line numbers."""
     references: List[Tuple[str, int]] = []
-    var_pattern = r'var\.([a-zA-Z_][a-zA-Z0-9_]*)'
+    line_number = 1
+    counted_to = 0  # content[:counted_to] holds line_number - 1 newlines
 
-    for line_number, line in enumerate(content.split('\n'), 1):
-        for match in re.finditer(var_pattern, line):
-            references.append((match.group(1), line_number))
+    # One scan over the whole content; references never span lines
+    for match in _VAR_REFERENCE_RE.finditer(content):
+        line_number += content.count('\n', counted_to, match.start())
+        counted_to = match.start()
+        references.append((match.group(1), line_number))
 
     return references
 
@@ -194,38 +209,9 @@ def _should_exclude_from_unused_check(var_name: str) -> bool:
 
 def _remove_comments_for_parsing(content: str) -> str:
     """Remove comments from Terraform content for cleaner parsing."""
-    lines = content.split('\n')
-    clean_lines = []
-
-    for line in lines:
-        in_string = False
-        quote_char = None
-        clean_line = ""
-        index = 0
-
-        while index < len(line):
-            char = line[index]
-
-            if not in_string:
-                if char in ['"', "'"]:
-                    in_string = True
-                    quote_char = char
-                    clean_line += char
-                elif char == '#' or (char == '/' and index + 1 < len(line) and line[index + 1] == '/'):
-                    break
-                else:
-                    clean_line += char
-            else:
-                clean_line += char
-                if char == quote_char and (index == 0 or line[index - 1] != '\\'):
-                    in_string = False
-                    quote_char = None
-
-            index += 1
-
-        clean_lines.append(clean_line)
-
-    return '\n'.join(clean_lines)
+    if '#' not in content and '//' not in content:
+        return content
+    return _COMMENT_STRIP_RE.sub(r'\1', content)
 
 
 def get_rule_description() -> dict:
@@ -21,6 +21,12 @@ from typing import Callable, List, Dict, Any, Optional, Tuple
 
 _MIN_ERROR_MESSAGE_LENGTH = 10
 
+# A quoted string (kept; quotes after a backslash neither open nor close it)
+# or a ``#`` comment with the whitespace before it (dropped)
+_COMMENT_STRIP_RE = re.compile(
+    r'((?<!\\)"(?:[^"\n]|(?<=\\)")*"?|(?<!\\)\'(?:[^\'\n]|(?<=\\)\')*\'?)|[^\S\n]*#[^\n]*'
+)
+
 
 def check_io010_variable_validation(
     file_path: str,
@@ -198,32 +204,9 @@ def _extract_error_message_value(clean_body: str) -> Optional[str]:
 
 def _remove_comments_for_parsing(content: str) -> str:
     """Remove comments while preserving line structure."""
-    cleaned_lines: List[str] = []
-
-    for line in content.split("\n"):
-        if "#" not in line:
-            cleaned_lines.append(line)
-            continue
-
-        in_quotes = False
-        quote_char: Optional[str] = None
-        cut_at: Optional[int] = None
-
-        for idx, char in enumerate(line):
-            if char in ['"', "'"] and (idx == 0 or line[idx - 1] != "\\"):
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char:
-                    in_quotes = False
-                    quote_char = None
-            elif char == "#" and not in_quotes:
-                cut_at = idx
-                break
-
-        cleaned_lines.append(line if cut_at is None else line[:cut_at].rstrip())
-
-    return "\n".join(cleaned_lines)
+    if "#" not in content:
+        return content
+    return _COMMENT_STRIP_RE.sub(r"\1", content)
 
 
 def get_rule_description() -> Dict[str, Any]:
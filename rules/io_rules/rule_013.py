@@ -33,11 +33,12 @@ def check_io013_provider_file_location(
     """
     Validate that provider configuration blocks are defined in providers.tf.
     """
-    providers = _extract_providers_with_lines(content)
-    if not providers:
+    # Only provider blocks outside providers.tf are reported
+    if 'provider' not in content or os.path.basename(file_path) == "providers.tf":
         return
 
-    if os.path.basename(file_path) == "providers.tf":
+    providers = _extract_providers_with_lines(content)
+    if not providers:
         return
 
     for provider_type, line_number, alias in providers:
@@ -226,14 +226,25 @@ class RulesManager:
         # Create a wrapper log function that checks comment control and counts
         # only violations that are actually reported (not suppressed by Disable).
         violations_count = 0
+        # Directives per reported rule ID, filtered on first use; most rules have
+        # none, so their errors skip the per-line state lookup entirely
+        rule_control_states: Dict[str, Dict[int, RuleControlState]] = {}
 
         def controlled_log_func(path: str, rule: str, message: str, line_number: Optional[int] = None):
             nonlocal violations_count
             # When line_number is None, fall back to continuum state at line 1 so
             # file-level "# RULE Disable" directives still apply.
             if control_states:
+                states = rule_control_states.get(rule)
+                if states is None:
+                    states = {
+                        control_line: state
+                        for control_line, state in control_states.items()
+                        if state.rule_id == rule
+                    }
+                    rule_control_states[rule] = states
                 effective_line = line_number if line_number is not None else 1
-                if not self._comment_controller.get_rule_state_at_line(rule, effective_line, control_states):
+                if states and not self._comment_controller.get_rule_state_at_line(rule, effective_line, states):
                     return  # Skip logging if rule is disabled at this line
 
             violations_count += 1
@@ -17,13 +17,23 @@ License: Apache 2.0
 
 import re
 import os
-from typing import Callable, Dict, Optional, List, Tuple, Set
+from typing import Callable, Dict, Optional, List, Pattern, Tuple, Set
 
 
 _DATA_ATTR_RE = re.compile(r'data\.\w+\.\w+\.\w+')
 _FOR_EXPR_RE = re.compile(r'\[for\b|\bfor\s+\w+\s+in\b')
 _COLLECTION_TYPE_RE = re.compile(r'type\s*=\s*(?:list|set|tuple)\s*\(')
 _SAFE_WRAP_FUNCS = ('try', 'element', 'one', 'can')
+_SAFE_WRAP_CALL_RES = tuple(re.compile(rf'{func_name}\s*\(') for func_name in _SAFE_WRAP_FUNCS)
+_VARIABLE_HEADER_RE = re.compile(
+    r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{'
+)
+_LOCALS_START_RE = re.compile(r'locals\s*\{')
+_LOCAL_ASSIGNMENT_RE = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*(.*)$')
+_DATA_INDEX_ACCESS_RE = re.compile(r'data\.[\w_]+\.[\w_]+\.[\w_]+\[\d+\](?:\.[\w_]+)*')
+_VAR_INDEX_ACCESS_RE = re.compile(r'var\.([\w_]+)\[\d+\](?:\.[\w_]+)*')
+_LOCAL_INDEX_ACCESS_RE = re.compile(r'local\.([\w_]+)\[\d+\](?:\.[\w_]+)*')
+_LENGTH_GUARD_RE = re.compile(r'length\s*\(.+\)\s*>\s*0\s*\?')
 
 
 def check_sc001_array_index_safety(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
@@ -79,13 +89,10 @@ def _extract_list_variables(content: str) -> Set[str]:
     list_variables: Set[str] = set()
     in_variable_block = False
     current_variable: Optional[str] = None
-    var_header = re.compile(
-        r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{'
-    )
 
     for line in content.split('\n'):
         stripped = line.strip()
-        variable_match = var_header.match(stripped)
+        variable_match = _VARIABLE_HEADER_RE.match(stripped)
         if variable_match:
             current_variable = (
                 variable_match.group(1)
@@ -131,7 +138,7 @@ def _extract_risky_locals(content: str) -> Set[str]:
     i = 0
 
     while i < len(lines):
-        if re.match(r'locals\s*\{', lines[i].strip()):
+        if _LOCALS_START_RE.match(lines[i].strip()):
             brace_depth = lines[i].count('{') - lines[i].count('}')
             i += 1
             assignments: Dict[str, List[str]] = {}
@@ -142,10 +149,7 @@ def _extract_risky_locals(content: str) -> Set[str]:
                 stripped = line.strip()
                 brace_depth += line.count('{') - line.count('}')
 
-                assign_match = re.match(
-                    r'([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*(.*)$',
-                    stripped,
-                )
+                assign_match = _LOCAL_ASSIGNMENT_RE.match(stripped)
                 if assign_match and brace_depth >= 1:
                     current_name = assign_match.group(1)
                     assignments[current_name] = [assign_match.group(2)]
@@ -176,9 +180,7 @@ def _is_risky_local_rhs(rhs: str) -> bool:
 def _find_data_source_index_access(line: str) -> List[Tuple[str, int, str, str]]:
     """Find data source array index access patterns."""
     patterns = []
-    data_pattern = r'data\.[\w_]+\.[\w_]+\.[\w_]+\[\d+\](?:\.[\w_]+)*'
-
-    for match in re.finditer(data_pattern, line):
+    for match in _DATA_INDEX_ACCESS_RE.finditer(line):
         pattern = match.group(0)
         suggestion = f'try({pattern}, "default_value")'
         patterns.append((pattern, match.start(), suggestion, "data source list attribute"))
@@ -188,9 +190,7 @@ def _find_data_source_index_access(line: str) -> List[Tuple[str, int, str, str]]
 def _find_variable_index_access(line: str, list_variables: Set[str]) -> List[Tuple[str, int, str, str]]:
     """Find collection-typed input variable index access patterns."""
     patterns = []
-    var_pattern = r'var\.([\w_]+)\[\d+\](?:\.[\w_]+)*'
-
-    for match in re.finditer(var_pattern, line):
+    for match in _VAR_INDEX_ACCESS_RE.finditer(line):
         variable_name = match.group(1)
         if variable_name not in list_variables:
             continue
@@ -203,9 +203,7 @@ def _find_variable_index_access(line: str, list_variables: Set[str]) -> List[Tup
 def _find_local_index_access(line: str, risky_locals: Set[str]) -> List[Tuple[str, int, str, str]]:
     """Find index access on locals attributed as for-results or data aliases."""
     patterns = []
-    local_pattern = r'local\.([\w_]+)\[\d+\](?:\.[\w_]+)*'
-
-    for match in re.finditer(local_pattern, line):
+    for match in _LOCAL_INDEX_ACCESS_RE.finditer(line):
         local_name = match.group(1)
         if local_name not in risky_locals:
             continue
@@ -218,19 +216,18 @@ def _find_local_index_access(line: str, risky_locals: Set[str]) -> List[Tuple[st
 
 def _is_safely_wrapped(line: str, index_pos: int) -> bool:
     """True if index access sits inside try/element/one/can or a length ternary guard."""
-    if _is_wrapped_in_functions(line, index_pos, _SAFE_WRAP_FUNCS):
+    if _is_wrapped_in_functions(line, index_pos, _SAFE_WRAP_CALL_RES):
         return True
     if _is_length_guarded(line, index_pos):
         return True
     return False
 
 
-def _is_wrapped_in_functions(line: str, index_pos: int, func_names: Tuple[str, ...]) -> bool:
+def _is_wrapped_in_functions(line: str, index_pos: int, call_patterns: Tuple[Pattern[str], ...]) -> bool:
     """Check whether index_pos is inside one of the given call parentheses."""
     line_before = line[:index_pos]
-    for func_name in func_names:
-        pattern = rf'{func_name}\s*\('
-        for match in re.finditer(pattern, line_before):
+    for call_pattern in call_patterns:
+        for match in call_pattern.finditer(line_before):
             paren_start = match.end() - 1
             paren_count = 1
             pos = paren_start + 1
@@ -248,7 +245,7 @@ def _is_wrapped_in_functions(line: str, index_pos: int, func_names: Tuple[str, .
 def _is_length_guarded(line: str, index_pos: int) -> bool:
     """Heuristic: same-line `length(...) > 0 ? ...[N] : ...`."""
     before = line[:index_pos]
-    return bool(re.search(r'length\s*\(.+\)\s*>\s*0\s*\?', before))
+    return bool(_LENGTH_GUARD_RE.search(before))
 
 
 def get_rule_description() -> dict:
@@ -40,6 +40,17 @@ import re
 from typing import Callable, Optional
 
 
+_REQUIRED_VERSION_RE = re.compile(r'required_version\s*=\s*["\']([^"\']+)["\']')
+# Basic validation for common version constraint patterns
+_VALID_CONSTRAINT_RES = tuple(re.compile(pattern) for pattern in (
+    r'^\s*>=?\s*\d+\.\d+(?:\.\d+)?\s*$',  # >= 1.3.0, > 1.3.0
+    r'^\s*<=?\s*\d+\.\d+(?:\.\d+)?\s*$',  # <= 1.3.0, < 1.3.0
+    r'^\s*~\s*>\s*\d+\.\d+\s*$',          # ~> 1.0
+    r'^\s*=\s*\d+\.\d+(?:\.\d+)?\s*$',    # = 1.3.0
+    r'^\s*>=?\s*\d+\.\d+(?:\.\d+)?\s*,\s*<=?\s*\d+\.\d+(?:\.\d+)?\s*$',  # >= 0.14.0, < 2.0.0
+))
+
+
 def check_sc002_terraform_version_declaration(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
     Check if providers.tf files contain proper Terraform required version declarations.
@@ -122,7 +133,7 @@ def check_sc002_terraform_version_declaration(file_path: str, content: str, log_
             if 'required_version' in line and '=' in line:
                 required_version_found = True
                 # Validate version constraint format
-                version_match = re.search(r'required_version\s*=\s*["\']([^"\']+)["\']', line)
+                version_match = _REQUIRED_VERSION_RE.search(line)
                 if version_match:
                     version_constraint = version_match.group(1)
                     if not _is_valid_version_constraint(version_constraint):
@@ -165,17 +176,8 @@ def _is_valid_version_constraint(constraint: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    # Basic validation for common version constraint patterns
-    valid_patterns = [
-        r'^\s*>=?\s*\d+\.\d+(?:\.\d+)?\s*$',  # >= 1.3.0, > 1.3.0
-        r'^\s*<=?\s*\d+\.\d+(?:\.\d+)?\s*$',  # <= 1.3.0, < 1.3.0
-        r'^\s*~\s*>\s*\d+\.\d+\s*$',          # ~> 1.0
-        r'^\s*=\s*\d+\.\d+(?:\.\d+)?\s*$',    # = 1.3.0
-        r'^\s*>=?\s*\d+\.\d+(?:\.\d+)?\s*,\s*<=?\s*\d+\.\d+(?:\.\d+)?\s*$',  # >= 0.14.0, < 2.0.0
-    ]
-    
     constraint = constraint.strip()
-    return any(re.match(pattern, constraint) for pattern in valid_patterns)
+    return any(pattern.match(constraint) for pattern in _VALID_CONSTRAINT_RES)
 
 
 def get_rule_description() -> dict:
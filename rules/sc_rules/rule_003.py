@@ -50,6 +50,11 @@ from typing import Callable, Optional, List, Dict, Set, Tuple
 # Per-process cache: abspath(directory) -> (min_version, features)
 _DIRECTORY_VERSION_CACHE: Dict[str, Tuple[str, List[str]]] = {}
 
+_VARIABLE_NAME_RE = re.compile(r'variable\s+"([^"]+)"')
+_VAR_REFERENCE_RE = re.compile(r'var\.([a-zA-Z0-9_-]+)')
+_REQUIRED_VERSION_RE = re.compile(r'required_version\s*=\s*["\']([^"\']+)["\']')
+_VERSION_NUMBER_RE = re.compile(r'(\d+)\.(\d+)(?:\.(\d+))?')
+
 
 def clear_directory_version_cache() -> None:
     """Clear cached directory version analysis results (for tests)."""
@@ -218,7 +223,7 @@ def _analyze_file_for_version_requirements(content: str) -> Tuple[List[str], Lis
         
         # Check for variable block start
         if stripped_line.startswith('variable '):
-            match = re.search(r'variable\s+"([^"]+)"', stripped_line)
+            match = _VARIABLE_NAME_RE.search(stripped_line)
             if match:
                 current_variable_name = match.group(1)
                 in_variable_block = True
@@ -259,7 +264,7 @@ def _analyze_file_for_version_requirements(content: str) -> Tuple[List[str], Lis
             for i in range(line_num, min(line_num + 10, len(lines))):
                 if 'var.' in lines[i]:
                     # Check if this var. reference is to a different variable
-                    var_matches = re.findall(r'var\.([a-zA-Z0-9_-]+)', lines[i])
+                    var_matches = _VAR_REFERENCE_RE.findall(lines[i])
                     for var_name in var_matches:
                         if var_name != current_variable_name:
                             # Found reference to another variable
@@ -345,7 +350,7 @@ def _extract_declared_version(content: str) -> Tuple[Optional[str], Optional[int
         # If inside terraform block, look for required_version
         if in_terraform_block:
             if 'required_version' in stripped_line and '=' in stripped_line:
-                match = re.search(r'required_version\s*=\s*["\']([^"\']+)["\']', stripped_line)
+                match = _REQUIRED_VERSION_RE.search(stripped_line)
                 if match:
                     return match.group(1), line_num
             
@@ -439,7 +444,7 @@ def _parse_version(version_constraint: str) -> List[int]:
         List[int]: Version as list of integers [major, minor, patch]
     """
     # Extract version number from constraint
-    match = re.search(r'(\d+)\.(\d+)(?:\.(\d+))?', version_constraint)
+    match = _VERSION_NUMBER_RE.search(version_constraint)
     if match:
         major = int(match.group(1))
         minor = int(match.group(2))
@@ -36,6 +36,7 @@ License: Apache 2.0
 
 import re
 import os
+import functools
 import subprocess
 import tempfile
 import shutil
@@ -43,36 +44,68 @@ import json
 import urllib.request
 import urllib.error
 import time
+import threading
 from typing import Callable, Optional, List, Dict, Tuple, Set, Any
 
+# Per-process cache in front of the on-disk versions cache: (timestamp, versions)
+_VERSIONS_MEMORY_CACHE: Optional[Tuple[float, List[str]]] = None
+_VERSIONS_CACHE_TTL = 24 * 60 * 60  # 24 hours
+_rlock = threading.RLock()
 
-def _compare_versions(version1: str, version2: str) -> int:
+
+# Release versions are strictly MAJOR.MINOR.PATCH; comparisons accept any dotted numeric
+_RELEASE_VERSION_PATTERN = re.compile(r'\d+\.\d+\.\d+')
+_NUMERIC_VERSION_PATTERN = re.compile(r'\d+(?:\.\d+)*')
+
+# required_providers / legacy provider block parsing
+_TERRAFORM_BLOCK_PATTERN = re.compile(r'terraform\s*\{')
+_REQUIRED_PROVIDERS_PATTERN = re.compile(r'required_providers\s*\{')
+_PROVIDER_ENTRY_PATTERN = re.compile(r'(\w+)\s*=\s*\{')
+_LEGACY_PROVIDER_PATTERN = re.compile(r'provider\s+["\'](\w+)["\']\s*\{')
+_VERSION_CONSTRAINT_PATTERN = re.compile(r'version\s*=\s*["\']([^"\']+)["\']')
+# Version assignment split into (prefix, value, suffix) for rewriting
+_VERSION_ASSIGNMENT_PATTERN = re.compile(r'(version\s*=\s*["\'])([^"\']*)(["\'])')
+# Opening brace of a huaweicloud provider entry or provider block
+_HUAWEICLOUD_BLOCK_START_PATTERN = re.compile(r'huaweicloud[^\n{]*\{')
+
+# Supported constraint forms, each capturing the minimum version
+_MINIMUM_VERSION_PATTERNS = [
+    re.compile(r'^(\d+\.\d+\.\d+)$'),  # Exact version
+    re.compile(r'^>=\s*(\d+\.\d+\.\d+)$'),  # >= version
+    re.compile(r'^>\s*(\d+\.\d+\.\d+)$'),   # > version
+    re.compile(r'^~>\s*(\d+\.\d+\.\d+)$'),  # ~> version
+    re.compile(r'^(\d+\.\d+\.\d+)\s*-\s*\d+\.\d+\.\d+$'),  # Range (take first)
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _version_key(version: str) -> Optional[Tuple[int, ...]]:
     """
-    Compare two version strings.
+    Convert a dotted numeric version string into a comparable tuple.
     
     Args:
-        version1 (str): First version string
-        version2 (str): Second version string
+        version (str): Version string such as '1.77.0'
         
     Returns:
-        int: -1 if version1 < version2, 0 if equal, 1 if version1 > version2
+        Optional[Tuple[int, ...]]: Version tuple, or None if the string is not a dotted numeric version
+    """
+    if not isinstance(version, str) or not _NUMERIC_VERSION_PATTERN.fullmatch(version):
+        return None
+    return tuple(map(int, version.split('.')))
+
+
+def _compare_keys(key1: Tuple[int, ...], key2: Tuple[int, ...]) -> int:
     """
-    def version_tuple(v):
-        return tuple(map(int, v.split('.')))
+    Compare two precomputed version keys.
     
-    try:
-        v1_tuple = version_tuple(version1)
-        v2_tuple = version_tuple(version2)
+    Args:
+        key1 (Tuple[int, ...]): First version key
+        key2 (Tuple[int, ...]): Second version key
         
-        if v1_tuple < v2_tuple:
-            return -1
-        elif v1_tuple > v2_tuple:
-            return 1
-        else:
-            return 0
-    except (ValueError, AttributeError):
-        # If version parsing fails, treat as equal
-        return 0
+    Returns:
+        int: -1 if key1 < key2, 0 if equal, 1 if key1 > key2
+    """
+    return (key1 > key2) - (key1 < key2)
 
 
 def _is_valid_version(version_str: str) -> bool:
@@ -85,16 +118,7 @@ def _is_valid_version(version_str: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    try:
-        parts = version_str.split('.')
-        if len(parts) != 3:
-            return False
-        
-        for part in parts:
-            int(part)
-        return True
-    except (ValueError, AttributeError):
-        return False
+    return isinstance(version_str, str) and _RELEASE_VERSION_PATTERN.fullmatch(version_str) is not None
 
 
 def check_sc004_provider_version_validity(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
@@ -195,21 +219,24 @@ def _extract_provider_constraints(content: str) -> List[Tuple[str, str, int]]:
         List[Tuple[str, str, int]]: List of (provider_name, version_constraint, line_number) tuples
     """
     constraints = []
-    lines = content.split('\n')
     
     in_required_providers = False
     current_provider = None
     
-    for line_num, line in enumerate(lines, 1):
+    for line_num, line in enumerate(content.split('\n'), 1):
         stripped = line.strip()
         
+        # Skip blank and comment lines before any pattern matching
+        if not stripped or stripped[0] == '#':
+            continue
+        
         # Check for terraform block with required_providers
-        if re.match(r'terraform\s*\{', stripped):
+        if _TERRAFORM_BLOCK_PATTERN.match(stripped):
             in_required_providers = False
             continue
         
         # Check for required_providers block
-        if re.match(r'required_providers\s*\{', stripped):
+        if _REQUIRED_PROVIDERS_PATTERN.match(stripped):
             in_required_providers = True
             continue
         
@@ -226,13 +253,13 @@ def _extract_provider_constraints(content: str) -> List[Tuple[str, str, int]]:
         # Provider constraint within required_providers
         if in_required_providers:
             # Pattern: provider_name = { version = ">= 1.0.0" }
-            provider_match = re.match(r'(\w+)\s*=\s*\{', stripped)
+            provider_match = _PROVIDER_ENTRY_PATTERN.match(stripped)
             if provider_match:
                 current_provider = provider_match.group(1)
                 continue
             
             # Version constraint
-            version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', stripped)
+            version_match = _VERSION_CONSTRAINT_PATTERN.search(stripped)
             if version_match and current_provider:
                 version_constraint = version_match.group(1)
                 constraints.append((current_provider, version_constraint, line_num))
@@ -242,14 +269,14 @@ def _extract_provider_constraints(content: str) -> List[Tuple[str, str, int]]:
         
         # Provider constraint outside required_providers (legacy format)
         # Pattern: provider "provider_name" { version = ">= 1.0.0" }
-        legacy_match = re.match(r'provider\s+["\'](\w+)["\']\s*\{', stripped)
+        legacy_match = _LEGACY_PROVIDER_PATTERN.match(stripped)
         if legacy_match:
             current_provider = legacy_match.group(1)
             continue
         
         # Version constraint in legacy provider block
         if current_provider and 'version' in stripped:
-            version_match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', stripped)
+            version_match = _VERSION_CONSTRAINT_PATTERN.search(stripped)
             if version_match:
                 version_constraint = version_match.group(1)
                 constraints.append((current_provider, version_constraint, line_num))
@@ -276,16 +303,8 @@ def _extract_minimum_version(version_constraint: str) -> Optional[str]:
     constraint = version_constraint.strip()
     
     # Handle different constraint patterns
-    patterns = [
-        r'^(\d+\.\d+\.\d+)$',  # Exact version
-        r'^>=\s*(\d+\.\d+\.\d+)$',  # >= version
-        r'^>\s*(\d+\.\d+\.\d+)$',   # > version
-        r'^~>\s*(\d+\.\d+\.\d+)$',  # ~> version
-        r'^(\d+\.\d+\.\d+)\s*-\s*\d+\.\d+\.\d+$',  # Range (take first)
-    ]
-    
-    for pattern in patterns:
-        match = re.match(pattern, constraint)
+    for pattern in _MINIMUM_VERSION_PATTERNS:
+        match = pattern.match(constraint)
         if match:
             return match.group(1)
     
@@ -325,17 +344,21 @@ def _execute_terraform_command(args: List[str], working_dir: str) -> Dict[str, A
         # Add -no-color flag to avoid ANSI color codes in output
         cmd = ['terraform'] + args + ['-no-color']
         
+        # encoding= decodes in the pipe reader (text mode, Python 3.6 compatible);
+        # stdin is detached so a prompting terraform can never hang the probe
         result = subprocess.run(
             cmd,
             cwd=working_dir,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            encoding='utf-8',
+            close_fds=True,
             timeout=60  # 60 second timeout
         )
         
-        # Decode output for older Python versions
-        stdout = result.stdout.decode('utf-8') if result.stdout else ''
-        stderr = result.stderr.decode('utf-8') if result.stderr else ''
+        stdout = result.stdout or ''
+        stderr = result.stderr or ''
         
         return {
             'success': result.returncode == 0,
@@ -478,7 +501,7 @@ def _fetch_github_versions_with_auth() -> List[str]:
             break
     
     # Sort versions using semantic versioning
-    versions.sort(key=lambda x: tuple(map(int, x.split('.'))))
+    versions.sort(key=_version_key)
     return versions
 
 
@@ -530,22 +553,36 @@ def _get_cached_versions() -> Optional[List[str]]:
     """
     Get cached versions if available and not expired.
     
+    The in-memory cache is consulted first so that a single lint run reads
+    the on-disk cache file at most once.
+    
     Returns:
         Optional[List[str]]: Cached versions or None if not available/expired
     """
-    cache_file = os.path.join(tempfile.gettempdir(), 'hcbp_github_versions_cache.json')
+    global _VERSIONS_MEMORY_CACHE
     
-    try:
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
-            
-            # Check if cache is not expired (24 hours)
-            cache_time = cache_data.get('timestamp', 0)
-            if time.time() - cache_time < 24 * 60 * 60:  # 24 hours
-                return cache_data.get('versions', [])
-    except (json.JSONDecodeError, KeyError, OSError):
-        pass
+    with _rlock:
+        if _VERSIONS_MEMORY_CACHE is not None:
+            cache_time, versions = _VERSIONS_MEMORY_CACHE
+            if time.time() - cache_time < _VERSIONS_CACHE_TTL:
+                return versions
+            _VERSIONS_MEMORY_CACHE = None
+        
+        cache_file = os.path.join(tempfile.gettempdir(), 'hcbp_github_versions_cache.json')
+        
+        try:
+            if os.path.exists(cache_file):
+                with open(cache_file, 'r') as f:
+                    cache_data = json.load(f)
+                
+                # Check if cache is not expired (24 hours)
+                cache_time = cache_data.get('timestamp', 0)
+                if time.time() - cache_time < _VERSIONS_CACHE_TTL:
+                    versions = cache_data.get('versions', [])
+                    _VERSIONS_MEMORY_CACHE = (cache_time, versions)
+                    return versions
+        except (json.JSONDecodeError, KeyError, OSError):
+            pass
     
     return None
 
@@ -557,18 +594,24 @@ def _cache_versions(versions: List[str]) -> None:
     Args:
         versions (List[str]): Versions to cache
     """
+    global _VERSIONS_MEMORY_CACHE
+    
     cache_file = os.path.join(tempfile.gettempdir(), 'hcbp_github_versions_cache.json')
     
-    try:
-        cache_data = {
-            'timestamp': time.time(),
-            'versions': versions
-        }
+    with _rlock:
+        timestamp = time.time()
+        _VERSIONS_MEMORY_CACHE = (timestamp, versions)
         
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f)
-    except OSError:
-        pass  # Ignore cache write errors
+        try:
+            cache_data = {
+                'timestamp': timestamp,
+                'versions': versions
+            }
+            
+            with open(cache_file, 'w') as f:
+                json.dump(cache_data, f)
+        except OSError:
+            pass  # Ignore cache write errors
 
 
 def _get_fallback_versions() -> List[str]:
@@ -679,29 +722,34 @@ def _find_actual_minimum_version(terraform_dir: str, available_versions: List[st
     Returns:
         Optional[str]: Actual minimum required version or None if not found
     """
-    # Find versions less than current minimum version
-    lower_versions = [v for v in available_versions if _compare_versions(v, current_min_version) < 0]
+    current_key = _version_key(current_min_version)
+    if current_key is None:
+        return None
+    
+    # Pair each available version with its key once and keep them in ascending order
+    keyed_versions = sorted(
+        (key, v) for key, v in ((_version_key(v), v) for v in available_versions) if key is not None
+    )
+    
+    # Find versions less than current minimum version, newest first
+    lower_versions = [(key, v) for key, v in reversed(keyed_versions) if key < current_key]
     
     if not lower_versions:
         return None
     
-    # Sort versions in descending order (newest first)
-    lower_versions.sort(key=lambda x: _compare_versions(x, "0.0.0"), reverse=True)
-    
     # Test each version to find the highest one that still works
-    last_working_version = None
-    for version in lower_versions:
+    last_working_key = None
+    for key, version in lower_versions:
         result = _test_terraform_validate_with_version(terraform_dir, version)
         if result['success']:
-            last_working_version = version
+            last_working_key = key
         else:
             # This version fails, so the last working version + 1 is the minimum required
-            if last_working_version:
+            if last_working_key is not None:
                 # Find the next higher version after the last working version
-                higher_versions = [v for v in available_versions if _compare_versions(v, last_working_version) > 0]
-                if higher_versions:
-                    higher_versions.sort(key=lambda x: _compare_versions(x, "0.0.0"))
-                    return higher_versions[0]
+                for higher_key, higher_version in keyed_versions:
+                    if higher_key > last_working_key:
+                        return higher_version
             break
     
     # If all lower versions work, return the current minimum version
@@ -724,18 +772,83 @@ def _find_previous_available_version(current_version: str, available_versions: L
         "1.77.0"
     }
     
-    # Filter out problematic versions
-    valid_versions = [v for v in available_versions if v not in problematic_versions]
-    
-    # Find versions less than current version
-    previous_versions = [v for v in valid_versions if _compare_versions(v, current_version) < 0]
-    
-    if not previous_versions:
+    current_key = _version_key(current_version)
+    if current_key is None:
         return None
     
-    # Sort versions in ascending order and return the highest one
-    previous_versions.sort(key=lambda x: _compare_versions(x, "0.0.0"))
-    return previous_versions[-1]
+    # Track the highest valid version below the current one
+    previous_key = None
+    previous_version = None
+    for version in available_versions:
+        if version in problematic_versions:
+            continue
+        key = _version_key(version)
+        if key is None or key >= current_key:
+            continue
+        if previous_key is None or key > previous_key:
+            previous_key = key
+            previous_version = version
+    
+    return previous_version
+
+
+def _find_matching_brace(content: str, open_pos: int) -> int:
+    """
+    Find the brace closing the one at open_pos.
+
+    Args:
+        content (str): Text to scan
+        open_pos (int): Index of an opening brace
+
+    Returns:
+        int: Index of the matching closing brace, or len(content) if unclosed
+    """
+    depth = 1
+    pos = open_pos + 1
+    while True:
+        next_open = content.find('{', pos)
+        next_close = content.find('}', pos)
+        if next_close == -1:
+            return len(content)
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            pos = next_open + 1
+            continue
+        depth -= 1
+        if depth == 0:
+            return next_close
+        pos = next_close + 1
+
+
+def _pin_huaweicloud_version(content: str, provider_version: str) -> str:
+    """
+    Rewrite version constraints inside huaweicloud blocks to '= provider_version'.
+
+    Each huaweicloud block (required_providers entry or provider block) is
+    located by brace matching and substituted in one pass; text outside the
+    blocks is copied through unchanged.
+
+    Args:
+        content (str): Original providers.tf content
+        provider_version (str): Version to pin
+
+    Returns:
+        str: Content with the huaweicloud version pinned
+    """
+    replacement = rf'\g<1>= {provider_version}\g<3>'
+    parts = []
+    pos = 0
+    for block_match in _HUAWEICLOUD_BLOCK_START_PATTERN.finditer(content):
+        block_start = block_match.end() - 1
+        if block_start < pos:
+            # Nested inside a block that has already been rewritten
+            continue
+        block_end = _find_matching_brace(content, block_start)
+        parts.append(content[pos:block_start])
+        parts.append(_VERSION_ASSIGNMENT_PATTERN.sub(replacement, content[block_start:block_end]))
+        pos = block_end
+    parts.append(content[pos:])
+    return ''.join(parts)
 
 
 def _test_terraform_validate_with_version(terraform_dir: str, provider_version: str) -> Dict[str, Any]:
@@ -767,43 +880,8 @@ def _test_terraform_validate_with_version(terraform_dir: str, provider_version:
                 with open(original_providers_file, 'r', encoding='utf-8') as f:
                     original_content = f.read()
                 
-                # Find and replace the huaweicloud version in the required_providers block
-                # This regex searches for the version line within the huaweicloud block
-                # Pattern matches: huaweicloud = { ... version = "anything" ... }
-                # and replaces the version value
-                
-                # More robust pattern that finds huaweicloud block and its version
-                lines = original_content.split('\n')
-                modified_lines = []
-                in_huaweicloud_block = False
-                found_version = False
-                
-                for line in lines:
-                    if 'huaweicloud' in line and '{' in line:
-                        in_huaweicloud_block = True
-                        modified_lines.append(line)
-                    elif in_huaweicloud_block:
-                        if 'version' in line and 'huaweicloud' not in line:
-                            # Replace the version line
-                            # Keep the rest of the line (spaces, comment, etc.) but replace the version value
-                            version_match = re.search(r'(version\s*=\s*["\'])([^"\']*)(["\'])', line)
-                            if version_match:
-                                prefix = version_match.group(1)
-                                suffix = version_match.group(3)
-                                new_line = line.replace(version_match.group(2), f'= {provider_version}')
-                                modified_lines.append(new_line)
-                                found_version = True
-                            else:
-                                modified_lines.append(line)
-                        else:
-                            modified_lines.append(line)
-                            if '}' in line and not line.strip().startswith('#'):
-                                in_huaweicloud_block = False
-                                found_version = False
-                    else:
-                        modified_lines.append(line)
-                
-                modified_content = '\n'.join(modified_lines)
+                # Pin the huaweicloud version, keeping the rest of the file intact
+                modified_content = _pin_huaweicloud_version(original_content, provider_version)
                 
                 with open(providers_file, 'w', encoding='utf-8') as f:
                     f.write(modified_content)
@@ -845,12 +923,14 @@ def _test_terraform_validate_with_version(terraform_dir: str, provider_version:
         }
 
 
+@functools.lru_cache(maxsize=None)
 def get_rule_description() -> dict:
     """
     Get the rule description for SC.004.
     
     Returns:
-        dict: Rule description containing metadata and details
+        dict: Rule description containing metadata and details. The dict is
+              built once and shared between calls; treat it as read-only.
     """
     return {
         "rule_id": "SC.004",
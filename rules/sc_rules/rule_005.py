@@ -9,8 +9,9 @@ Author: Lance
 License: Apache 2.0
 """
 
+import functools
 import re
-from typing import Callable, Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any, Tuple
 
 from rules.common.sensitive_patterns import (
     NON_SENSITIVE_ALLOWLIST,
@@ -19,6 +20,19 @@ from rules.common.sensitive_patterns import (
 )
 
 
+# Variable header at the start of a line (after indentation), never spanning lines
+_VARIABLE_HEADER_RE = re.compile(
+    r'^[^\S\n]*variable[^\S\n]+(?:"([^"\n]+)"|\'([^\'\n]+)\'|'
+    r'([a-zA-Z][a-zA-Z0-9_]*[a-zA-Z]|[a-zA-Z]))[^\S\n]*\{',
+    re.MULTILINE,
+)
+# ``sensitive = true`` on some line, before any ``#`` comment on that line
+_SENSITIVE_TRUE_RE = re.compile(
+    r"^[^#\n]*?sensitive[^\S\n]*=[^\S\n]*true",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
 # Re-export for acceptances/unit tests
 _get_sensitive_variable_patterns = get_sensitive_variable_patterns
 _get_sensitive_match = get_sensitive_match
@@ -30,8 +44,10 @@ def check_sc005_sensitive_variable_declaration(
     log_error_func: Callable[[str, str, str, Optional[int]], None],
 ) -> None:
     """Check if sensitive variables are properly declared with sensitive = true."""
+    if "variable" not in content:
+        return
     sensitive_patterns = get_sensitive_variable_patterns()
-    variable_blocks = parse_variable_blocks(content)
+    variable_blocks = get_variable_blocks(content)
 
     for var_block in variable_blocks:
         var_name = var_block["name"]
@@ -54,64 +70,82 @@ def check_sc005_sensitive_variable_declaration(
 
 def _has_sensitive_declaration(var_content: str) -> bool:
     """Return True when the variable block sets sensitive = true."""
-    for line in var_content.split("\n"):
-        clean_line = re.sub(r"#.*$", "", line).strip()
-        if not clean_line:
-            continue
-        if re.search(r"sensitive\s*=\s*true", clean_line, re.IGNORECASE):
-            return True
-    return False
+    return _SENSITIVE_TRUE_RE.search(var_content) is not None
+
+
+def _find_closing_brace(content: str, pos: int, depth: int) -> int:
+    """Return the index of the brace that brings *depth* to zero, or -1."""
+    while depth > 0:
+        next_open = content.find("{", pos)
+        next_close = content.find("}", pos)
+        if next_close == -1:
+            return -1
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            pos = next_open + 1
+        else:
+            depth -= 1
+            pos = next_close + 1
+    return pos - 1
 
 
 def parse_variable_blocks(content: str) -> List[Dict[str, Any]]:
     """Parse variable blocks (quoted, single-quoted, or unquoted names)."""
     variable_blocks: List[Dict[str, Any]] = []
-    lines = content.split("\n")
-    i = 0
-    var_pattern = (
-        r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|'
-        r'([a-zA-Z][a-zA-Z0-9_]*[a-zA-Z]|[a-zA-Z]))\s*\{'
-    )
-
-    while i < len(lines):
-        line = lines[i]
-        var_match = re.match(var_pattern, line.strip())
-        if var_match:
-            var_name = var_match.group(1) or var_match.group(2) or var_match.group(3)
-            var_start_line = i + 1
-            brace_count = 1
-            var_content_lines = [line]
-            i += 1
-
-            while i < len(lines) and brace_count > 0:
-                line = lines[i]
-                var_content_lines.append(line)
-                for char in line:
-                    if char == "{":
-                        brace_count += 1
-                    elif char == "}":
-                        brace_count -= 1
-                        if brace_count == 0:
-                            break
-                i += 1
-
-            variable_blocks.append({
-                "name": var_name,
-                "line": var_start_line,
-                "content": "\n".join(var_content_lines),
-            })
-        else:
-            i += 1
+    pos = 0
+    line_number = 1
+    counted_to = 0  # content[:counted_to] holds line_number - 1 newlines
+
+    while True:
+        var_match = _VARIABLE_HEADER_RE.search(content, pos)
+        if not var_match:
+            break
+
+        header_start = var_match.start()
+        line_number += content.count("\n", counted_to, header_start)
+        counted_to = header_start
+        var_name = var_match.group(1) or var_match.group(2) or var_match.group(3)
+
+        # The body starts on the next line; braces on the header line are not counted
+        header_end = content.find("\n", var_match.end())
+        close_pos = -1 if header_end == -1 else _find_closing_brace(content, header_end + 1, 1)
+        block_end = len(content) if close_pos == -1 else content.find("\n", close_pos)
+        if block_end == -1:
+            block_end = len(content)
+
+        # Slice the block straight out of content instead of re-joining lines
+        variable_blocks.append({
+            "name": var_name,
+            "line": line_number,
+            "content": content[header_start:block_end],
+        })
+        # Resume on the line following the block's closing brace
+        pos = block_end + 1
+        if pos > len(content):
+            break
 
     return variable_blocks
 
 
+@functools.lru_cache(maxsize=8)
+def get_variable_blocks(content: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    Parse variable blocks once per file content.
+
+    SC.005 and SC.007 run back to back on the same content, so the second
+    rule reuses the first parse. The returned blocks are shared; treat them
+    as read-only and use parse_variable_blocks() for a private copy.
+    """
+    return tuple(parse_variable_blocks(content))
+
+
 # Backward-compatible alias
 _parse_variable_blocks = parse_variable_blocks
 
 
+@functools.lru_cache(maxsize=None)
 def get_rule_description() -> dict:
-    """Get the rule description for SC.005."""
+    """Get the rule description for SC.005 (built once; treat as read-only)."""
     patterns = get_sensitive_variable_patterns()
     return {
         "rule_id": "SC.005",
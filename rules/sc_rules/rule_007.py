@@ -16,7 +16,7 @@ from rules.common.sensitive_patterns import (
     get_sensitive_match,
     is_dangerous_string_default,
 )
-from rules.sc_rules.rule_005 import parse_variable_blocks
+from rules.sc_rules.rule_005 import get_variable_blocks
 
 
 def check_sc007_sensitive_variable_default(
@@ -25,7 +25,7 @@ def check_sc007_sensitive_variable_default(
     log_error_func: Callable[[str, str, str, Optional[int]], None],
 ) -> None:
     """Flag dangerous non-empty defaults on sensitive-named variables."""
-    for var_block in parse_variable_blocks(content):
+    for var_block in get_variable_blocks(content):
         var_name = var_block["name"]
         if get_sensitive_match(var_name) is None:
             continue
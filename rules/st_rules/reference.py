@@ -13,27 +13,11 @@ Author: Lance
 License: Apache 2.0
 """
 
-from typing import Dict, List, Callable, Any, Optional
+from typing import Dict, List, Callable, Any, Optional, Tuple
 import importlib
 import sys
 import os
 
-# Import individual rule modules
-from .rule_001 import check_st001_naming_convention, get_rule_description as get_st001_description
-from .rule_002 import check_st002_variable_defaults, get_rule_description as get_st002_description
-from .rule_003 import check_st003_parameter_alignment, get_rule_description as get_st003_description
-from .rule_004 import check_st004_indentation_character, get_rule_description as get_st004_description
-from .rule_005 import check_st005_indentation_level, get_rule_description as get_st005_description
-from .rule_006 import check_st006_resource_spacing, get_rule_description as get_st006_description
-from .rule_007 import check_st007_parameter_block_spacing, get_rule_description as get_st007_description
-from .rule_008 import check_st008_count_depends_on_spacing, get_rule_description as get_st008_description
-from .rule_009 import check_st009_variable_order, get_rule_description as get_st009_description
-from .rule_010 import check_st010_quote_usage, get_rule_description as get_st010_description
-from .rule_011 import check_st011_trailing_whitespace, get_rule_description as get_st011_description
-from .rule_012 import check_st012_file_whitespace, get_rule_description as get_st012_description
-from .rule_013 import check_st013_directory_naming, get_rule_description as get_st013_description
-from .rule_014 import check_st014_file_naming, get_rule_description as get_st014_description
-
 
 class STRules:
     """
@@ -47,96 +31,114 @@ class STRules:
     def __init__(self):
         """Initialize the ST rules coordinator."""
         self._rules_registry = self._build_rules_registry()
+        # Normalized rule info per rule ID, built from the description on first use
+        self._rule_info_cache: Dict[str, Dict[str, Any]] = {}
+        # (by_category, by_severity), built from the rule descriptions on first use
+        self._metadata_indexes: Optional[Tuple[Dict[str, List[str]], Dict[str, List[str]]]] = None
     
     def _build_rules_registry(self) -> Dict[str, Dict[str, Any]]:
         """
         Build the registry of available ST rules.
+
+        Each entry names its rule module and check function; the module is
+        imported by _resolve_rule the first time the rule is executed or
+        described, so listing rules or running a subset imports only what
+        is needed. A rule with ``requires`` can only report on content containing at
+        least one of those substrings; execute_rule skips it otherwise.
         
         Returns:
             Dict[str, Dict[str, Any]]: Registry mapping rule IDs to rule information
         """
         return {
             "ST.001": {
-                "check_function": check_st001_naming_convention,
-                "description_function": get_st001_description,
+                "module": ".rule_001",
+                "check_function_name": "check_st001_naming_convention",
                 "name": "Naming convention check",
-                "status": "modular"
+                "status": "modular",
+                "requires": ('resource', 'data')
             },
             "ST.002": {
-                "check_function": check_st002_variable_defaults,
-                "description_function": get_st002_description,
+                "module": ".rule_002",
+                "check_function_name": "check_st002_variable_defaults",
                 "name": "Variable default value check",
-                "status": "modular"
+                "status": "modular",
+                "requires": ('var.',)
             },
             "ST.003": {
-                "check_function": check_st003_parameter_alignment,
-                "description_function": get_st003_description,
+                "module": ".rule_003",
+                "check_function_name": "check_st003_parameter_alignment",
                 "name": "Parameter alignment check",
-                "status": "modular"
+                "status": "modular",
+                "requires": ('=',)
             },
             "ST.004": {
-                "check_function": check_st004_indentation_character,
-                "description_function": get_st004_description,
+                "module": ".rule_004",
+                "check_function_name": "check_st004_indentation_character",
                 "name": "Indentation character check",
-                "status": "modular"
+                "status": "modular",
+                "requires": ('\t',)
             },
             "ST.005": {
-                "check_function": check_st005_indentation_level,
-                "description_function": get_st005_description,
+                "module": ".rule_005",
+                "check_function_name": "check_st005_indentation_level",
                 "name": "Indentation level check",
                 "status": "modular"
             },
             "ST.006": {
-                "check_function": check_st006_resource_spacing,
-                "description_function": get_st006_description,
+                "module": ".rule_006",
+                "check_function_name": "check_st006_resource_spacing",
                 "name": "Resource and data source spacing check",
-                "status": "modular"
+                "status": "modular",
+                "requires": ('{',)
             },
             "ST.007": {
-                "check_function": check_st007_parameter_block_spacing,
-                "description_function": get_st007_description,
+                "module": ".rule_007",
+                "check_function_name": "check_st007_parameter_block_spacing",
                 "name": "Parameter block spacing check",
-                "status": "modular"
+                "status": "modular",
+                "requires": ('{',)
             },
             "ST.008": {
-                "check_function": check_st008_count_depends_on_spacing,
-                "description_function": get_st008_description,
+                "module": ".rule_008",
+                "check_function_name": "check_st008_count_depends_on_spacing",
                 "name": "Meta-parameter spacing check",
-                "status": "modular"
+                "status": "modular",
+                "requires": ('resource', 'data')
             },
             "ST.009": {
-                "check_function": check_st009_variable_order,
-                "description_function": get_st009_description,
+                "module": ".rule_009",
+                "check_function_name": "check_st009_variable_order",
                 "name": "Variable definition order check",
                 "status": "modular"
             },
             "ST.010": {
-                "check_function": check_st010_quote_usage,
-                "description_function": get_st010_description,
+                "module": ".rule_010",
+                "check_function_name": "check_st010_quote_usage",
                 "name": "Quote usage check",
-                "status": "modular"
+                "status": "modular",
+                "requires": ('{',)
             },
             "ST.011": {
-                "check_function": check_st011_trailing_whitespace,
-                "description_function": get_st011_description,
+                "module": ".rule_011",
+                "check_function_name": "check_st011_trailing_whitespace",
                 "name": "Trailing whitespace check",
                 "status": "modular"
             },
             "ST.012": {
-                "check_function": check_st012_file_whitespace,
-                "description_function": get_st012_description,
+                "module": ".rule_012",
+                "check_function_name": "check_st012_file_whitespace",
                 "name": "File header and footer whitespace check",
                 "status": "modular"
             },
             "ST.013": {
-                "check_function": check_st013_directory_naming,
-                "description_function": get_st013_description,
+                "module": ".rule_013",
+                "check_function_name": "check_st013_directory_naming",
                 "name": "Directory naming convention check",
                 "status": "modular"
             },
             "ST.014": {
-                "check_function": check_st014_file_naming,
-                "description_function": get_st014_description,
+                "module": ".rule_014",
+                "check_function_name": "check_st014_file_naming",
                 "name": "File naming convention check",
                 "status": "modular"
             }
@@ -159,12 +161,47 @@ class STRules:
             rule_id (str): The rule ID (e.g., 'ST.001')
             
         Returns:
-            Optional[Dict[str, Any]]: Rule information dictionary or None if not found
+            Optional[Dict[str, Any]]: Rule information dictionary or None if not found.
+            The dictionary is a fresh shallow copy; nested values are shared.
         """
         if rule_id not in self._rules_registry:
             return None
-            
-        rule_info = self._rules_registry[rule_id].copy()
+
+        cached_info = self._rule_info_cache.get(rule_id)
+        if cached_info is None:
+            cached_info = self._build_rule_info(rule_id)
+            self._rule_info_cache[rule_id] = cached_info
+        return dict(cached_info)
+
+    def _resolve_rule(self, rule_id: str) -> Dict[str, Any]:
+        """
+        Import a rule's module on first use and record its functions.
+
+        Args:
+            rule_id (str): A registered rule ID
+
+        Returns:
+            Dict[str, Any]: The registry entry with check_function and
+            description_function filled in
+        """
+        rule_entry = self._rules_registry[rule_id]
+        if "check_function" not in rule_entry:
+            rule_module = importlib.import_module(rule_entry["module"], __package__)
+            rule_entry["description_function"] = rule_module.get_rule_description
+            rule_entry["check_function"] = getattr(rule_module, rule_entry["check_function_name"])
+        return rule_entry
+
+    def _build_rule_info(self, rule_id: str) -> Dict[str, Any]:
+        """
+        Merge a rule's registry entry with its description.
+
+        Args:
+            rule_id (str): A registered rule ID
+
+        Returns:
+            Dict[str, Any]: Normalized rule information
+        """
+        rule_info = self._resolve_rule(rule_id).copy()
         registry_name = rule_info.get("name")
 
         # Get detailed description from the rule module
@@ -191,12 +228,17 @@ class STRules:
         Returns:
             bool: True if rule executed successfully, False otherwise
         """
-        if rule_id not in self._rules_registry:
+        rule_info = self._rules_registry.get(rule_id)
+        if rule_info is None:
             log_error_func(file_path, "SYSTEM", f"Unknown ST rule: {rule_id}", None)
             return False
-            
+
+        required_tokens = rule_info.get("requires")
+        if required_tokens and not any(token in content for token in required_tokens):
+            return True
+
         try:
-            check_function = self._rules_registry[rule_id]["check_function"]
+            check_function = self._resolve_rule(rule_id)["check_function"]
             check_function(file_path, content, log_error_func)
             return True
         except Exception as e:
@@ -237,14 +279,7 @@ class STRules:
         Returns:
             List[str]: List of rule IDs matching the category
         """
-        matching_rules = []
-        
-        for rule_id in self.get_available_rules():
-            rule_info = self.get_rule_info(rule_id)
-            if rule_info and rule_info.get('category') == category:
-                matching_rules.append(rule_id)
-                
-        return matching_rules
+        return list(self._get_metadata_indexes()[0].get(category, ()))
     
     def get_rules_by_severity(self, severity: str) -> List[str]:
         """
@@ -256,14 +291,30 @@ class STRules:
         Returns:
             List[str]: List of rule IDs matching the severity level
         """
-        matching_rules = []
-        
-        for rule_id in self.get_available_rules():
-            rule_info = self.get_rule_info(rule_id)
-            if rule_info and rule_info.get('severity') == severity:
-                matching_rules.append(rule_id)
-                
-        return matching_rules
+        return list(self._get_metadata_indexes()[1].get(severity, ()))
+
+    def _get_metadata_indexes(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Index rule IDs by category and by severity.
+
+        Each rule description is built once, the first time either index is
+        needed, instead of once per rule on every lookup.
+
+        Returns:
+            Tuple[Dict[str, List[str]], Dict[str, List[str]]]: Rule IDs keyed
+            by category and by severity, in registry order
+        """
+        if self._metadata_indexes is None:
+            by_category: Dict[str, List[str]] = {}
+            by_severity: Dict[str, List[str]] = {}
+            for rule_id in self.get_available_rules():
+                rule_info = self.get_rule_info(rule_id)
+                if not rule_info:
+                    continue
+                by_category.setdefault(rule_info.get('category'), []).append(rule_id)
+                by_severity.setdefault(rule_info.get('severity'), []).append(rule_id)
+            self._metadata_indexes = (by_category, by_severity)
+        return self._metadata_indexes
     
     def get_modular_rules(self) -> List[str]:
         """
@@ -297,19 +348,24 @@ class STRules:
             Dict[str, Any]: Summary information about all rules
         """
         all_rules = self.get_available_rules()
-        modular_rules = self.get_modular_rules()
-        legacy_rules = self.get_legacy_rules()
-        
-        # Group rules by severity
-        error_rules = self.get_rules_by_severity('error')
-        warning_rules = self.get_rules_by_severity('warning')
+        modular_rules = []
+        legacy_rules = []
+        for rule_id, rule_info in self._rules_registry.items():
+            status = rule_info.get('status')
+            if status == 'modular':
+                modular_rules.append(rule_id)
+            elif status == 'legacy':
+                legacy_rules.append(rule_id)
+
+        # Severity counts come from the shared metadata index
+        by_severity = self._get_metadata_indexes()[1]
         
         return {
             'total_rules': len(all_rules),
             'modular_rules': len(modular_rules),
             'legacy_rules': len(legacy_rules),
-            'error_rules': len(error_rules),
-            'warning_rules': len(warning_rules),
+            'error_rules': len(by_severity.get('error', ())),
+            'warning_rules': len(by_severity.get('warning', ())),
             'migration_progress': (len(modular_rules) / len(all_rules) * 100) if all_rules else 0,
             'rule_list': all_rules,
             'modular_rule_list': modular_rules,
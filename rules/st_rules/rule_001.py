@@ -34,7 +34,24 @@ License: Apache 2.0
 """
 
 import re
-from typing import Callable, List, Tuple, Optional
+from typing import Callable, Optional
+
+# A resource/data header at the start of a line, in any of the seven label
+# forms ST.001 accepts (both labels double-quoted, both single-quoted, or
+# either one bare). The instance name is the last group that matched, and
+# nothing in the pattern crosses a line break.
+_WS = r'[^\S\n]'
+_BARE_LABEL = r'[a-zA-Z_][a-zA-Z0-9_]*'
+_BLOCK_HEADER_RE = re.compile(
+    rf'^{_WS}*(resource|data){_WS}+(?:'
+    rf'"[^"\n]+"{_WS}+(?:"([^"\n]+)"|({_BARE_LABEL}))'
+    rf'|\'[^\'\n]+\'{_WS}+(?:\'([^\'\n]+)\'|({_BARE_LABEL}))'
+    rf'|{_BARE_LABEL}{_WS}+(?:"([^"\n]+)"|\'([^\'\n]+)\'|({_BARE_LABEL}))'
+    rf'){_WS}*\{{',
+    re.MULTILINE,
+)
+# Message label for each block keyword captured by _BLOCK_HEADER_RE
+_KIND_LABELS = {'resource': 'Resource', 'data': 'Data'}
 
 
 def check_st001_naming_convention(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
@@ -75,109 +92,27 @@ def check_st001_naming_convention(file_path: str, content: str, log_error_func:
         >>> check_st001_naming_convention("main.tf", content, sample_log_func)
         ST.001 at main.tf:1: Resource instance name 'main' should be 'test'. ...
     """
-    lines = content.split('\n')
-    
-    for line_num, line in enumerate(lines, 1):
-        line = line.strip()
-        
-        # Check resource and data source names with multiple patterns to handle quotes, single quotes, and no quotes
-        patterns = [
-            r'(resource|data)\s+"([^"]+)"\s+"([^"]+)"\s*\{',  # Both double quoted
-            r'(resource|data)\s+\'([^\']+)\'\s+\'([^\']+)\'\s*\{',  # Both single quoted
-            r'(resource|data)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+"([^"]+)"\s*\{',  # Type unquoted, name double quoted
-            r'(resource|data)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+\'([^\']+)\'\s*\{',  # Type unquoted, name single quoted
-            r'(resource|data)\s+"([^"]+)"\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\{',  # Type double quoted, name unquoted
-            r'(resource|data)\s+\'([^\']+)\'\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\{',  # Type single quoted, name unquoted
-            r'(resource|data)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\{',  # Both unquoted
-        ]
-        
-        for pattern in patterns:
-            resource_match = re.match(pattern, line)
-            if resource_match:
-                block_type = resource_match.group(1)
-                if len(resource_match.groups()) == 3:
-                    # Standard format or type unquoted
-                    name = resource_match.group(3)  # Name is always in group 3 for these patterns
-                
-                # Check if the instance name is "test" (ST.001 requirement)
-                if name != "test":
-                    error_msg = (
-                        f"{block_type.capitalize()} instance name '{name}' should be 'test'. "
-                        f"All resource and data source instances should use 'test' as the name "
-                        f"for consistency in example and test code."
-                    )
-                    log_error_func(file_path, "ST.001", error_msg, line_num)
-                break  # Found a match, no need to check other patterns
-
-
-def _remove_comments_for_parsing(content: str) -> str:
-    """
-    Remove comments from content for parsing, but preserve line structure.
-
-    This helper function removes all comments from the Terraform content
-    while maintaining the line structure for accurate parsing.
-
-    Args:
-        content (str): The original file content
-
-    Returns:
-        str: Content with comments removed
-    """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
-
-
-def _extract_data_sources(content: str) -> List[Tuple[str, str]]:
-    """
-    Extract data source definitions from content.
-
-    Args:
-        content (str): The cleaned Terraform content
-
-    Returns:
-        List[Tuple[str, str]]: List of (data_type, instance_name) tuples
-    """
-    # Match data "type" "name" { ... }
-    pattern = r'data\s+"([^"]+)"\s+"([^"]+)"\s*\{'
-    matches = re.findall(pattern, content, re.MULTILINE)
-    return matches
-
-
-def _extract_resources(content: str) -> List[Tuple[str, str]]:
-    """
-    Extract resource definitions from content.
-
-    Args:
-        content (str): The cleaned Terraform content
-
-    Returns:
-        List[Tuple[str, str]]: List of (resource_type, instance_name) tuples
-    """
-    # Match resource "type" "name" { ... }
-    pattern = r'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{'
-    matches = re.findall(pattern, content, re.MULTILINE)
-    return matches
+    # Nothing to check without resource or data blocks
+    if 'resource' not in content and 'data' not in content:
+        return
+
+    # One pass over the whole file; line numbers are counted between matches
+    line_num = 1
+    counted_to = 0
+    for resource_match in _BLOCK_HEADER_RE.finditer(content):
+        line_num += content.count('\n', counted_to, resource_match.start())
+        counted_to = resource_match.start()
+        kind_label = _KIND_LABELS[resource_match.group(1)]
+        name = resource_match.group(resource_match.lastindex)
+
+        # Check if the instance name is "test" (ST.001 requirement)
+        if name != "test":
+            error_msg = (
+                f"{kind_label} instance name '{name}' should be 'test'. "
+                f"All resource and data source instances should use 'test' as the name "
+                f"for consistency in example and test code."
+            )
+            log_error_func(file_path, "ST.001", error_msg, line_num)
 
 
 def get_rule_description() -> dict:
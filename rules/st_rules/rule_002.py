@@ -52,9 +52,39 @@ Author: Lance
 License: Apache 2.0
 """
 
+import functools
 import re
 import os
-from typing import Callable, Dict, Set, Optional, List
+from typing import Callable, Dict, Optional, List
+
+from rules.common.comments import remove_comments_for_parsing
+from rules.common.lines import get_content_lines
+
+# Start of a variable block: the name and the first following '{'.
+# re.ASCII makes the leading word boundary a cheap ASCII test; with
+# Unicode rules it dominates the cost of scanning a whole file.
+_VARIABLE_START_RE = re.compile(
+    r"\bvariable\s+(?:\"([^\"]+)\"|'([^']+)'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{",
+    re.MULTILINE | re.ASCII,
+)
+_DEFAULT_ASSIGNMENT_RE = re.compile(r"\bdefault\s*=", re.ASCII)
+_VAR_REFERENCE_RE = re.compile(r'var\.([a-zA-Z_][a-zA-Z0-9_]*)')
+# Start of a data source block at the start of a line (after indentation):
+# data "type" "name" { or data 'type' 'name' { or data type name {
+# Nothing in the pattern crosses a line break.
+_DATA_START_RE = re.compile(
+    r'^[^\S\n]*data[^\S\n]+(?:"[^"\n]+"|\'[^\'\n]+\'|[a-zA-Z_][a-zA-Z0-9_]*)'
+    r'[^\S\n]+(?:"[^"\n]+"|\'[^\'\n]+\'|[a-zA-Z_][a-zA-Z0-9_]*)[^\S\n]*\{',
+    re.MULTILINE,
+)
+# Tokens that matter when walking a block: quoted strings (skipped whole,
+# backslash escapes any character, may be unterminated) and braces
+_STRING_OR_BRACE_RE = re.compile(
+    r'"(?:\\.|[^"\\])*"?|\'(?:\\.|[^\'\\])*\'?|[{}]',
+    re.DOTALL,
+)
+# Tokens that matter when balancing a data block line by line
+_BRACE_OR_NEWLINE_RE = re.compile(r'[{}\n]')
 
 
 def check_st002_variable_defaults(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
@@ -101,8 +131,12 @@ def check_st002_variable_defaults(file_path: str, content: str, log_error_func:
         >>> check_st002_variable_defaults("main.tf", content, sample_log_func)
         ST.002 at main.tf:2: Variable 'memory_size' used in data source must have a default value
     """
-    clean_content = _remove_comments_for_parsing(content)
-    original_lines = content.split('\n')
+    # Only data sources referencing var.* can trigger ST.002
+    if 'data' not in content or 'var.' not in content:
+        return
+
+    clean_content = remove_comments_for_parsing(content)
+    original_lines = get_content_lines(content)
     
     # Extract variables used in data sources with line numbers
     data_source_variables = _extract_data_source_variables_with_lines(clean_content, original_lines)
@@ -111,20 +145,25 @@ def check_st002_variable_defaults(file_path: str, content: str, log_error_func:
         # No variables used in data sources, nothing to check
         return
     
-    # Get variable definitions from the same directory
-    file_dir = os.path.dirname(file_path)
-    variable_definitions = _get_variable_definitions_from_directory(file_dir)
+    # Get variable definitions from the same directory. When the file being
+    # checked is the directory's variables.tf, its own definitions are the
+    # directory's, so only the current content is parsed.
+    if os.path.basename(file_path) == 'variables.tf':
+        variable_definitions = {}
+    else:
+        file_dir = os.path.dirname(file_path)
+        variable_definitions = _get_variable_definitions_from_directory(file_dir)
     
-    # Also check current file for variable definitions
-    current_file_variables = _extract_variables(clean_content)
-    variable_definitions.update(current_file_variables)
+    # Also check current file for variable definitions, if it has any
+    if 'variable' in clean_content:
+        current_file_variables = _extract_variables(clean_content)
+        variable_definitions.update(current_file_variables)
     
     # Check if variables used in data sources have defaults
-    for var_name, line_numbers in data_source_variables.items():
+    for var_name, first_line in data_source_variables.items():
         if var_name in variable_definitions:
             if not variable_definitions[var_name]:
                 # Report error for the first occurrence line number
-                first_line = min(line_numbers) if line_numbers else None
                 log_error_func(
                     file_path,
                     "ST.002",
@@ -134,7 +173,6 @@ def check_st002_variable_defaults(file_path: str, content: str, log_error_func:
         else:
             # Variable used but not defined - this might be from modules or other sources
             # We'll report this as a potential issue with the first occurrence line number
-            first_line = min(line_numbers) if line_numbers else None
             log_error_func(
                 file_path,
                 "ST.002",
@@ -153,61 +191,43 @@ def _get_variable_definitions_from_directory(directory: str) -> Dict[str, bool]:
     Returns:
         Dict[str, bool]: Dictionary mapping variable names to whether they have defaults
     """
-    variables = {}
     variables_tf_path = os.path.join(directory, 'variables.tf')
-    
-    if os.path.exists(variables_tf_path):
-        try:
-            with open(variables_tf_path, 'r', encoding='utf-8') as f:
-                variables_content = f.read()
-            clean_content = _remove_comments_for_parsing(variables_content)
-            variables = _extract_variables(clean_content)
-        except Exception:
-            # Can't read variables.tf, return empty dict
-            pass
-    
-    return variables
+    try:
+        stat = os.stat(variables_tf_path)
+    except OSError:
+        return {}
 
+    # The caller extends the result, so hand out a copy of the cached parse
+    return dict(_parse_variables_tf(variables_tf_path, stat.st_mtime_ns, stat.st_size))
 
-def _remove_comments_for_parsing(content: str) -> str:
+
+@functools.lru_cache(maxsize=32)
+def _parse_variables_tf(variables_tf_path: str, mtime_ns: int, size: int) -> Dict[str, bool]:
     """
-    Remove comments from content for parsing, but preserve line structure.
+    Parse a variables.tf file once per (path, mtime, size).
 
-    This helper function removes all comments from the Terraform content
-    while maintaining the line structure for accurate parsing.
+    Every .tf file in a module directory reads the same variables.tf; the
+    stat fields in the key make an edited file miss the cache.
 
     Args:
-        content (str): The original file content
+        variables_tf_path (str): Path to variables.tf
+        mtime_ns (int): Modification time of the file, in nanoseconds
+        size (int): Size of the file in bytes
 
     Returns:
-        str: Content with comments removed
+        Dict[str, bool]: Dictionary mapping variable names to whether they have defaults
     """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        # Remove comments but keep the line structure
-        if '#' in line:
-            # Find the first # that's not inside quotes
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    line = line[:i]
-                    break
-        cleaned_lines.append(line)
-
-    return '\n'.join(cleaned_lines)
+    try:
+        with open(variables_tf_path, 'r', encoding='utf-8') as f:
+            variables_content = f.read()
+        clean_content = remove_comments_for_parsing(variables_content)
+        return _extract_variables(clean_content)
+    except Exception:
+        # Can't read variables.tf, return empty dict
+        return {}
 
 
-def _extract_data_source_variables_with_lines(content: str, original_lines: List[str]) -> Dict[str, Set[int]]:
+def _extract_data_source_variables_with_lines(content: str, original_lines: List[str]) -> Dict[str, int]:
     """
     Extract variable references from data source blocks with their line numbers.
 
@@ -216,66 +236,57 @@ def _extract_data_source_variables_with_lines(content: str, original_lines: List
         original_lines (List[str]): Original file lines for line number mapping
 
     Returns:
-        Dict[str, Set[int]]: Dictionary mapping variable names to sets of line numbers where they're used
+        Dict[str, int]: Dictionary mapping variable names to the line number of
+        their first reference in a data source block
     """
-    variables_in_data_sources = {}
-    
-    # Improved pattern to match data source blocks with better boundary detection
-    # Ensures 'data' is at word boundary (start of line or after whitespace)
-    # Supports quoted, single-quoted, and unquoted syntax
-    # Uses a more robust approach to handle nested braces
-    
-    # Split content into lines for more precise parsing
-    lines = content.split('\n')
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Check if this line starts a data source block
-        # Pattern: data "type" "name" { or data 'type' 'name' { or data type name {
-        data_start_pattern = r'^data\s+(?:"[^"]+"|\'[^\']+\'|[a-zA-Z_][a-zA-Z0-9_]*)\s+(?:"[^"]+"|\'[^\']+\'|[a-zA-Z_][a-zA-Z0-9_]*)\s*\{'
-        
-        if re.match(data_start_pattern, line):
-            # Found start of data source block
-            block_start_line = i + 1  # Convert to 1-based line numbering
-            
-            # Find the end of this data source block by counting braces
-            brace_count = line.count('{') - line.count('}')
-            j = i + 1
-            block_lines = [line]
-            
-            # Continue until we close all braces
-            while j < len(lines) and brace_count > 0:
-                current_line = lines[j]
-                block_lines.append(current_line)
-                brace_count += current_line.count('{') - current_line.count('}')
-                j += 1
-            
-            # Join all block lines to get the complete data source block content
-            block_content = '\n'.join(block_lines)
-            
-            # Pattern to match variable references
-            var_ref_pattern = r'var\.([a-zA-Z_][a-zA-Z0-9_]*)'
-            
-            # Find all variable references in this data source block
-            for var_match in re.finditer(var_ref_pattern, block_content):
-                var_name = var_match.group(1)
-                
-                # Calculate the line number of this variable reference within the block
-                var_preceding_text = block_content[:var_match.start()]
-                var_line_offset = var_preceding_text.count('\n')
-                var_line = block_start_line + var_line_offset
-                
-                if var_name not in variables_in_data_sources:
-                    variables_in_data_sources[var_name] = set()
-                variables_in_data_sources[var_name].add(var_line)
-            
-            # Move to the line after this block
-            i = j
-        else:
-            i += 1
-    
+    variables_in_data_sources: Dict[str, int] = {}
+
+    # Search the whole content for block headers instead of stripping and
+    # matching every line; line numbers are counted between matches
+    content_length = len(content)
+    line_number = 1
+    counted_to = 0
+    pos = 0
+    while True:
+        data_match = _DATA_START_RE.search(content, pos)
+        if not data_match:
+            break
+        block_start = data_match.start()
+        line_number += content.count('\n', counted_to, block_start)
+        counted_to = block_start
+        block_start_line = line_number
+
+        # The block runs to the end of the line on which its braces balance;
+        # one scan visits only braces and line breaks
+        brace_count = 0
+        line_end = content_length
+        for token in _BRACE_OR_NEWLINE_RE.finditer(content, block_start):
+            ch = token.group()
+            if ch == '{':
+                brace_count += 1
+            elif ch == '}':
+                brace_count -= 1
+            elif brace_count <= 0:
+                line_end = token.start()
+                break
+
+        # Find all variable references in this data source block, searching
+        # the content in place and counting lines from the previous reference.
+        # Blocks are scanned in file order, so the first reference recorded
+        # for a name is its lowest line and later ones are skipped.
+        var_line = block_start_line
+        var_counted_to = block_start
+        for var_match in _VAR_REFERENCE_RE.finditer(content, block_start, line_end):
+            var_name = var_match.group(1)
+            if var_name in variables_in_data_sources:
+                continue
+            var_line += content.count('\n', var_counted_to, var_match.start())
+            var_counted_to = var_match.start()
+            variables_in_data_sources[var_name] = var_line
+
+        # Continue on the line after this block
+        pos = line_end + 1
+
     return variables_in_data_sources
 
 
@@ -291,17 +302,11 @@ def _extract_variables(content: str) -> Dict[str, bool]:
     """
     variables: Dict[str, bool] = {}
 
-    # Find the start of a variable block (name and the first following '{')
-    start_pattern = re.compile(
-        r"\bvariable\s+(?:\"([^\"]+)\"|'([^']+)'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{",
-        re.MULTILINE,
-    )
-
     pos = 0
     length = len(content)
 
     while pos < length:
-        m = start_pattern.search(content, pos)
+        m = _VARIABLE_START_RE.search(content, pos)
         if not m:
             break
 
@@ -313,43 +318,20 @@ def _extract_variables(content: str) -> Dict[str, bool]:
             pos = m.end()
             continue
 
-        # Scan forward using brace counting; handle nested braces and braces inside strings
+        # Jump between braces and strings; braces inside strings are not counted
         brace_count = 0
-        i = brace_start
-        in_quotes = False
-        quote_char = ''
-        while i < length:
-            ch = content[i]
-
-            # Handle quotes and escapes to avoid counting braces inside strings
-            if in_quotes:
-                if ch == '\\':
-                    # Skip the escaped character
-                    i += 2
-                    continue
-                if ch == quote_char:
-                    in_quotes = False
-                i += 1
-                continue
-            else:
-                if ch == '"' or ch == '\'':
-                    in_quotes = True
-                    quote_char = ch
-                    i += 1
-                    continue
-
+        for token in _STRING_OR_BRACE_RE.finditer(content, brace_start):
+            ch = token.group()
             if ch == '{':
                 brace_count += 1
             elif ch == '}':
                 brace_count -= 1
                 if brace_count == 0:
-                    # Variable block ends; extract body
-                    body = content[brace_start + 1:i]
-                    has_default = bool(re.search(r"\bdefault\s*=", body))
-                    variables[var_name] = has_default
+                    # Variable block ends; look for default within its body
+                    i = token.start()
+                    variables[var_name] = _has_default_assignment(content, brace_start + 1, i)
                     pos = i + 1
                     break
-            i += 1
         else:
             # Unclosed block; advance to avoid infinite loop
             pos = m.end()
@@ -357,6 +339,20 @@ def _extract_variables(content: str) -> Dict[str, bool]:
     return variables
 
 
+def _has_default_assignment(content: str, body_start: int, body_end: int) -> bool:
+    """
+    Return True when the variable body in content[body_start:body_end] assigns ``default``.
+
+    The body is searched in place rather than sliced out. The leading word
+    boundary keeps _DEFAULT_ASSIGNMENT_RE from using the regex engine's
+    literal-prefix scan, so the search starts at the first ``default`` found
+    by str.find; the boundary check still sees the character before it,
+    which at the body start is the opening brace.
+    """
+    start = content.find('default', body_start, body_end)
+    return start != -1 and _DEFAULT_ASSIGNMENT_RE.search(content, start, body_end) is not None
+
+
 def get_rule_description() -> dict:
     """
     Retrieve detailed information about the ST.002 rule.
@@ -65,10 +65,61 @@ Author: Lance
 License: Apache 2.0
 """
 
+import bisect
+import functools
 import re
 import sys
 from typing import Callable, List, Tuple, Optional, Dict
 
+from rules.common.lines import get_content_lines
+
+# Block headers accept quoted, single-quoted, and unquoted labels
+_DATA_HEADER_RE = re.compile(r'data\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{')
+_RESOURCE_HEADER_RE = re.compile(r'resource\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{')
+_PROVIDER_HEADER_RE = re.compile(r'provider\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{')
+_LOCALS_HEADER_RE = re.compile(r'locals\s*\{')
+_TERRAFORM_HEADER_RE = re.compile(r'terraform\s*\{')
+_VARIABLE_HEADER_RE = re.compile(r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{')
+# Lines that could hold any of the block headers above (a superset filter)
+_HEADER_CANDIDATE_RE = re.compile(
+    r'^[^\S\n]*(?:data|resource|provider|locals|terraform|variable|output)[^\n]*\{',
+    re.MULTILINE,
+)
+_OUTPUT_HEADER_RE = re.compile(r'output\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{')
+
+# Matches <<EOF or <<-EOF at the end of a line
+_HEREDOC_START_RE = re.compile(r'<<-?([A-Z]+)\s*$')
+_BLOCK_DECLARATION_RE = re.compile(r'^\s*(data|resource|variable|output|locals|module)\s+')
+_OBJECT_ASSIGNMENT_RE = re.compile(r'^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*\{')
+_FOR_EXPRESSION_RE = re.compile(r'^\s*for\s+')
+# Leading keywords of _BLOCK_DECLARATION_RE, used as a cheap prefilter
+_BLOCK_DECLARATION_KEYWORDS = ('data', 'resource', 'variable', 'output', 'locals', 'module')
+
+# Parameter name before '=': optionally quoted, or quoted/bare as a prefix
+_PARAM_NAME_ONLY_RE = re.compile(r'^\s*(["\']?)([^"\'=\s]+)\1\s*$')
+_QUOTED_PARAM_NAME_RE = re.compile(r'^\s*(["\'])([^"\'=\s]+)\1')
+_BARE_PARAM_NAME_RE = re.compile(r'^\s*([^"\'=\s]+)')
+
+# Assignment-operator scan: quoted segments, comparison operators and a
+# leading '=' are consumed as tokens; the named group marks the first
+# assignment '='
+_ASSIGNMENT_TOKEN_RE = re.compile(
+    r'(?<!\\)"(?:\\"|[^"])*"?'
+    r'|(?<!\\)\'(?:\\\'|[^\'])*\'?'
+    r'|=='
+    r'|(?<=[!<>])='
+    r'|^='
+    r'|(?P<assign>=)'
+)
+
+# Comment-only line (group 1), quoted segment (group 2) or inline comment.
+# A quote preceded by a backslash neither opens nor closes a string.
+_COMMENT_STRIP_RE = re.compile(
+    r'(?m)(^[^\S\n]*#[^\n]*)'
+    r'|((?<!\\)"(?:\\"|[^"\n])*"?|(?<!\\)\'(?:\\\'|[^\'\n])*\'?)'
+    r'|[^\S\n]*#[^\n]*'
+)
+
 
 def check_st003_parameter_alignment(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -127,17 +178,8 @@ def check_st003_parameter_alignment(file_path: str, content: str, log_error_func
         # Sort errors by line number
         all_errors.sort(key=lambda x: x[0])
         
-        # Deduplicate errors (same line number and error message)
-        seen = set()
-        unique_errors = []
-        for line_num, error_msg in all_errors:
-            key = (line_num, error_msg)
-            if key not in seen:
-                seen.add(key)
-                unique_errors.append((line_num, error_msg))
-        
-        # Report sorted and deduplicated errors
-        for line_num, error_msg in unique_errors:
+        # Report sorted errors, deduplicated on (line number, message) in order
+        for line_num, error_msg in dict.fromkeys(all_errors):
             log_error_func(file_path, "ST.003", error_msg, line_num)
 
 
@@ -145,39 +187,39 @@ def _remove_comments_for_parsing(content: str) -> str:
     """
     Remove comments from content for parsing, but preserve line structure.
 
+    Comment-only lines are kept as-is; inline comments are removed together
+    with the whitespace preceding them.
+
     Args:
         content (str): The original file content
 
     Returns:
         str: Content with comments removed
     """
-    lines = content.split('\n')
-    cleaned_lines = []
-
-    for line in lines:
-        if '#' in line:
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    # If the line is only a comment (after stripping), keep the original line
-                    # to preserve line structure
-                    stripped_before_comment = line[:i].strip()
-                    if not stripped_before_comment:
-                        line = line  # Keep original line (comment line)
-                    else:
-                        line = line[:i].rstrip()  # Remove comment but keep content
-                    break
-        cleaned_lines.append(line)
+    if '#' not in content:
+        return content
+    # Keep comment-only lines and strings (a group matched), drop inline comments
+    return _COMMENT_STRIP_RE.sub(r'\1\2', content)
+
 
-    return '\n'.join(cleaned_lines)
+def _find_header_candidate_lines(content: str) -> List[int]:
+    """
+    Return the 0-based indexes of lines that may start a block.
+
+    Args:
+        content (str): The cleaned Terraform content
+
+    Returns:
+        List[int]: Sorted line indexes matched by _HEADER_CANDIDATE_RE
+    """
+    header_lines = []
+    line_index = 0
+    counted_to = 0
+    for match in _HEADER_CANDIDATE_RE.finditer(content):
+        line_index += content.count('\n', counted_to, match.start())
+        counted_to = match.start()
+        header_lines.append(line_index)
+    return header_lines
 
 
 def _extract_code_blocks(content: str) -> List[Tuple[str, int, List[str]]]:
@@ -190,22 +232,28 @@ def _extract_code_blocks(content: str) -> List[Tuple[str, int, List[str]]]:
     Returns:
         List[Tuple[str, int, List[str]]]: List of (block_type, start_line, block_lines)
     """
-    lines = content.split('\n')
+    lines = get_content_lines(content)
+    header_lines = _find_header_candidate_lines(content)
     blocks = []
     i = 0
     while i < len(lines):
+        # Jump straight to the next line that may hold a block header
+        candidate = bisect.bisect_left(header_lines, i)
+        if candidate == len(header_lines):
+            break
+        i = header_lines[candidate]
         line = lines[i].strip()
         # Support quoted, single-quoted, and unquoted syntax
         # Quoted: data "type" "name" { ... } or resource "type" "name" { ... } or provider "type" { ... } or locals { ... }
         # Single-quoted: data 'type' 'name' { ... } or resource 'type' 'name' { ... } or provider 'type' { ... } or locals { ... }
         # Unquoted: data type name { ... } or resource type name { ... } or provider type { ... } or locals { ... }
-        data_match = re.match(r'data\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
-        resource_match = re.match(r'resource\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
-        provider_match = re.match(r'provider\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
-        locals_match = re.match(r'locals\s*\{', line)
-        terraform_match = re.match(r'terraform\s*\{', line)
-        variable_match = re.match(r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
-        output_match = re.match(r'output\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
+        data_match = _DATA_HEADER_RE.match(line) if line.startswith('data') else None
+        resource_match = _RESOURCE_HEADER_RE.match(line) if line.startswith('resource') else None
+        provider_match = _PROVIDER_HEADER_RE.match(line) if line.startswith('provider') else None
+        locals_match = _LOCALS_HEADER_RE.match(line) if line.startswith('locals') else None
+        terraform_match = _TERRAFORM_HEADER_RE.match(line) if line.startswith('terraform') else None
+        variable_match = _VARIABLE_HEADER_RE.match(line) if line.startswith('variable') else None
+        output_match = _OUTPUT_HEADER_RE.match(line) if line.startswith('output') else None
 
         if data_match or resource_match or provider_match or locals_match or terraform_match or variable_match or output_match:
             if data_match:
@@ -247,19 +295,18 @@ def _extract_code_blocks(content: str) -> List[Tuple[str, int, List[str]]]:
                 pass
             else:
                 # Multi-line block, process until we find the closing brace
+                block_start = i
                 while i < len(lines) and brace_count > 0:
                     current_line = lines[i]
-                    block_lines.append(current_line)
-                    for char in current_line:
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
+                    brace_count += current_line.count('{') - current_line.count('}')
                     i += 1
 
-                # Remove the last line if it contains only the closing brace
-                if block_lines and block_lines[-1].strip() == '}':
-                    block_lines = block_lines[:-1]
+                # Leave out the last line if it contains only the closing brace,
+                # then copy the block's lines with a single slice
+                block_end = i
+                if block_end > block_start and lines[block_end - 1].strip() == '}':
+                    block_end -= 1
+                block_lines = lines[block_start:block_end]
 
             blocks.append((block_type, start_line, block_lines))
         else:
@@ -319,7 +366,7 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
         
         # Check for heredoc start pattern (<<EOF, <<-EOF, etc.)
         # Match <<EOF or <<-EOF at the end of a line
-        heredoc_match = re.search(r'<<-?([A-Z]+)\s*$', line)
+        heredoc_match = _HEREDOC_START_RE.search(line)
         if heredoc_match:
             in_heredoc = True
             heredoc_terminator = heredoc_match.group(1)
@@ -1350,36 +1397,22 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
     return merged_sections
 
 
+@functools.lru_cache(maxsize=4096)
 def _find_assignment_equals_pos(line: str) -> int:
     """
     Find the position of the assignment '=' operator in a line.
 
     Comparison operators (==, !=, <=, >=) are ignored so expression content
     is not misidentified as parameter assignments.
+
+    The same line is usually looked up several times (has / before / after),
+    so results are memoised.
     """
-    in_quotes = False
-    quote_char = None
-    i = 0
-    while i < len(line):
-        char = line[i]
-        if char in ('"', "'") and (i == 0 or line[i - 1] != '\\'):
-            if not in_quotes:
-                in_quotes = True
-                quote_char = char
-            elif char == quote_char:
-                in_quotes = False
-                quote_char = None
-        elif not in_quotes and char == '=':
-            prev_char = line[i - 1] if i > 0 else ''
-            next_char = line[i + 1] if i + 1 < len(line) else ''
-            if next_char == '=':
-                i += 2
-                continue
-            if prev_char in '!<>':
-                i += 1
-                continue
-            return i
-        i += 1
+    if '=' not in line:
+        return -1
+    for token in _ASSIGNMENT_TOKEN_RE.finditer(line):
+        if token.lastgroup == 'assign':
+            return token.start()
     return -1
 
 
@@ -1421,58 +1454,14 @@ def _check_parameter_alignment_in_section(
     in_heredoc = False
     heredoc_terminator = None
     
-    # Check if this section is inside a function call (e.g., jsonencode({...}))
-    # However, we should still check alignment for parameters inside jsonencode({...})
-    # because they are object literals that should be aligned
-    # Only skip if we're inside function call parameters (not object literals)
-    is_inside_function_call = False
-    
-    if block_lines and section:
-        # Check each parameter line in the section to see if any is inside a function call
-        # We need to check all lines, not just the first one
-        for line_content, relative_line_idx in section:
-            if '=' not in line_content or line_content.strip().startswith('#'):
-                continue
-            
-            current_indent = len(block_lines[relative_line_idx]) - len(block_lines[relative_line_idx].lstrip())
-            
-            # Search backwards through block_lines to find if this line is inside a function call
-            search_idx = relative_line_idx - 1
-            while search_idx >= 0:
-                search_line = block_lines[search_idx]
-                search_stripped = search_line.strip()
-                if search_stripped == '' or search_stripped.startswith('#'):
-                    search_idx -= 1
-                    continue
-                search_indent = len(search_line) - len(search_line.lstrip())
-                # If we find a line with lower or equal indent, check if it's a function call
-                if search_indent <= current_indent:
-                    if _has_assignment_equals(search_line):
-                        search_after_equals = _get_after_assignment_equals(search_line)
-                        # Match common Terraform functions that can contain objects/arrays
-                        function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                             'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                        if search_after_equals and any(search_after_equals.startswith(pattern) for pattern in function_patterns):
-                            # Check if the function call contains '{' or '[' on the same line
-                            # If so, the parameters inside are object/array literals that should be checked
-                            # Only skip if we're in function call parameters (not object literals)
-                            # For jsonencode({...}), merge({...}), etc., the content inside should be checked
-                            # because it's an object literal, not function parameters
-                            if '{' in search_after_equals or '[' in search_after_equals:
-                                # This is a function call with object/array literal on the same line
-                                # The parameters inside are object/array literals, not function parameters
-                                # So we should still check alignment for them
-                                # Only skip if we're actually in function call parameters (not object literals)
-                                # For now, we'll check alignment for object literals inside function calls
-                                pass
-                    # If we find a parameter at lower indent that's not a function call, stop searching
-                    if search_indent < current_indent:
-                        break
-                search_idx -= 1
-    
-    # Note: We no longer skip alignment checks for sections inside function calls
-    # because parameters inside jsonencode({...}), merge({...}), etc. are object literals
-    # that should be checked for alignment
+    # Parameters need an assignment '='; sections without one have nothing to check.
+    # Parameters inside jsonencode({...}), merge({...}), etc. are object literals
+    # and are checked like any other section.
+    if not any('=' in line_content for line_content, _ in section):
+        return errors
+
+    # Whether the section mentions required_providers, looked up once on first need
+    section_has_required_providers = None
 
     # Extract parameter lines from section
     for line_content, relative_line_idx in section:
@@ -1493,7 +1482,7 @@ def _check_parameter_alignment_in_section(
         
         # Check for heredoc start pattern (<<EOF, <<-EOF, etc.)
         # Match <<EOF or <<-EOF at the end of a line
-        heredoc_match = re.search(r'<<-?([A-Z]+)\s*$', line)
+        heredoc_match = _HEREDOC_START_RE.search(line)
         if heredoc_match:
             in_heredoc = True
             heredoc_terminator = heredoc_match.group(1)
@@ -1501,14 +1490,19 @@ def _check_parameter_alignment_in_section(
         
         if _has_assignment_equals(line) and not line_stripped.startswith('#'):
             # Skip block declarations
-            if not re.match(r'^\s*(data|resource|variable|output|locals|module)\s+', line):
+            if not (line_stripped.startswith(_BLOCK_DECLARATION_KEYWORDS) and
+                    _BLOCK_DECLARATION_RE.match(line)):
                 # Skip provider declarations in required_providers blocks
-                if (re.match(r'^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*\{', line) and
-                    any('required_providers' in prev_line for prev_line, _ in section)):
-                    continue
+                if '{' in line and _OBJECT_ASSIGNMENT_RE.match(line):
+                    if section_has_required_providers is None:
+                        section_has_required_providers = any(
+                            'required_providers' in prev_line for prev_line, _ in section
+                        )
+                    if section_has_required_providers:
+                        continue
                 
                 # Skip Terraform for expressions (e.g., for image in collection : image if condition)
-                if re.match(r'^\s*for\s+', line):
+                if line_stripped.startswith('for') and _FOR_EXPRESSION_RE.match(line):
                     continue
                 
                 parameter_lines.append((line, relative_line_idx))
@@ -1682,7 +1676,7 @@ def _check_group_alignment(
         after_equals = line[equals_pos + 1:].strip()
         is_nested_block = after_equals.startswith('{')
         
-        param_name_match = re.match(r'^\s*(["\']?)([^"\'=\s]+)\1\s*$', before_equals)
+        param_name_match = _PARAM_NAME_ONLY_RE.match(before_equals)
         if param_name_match:
             param_name = param_name_match.group(2)
             # Include nested blocks for alignment checking
@@ -1716,29 +1710,26 @@ def _check_group_alignment(
         
         return errors
     
-    # Find longest parameter name
-    longest_param_name_length = max(len(param_name) for param_name, _, _, _, _ in param_data) if param_data else 0
+    # Find the longest parameter once; every branch below measures against it
+    longest_param_data = max(param_data, key=lambda x: len(x[0]))
+    longest_param_name_length = len(longest_param_data[0])
     
     indent_spaces = indent_level * 2  # Convert indent level back to spaces
     
-    # For tfvars files, check if most parameters are already aligned
-    # If so, use the aligned position as expected location
-    unique_equals_positions = {}
-    for param_name, line, relative_line_idx, equals_pos, is_nested_block in param_data:
-        if equals_pos not in unique_equals_positions:
-            unique_equals_positions[equals_pos] = []
-        unique_equals_positions[equals_pos].append((param_name, line, relative_line_idx, equals_pos))
-    
     # For tfvars files, use actual alignment if parameters are already aligned
     if block_type == "tfvars":
+        # Count parameters per equals position (only tfvars needs this)
+        equals_position_counts: Dict[int, int] = {}
+        for _, _, _, equals_pos, _ in param_data:
+            equals_position_counts[equals_pos] = equals_position_counts.get(equals_pos, 0) + 1
+
         # If all parameters are already aligned at one position, use that position
-        if len(unique_equals_positions) == 1:
-            expected_equals_location = list(unique_equals_positions.keys())[0]
-        elif len(unique_equals_positions) > 1:
+        if len(equals_position_counts) == 1:
+            expected_equals_location = next(iter(equals_position_counts))
+        elif len(equals_position_counts) > 1:
             # More than one position, find the most common one
-            most_common_pos = max(unique_equals_positions.keys(), 
-                                key=lambda pos: len(unique_equals_positions[pos]))
-            most_common_count = len(unique_equals_positions[most_common_pos])
+            most_common_pos = max(equals_position_counts, key=equals_position_counts.get)
+            most_common_count = equals_position_counts[most_common_pos]
             total_params = len(param_data)
             
             # If most parameters (> 50% and at least 2 params) are aligned at one position, use that position
@@ -1746,7 +1737,6 @@ def _check_group_alignment(
                 expected_equals_location = most_common_pos
             else:
                 # Calculate based on longest parameter name
-                longest_param_data = max(param_data, key=lambda x: len(x[0]))
                 longest_line = longest_param_data[1]
                 longest_equals_pos = longest_param_data[3]
                 longest_before_equals = longest_line[:longest_equals_pos]
@@ -1754,7 +1744,6 @@ def _check_group_alignment(
                 expected_equals_location = indent_spaces + longest_param_name_length + longest_quote_chars + 1
         else:
             # Calculate based on longest parameter name
-            longest_param_data = max(param_data, key=lambda x: len(x[0]))
             longest_line = longest_param_data[1]
             longest_equals_pos = longest_param_data[3]
             longest_before_equals = longest_line[:longest_equals_pos]
@@ -1763,7 +1752,6 @@ def _check_group_alignment(
     else:
         # Calculate expected equals location based on longest parameter name
         # Formula: indent_spaces + param_name_length + quote_chars + 1 (standard space before equals)
-        longest_param_data = max(param_data, key=lambda x: len(x[0]))
         longest_line = longest_param_data[1]
         longest_equals_pos = longest_param_data[3]
         longest_before_equals = longest_line[:longest_equals_pos]
@@ -2051,7 +2039,7 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         content (str): Cleaned file content (comments removed)
         log_error_func (Callable): Error logging function
     """
-    lines = content.split('\n')
+    lines = get_content_lines(content)
     
     # Track heredoc state to skip content inside heredoc blocks
     in_heredoc = False
@@ -2078,7 +2066,7 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         # Check for heredoc start pattern (<<EOF, <<-EOF, etc.)
         # This must be checked AFTER we've processed the line (if it contains '=' or boundary markers)
         # Match <<EOF or <<-EOF at the end of a line
-        heredoc_match = re.search(r'<<-?([A-Z]+)\s*$', line)
+        heredoc_match = _HEREDOC_START_RE.search(line)
         if heredoc_match:
             in_heredoc = True
             heredoc_terminator = heredoc_match.group(1)
@@ -2653,7 +2641,7 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
         line = line_content.rstrip()
         if _has_assignment_equals(line) and not line.strip().startswith('#'):
             # Skip block declarations
-            if not re.match(r'^\s*(data|resource|variable|output|locals|module)\s+', line):
+            if not _BLOCK_DECLARATION_RE.match(line):
                 # Skip lines where equals sign is inside a string value (e.g., "==", "!=")
                 if _is_equals_in_string_value(line):
                     continue
@@ -2783,7 +2771,7 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
                     # Compute param display length with quotes if any for message spacing
                     before_equals = display_line[:equals_pos]
                     if before_equals.strip().startswith('"') or before_equals.strip().startswith("'"):
-                        name_match = re.match(r"^\s*([\"\'])([^\"'\s=]+)\1", before_equals)
+                        name_match = _QUOTED_PARAM_NAME_RE.match(before_equals)
                         param_name = name_match.group(2) if name_match else before_equals.strip().strip("\"'")
                         name_len = len(param_name) + 2
                     else:
@@ -2843,10 +2831,10 @@ def _compute_expected_equals_location_tfvars(group_lines: List[Tuple[int, str]],
         actual_indent = len(line) - len(line.lstrip())
         should_skip_from_expected_calc = is_object_or_array_decl and actual_indent > 0
         if before_equals.strip().startswith('"') or before_equals.strip().startswith("'"):
-            m = re.match(r"^\s*([\"\'])([^\"'\s=]+)\1", before_equals)
+            m = _QUOTED_PARAM_NAME_RE.match(before_equals)
             param_name = m.group(2) if m else None
         else:
-            m = re.match(r"^\s*([^\"'\s=]+)", before_equals)
+            m = _BARE_PARAM_NAME_RE.match(before_equals)
             param_name = m.group(1) if m else None
         if param_name is not None:
             param_data.append((param_name, line, actual_line_num, equals_pos, should_skip_from_expected_calc))
@@ -2918,13 +2906,13 @@ def _check_group_alignment_tfvars(group_lines: List[Tuple[int, str]], indent_lev
         # For quoted params like "format", we need to handle the quotes
         # For unquoted params like type, we just need the name
         if before_equals.strip().startswith('"') or before_equals.strip().startswith("'"):
-            param_name_match = re.match(r'^\s*(["\'])([^"\'=\s]+)\1', before_equals)
+            param_name_match = _QUOTED_PARAM_NAME_RE.match(before_equals)
             if param_name_match:
                 param_name = param_name_match.group(2)
             else:
                 param_name_match = None
         else:
-            param_name_match = re.match(r'^\s*([^"\'=\s]+)', before_equals)
+            param_name_match = _BARE_PARAM_NAME_RE.match(before_equals)
             if param_name_match:
                 param_name = param_name_match.group(1)
             else:
@@ -3392,15 +3380,8 @@ def _is_inside_block_structure_tfvars(current_line: str, all_lines: List[str], c
                 continue
                 
             # Count braces and brackets to track block structure
-            for char in line:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                elif char == '[':
-                    bracket_count += 1
-                elif char == ']':
-                    bracket_count -= 1
+            brace_count += line.count('{') - line.count('}')
+            bracket_count += line.count('[') - line.count(']')
             
             # If we have unmatched opening braces/brackets, we're inside a block
             if brace_count > 0 or bracket_count > 0:
@@ -65,9 +65,10 @@ Author: Lance
 License: Apache 2.0
 """
 
-import re
 from typing import Callable, List, Dict, Any, Optional
 
+from rules.common.lines import get_content_lines
+
 
 def check_st004_indentation_character(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -102,10 +103,15 @@ def check_st004_indentation_character(file_path: str, content: str, log_error_fu
         No exceptions are raised by this function. All errors are handled
         gracefully and reported through the logging mechanism.
     """
-    lines = content.split('\n')
+    # Without a tab anywhere there is nothing to report
+    if '\t' not in content:
+        return
+
+    lines = get_content_lines(content)
     
     for line_num, line in enumerate(lines, 1):
-        if line.strip() == '':
+        # Most lines have no tab at all; skip them before any stripping
+        if '\t' not in line or line.strip() == '':
             continue
             
         leading_whitespace = _get_leading_whitespace(line)
@@ -143,8 +149,7 @@ def _get_leading_whitespace(line: str) -> str:
     Returns:
         str: The leading whitespace characters
     """
-    match = re.match(r'^(\s*)', line)
-    return match.group(1) if match else ''
+    return line[:len(line) - len(line.lstrip())]
 
 
 def _analyze_indentation_pattern(content: str) -> dict:
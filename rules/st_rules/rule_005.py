@@ -54,6 +54,15 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Tuple, Optional
 
+from rules.common.lines import get_content_lines
+
+# Heredoc opener at the end of a line (<<EOT, <<-JSON, ...)
+_HEREDOC_START_RE = re.compile(r'<<-?([A-Z]+)\s*$')
+# Keywords that start a top-level block declaration
+_TOP_LEVEL_DECLARATION_PREFIXES = (
+    'resource ', 'data ', 'variable ', 'output ', 'locals ', 'terraform ', 'provider ',
+)
+
 
 def check_st005_indentation_level(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -90,7 +99,7 @@ def check_st005_indentation_level(file_path: str, content: str, log_error_func:
         No exceptions are raised by this function. All errors are handled
         gracefully and reported through the logging mechanism.
     """
-    lines = content.split('\n')
+    lines = get_content_lines(content)
     
     # Check if this is a terraform.tfvars file
     is_tfvars_file = file_path.endswith('.tfvars')
@@ -104,7 +113,9 @@ def check_st005_indentation_level(file_path: str, content: str, log_error_func:
     bracket_level = 0  # Track square brackets [ ]
     
     for line_num, line in enumerate(lines, 1):
-        if line.strip() == '':
+        # Strip once; the stripped text is reused for every check on this line
+        line_content = line.strip()
+        if line_content == '':
             continue
         
         # Check heredoc state for all files (not just terraform.tfvars)
@@ -116,8 +127,6 @@ def check_st005_indentation_level(file_path: str, content: str, log_error_func:
         if in_heredoc:
             continue
         
-        line_content = line.strip()
-        
         # Skip comment lines
         if line_content.startswith('#'):
             continue
@@ -172,13 +181,8 @@ def _validate_line_indentation(file_path: str, line_num: int, line_content: str,
     # Top-level declarations should not be indented
     # Only check for actual top-level declarations, not block names
     # Skip if line contains ' = ' (this is a parameter assignment, not a top-level declaration)
-    if ((line_content.startswith('resource ') or 
-         line_content.startswith('data ') or 
-         line_content.startswith('variable ') or 
-         line_content.startswith('output ') or 
-         line_content.startswith('locals ') or 
-         line_content.startswith('terraform ') or 
-         line_content.startswith('provider ')) and
+    is_top_level_declaration = line_content.startswith(_TOP_LEVEL_DECLARATION_PREFIXES)
+    if (is_top_level_declaration and
         ' ' in line_content and not line_content.endswith('{') and ' = ' not in line_content):
         # This is a top-level block declaration (e.g., "resource ..." or "provider ... {")
         # Not a parameter assignment (e.g., "provider = ..." inside a resource block)
@@ -225,13 +229,7 @@ def _validate_line_indentation(file_path: str, line_num: int, line_content: str,
     if indent_level == 0 and '=' in line_content and not line_content.startswith('#') and not is_tfvars_file:
         # This looks like a block parameter that should be indented
         # Check if it's not a top-level declaration
-        if not (line_content.startswith('resource ') or 
-                line_content.startswith('data ') or 
-                line_content.startswith('variable ') or 
-                line_content.startswith('output ') or 
-                line_content.startswith('locals ') or 
-                line_content.startswith('terraform ') or 
-                line_content.startswith('provider ')):
+        if not is_top_level_declaration:
             log_error_func(
                 file_path,
                 "ST.005",
@@ -365,14 +363,12 @@ def _check_heredoc_state(line: str, current_in_heredoc: bool, current_terminator
     Returns:
         dict: Dictionary with 'in_heredoc' and 'terminator' keys
     """
-    line_stripped = line.strip()
-    
     # Check for heredoc start pattern (<<EOT, <<EOF, <<-JSON, etc.)
     # This can appear at the end of a line like: locals = <<EOT or conditions = <<-JSON
     # Terraform supports both <<TERMINATOR and <<-TERMINATOR formats
     if not current_in_heredoc:
         # Match both <<TERMINATOR and <<-TERMINATOR formats
-        heredoc_match = re.search(r'<<-?([A-Z]+)\s*$', line)
+        heredoc_match = _HEREDOC_START_RE.search(line) if '<<' in line else None
         if heredoc_match:
             return {
                 "in_heredoc": True,
@@ -381,7 +377,7 @@ def _check_heredoc_state(line: str, current_in_heredoc: bool, current_terminator
 
     # Check for heredoc end pattern
     # The terminator must be at the beginning of the line (after stripping)
-    elif current_terminator and line_stripped == current_terminator:
+    elif current_terminator and line.strip() == current_terminator:
         return {
             "in_heredoc": False,
             "terminator": None
@@ -404,15 +400,10 @@ def _get_indentation_level(line: str) -> int:
     Returns:
         int: Number of leading spaces
     """
-    leading_spaces = 0
-    for char in line:
-        if char == ' ':
-            leading_spaces += 1
-        elif char == '\t':
-            # If tabs are found, treat as invalid (should be caught by ST.004)
-            return -1
-        else:
-            break
+    leading_spaces = len(line) - len(line.lstrip(' '))
+    if line[leading_spaces:leading_spaces + 1] == '\t':
+        # If tabs are found, treat as invalid (should be caught by ST.004)
+        return -1
     return leading_spaces
 
 
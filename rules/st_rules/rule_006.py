@@ -44,6 +44,49 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Tuple, Optional
 
+from rules.common.blank_lines import BlankLineIndex, get_blank_line_index
+from rules.common.lines import get_content_lines
+
+# Block header patterns (quoted, unquoted, single-quoted and mixed forms)
+_RESOURCE_RE = re.compile(r'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{')
+_DATA_RE = re.compile(r'data\s+"([^"]+)"\s+"([^"]+)"\s*\{')
+_DATA_NO_QUOTES_RE = re.compile(r'data\s+([a-zA-Z0-9_]+)\s+"([^"]+)"\s*\{')
+_DATA_MIXED_QUOTES_RE = re.compile(r'data\s+"([^"]+)"\s+([a-zA-Z0-9_]+)\s*\{')
+_RESOURCE_NO_QUOTES_RE = re.compile(r'resource\s+([a-zA-Z0-9_]+)\s+"([^"]+)"\s*\{')
+_RESOURCE_MIXED_QUOTES_RE = re.compile(r'resource\s+"([^"]+)"\s+([a-zA-Z0-9_]+)\s*\{')
+_VARIABLE_RE = re.compile(r'variable\s+"([^"]+)"\s*\{')
+_VARIABLE_NO_QUOTES_RE = re.compile(r'variable\s+([a-zA-Z0-9_]+)\s*\{')
+_VARIABLE_SINGLE_QUOTES_RE = re.compile(r'variable\s+\'([^\']+)\'\s*\{')
+_OUTPUT_RE = re.compile(r'output\s+"([^"]+)"\s*\{')
+_OUTPUT_NO_QUOTES_RE = re.compile(r'output\s+([a-zA-Z0-9_]+)\s*\{')
+_OUTPUT_SINGLE_QUOTES_RE = re.compile(r'output\s+\'([^\']+)\'\s*\{')
+_LOCALS_RE = re.compile(r'locals\s*\{')
+_TERRAFORM_RE = re.compile(r'terraform\s*\{')
+_PROVIDER_RE = re.compile(r'provider\s+"([^"]+)"\s*\{')
+_PROVIDER_NO_QUOTES_RE = re.compile(r'provider\s+([a-zA-Z0-9_]+)\s*\{')
+
+# (pattern, block_type, type_name group, instance_name group) in priority
+# order; group 0 means the block has no such name. Unquoted and mixed-quote
+# forms are ST.010 violations but still count as blocks here.
+_BLOCK_HEADER_PATTERNS = (
+    (_RESOURCE_RE, "resource", 1, 2),
+    (_RESOURCE_NO_QUOTES_RE, "resource", 1, 2),
+    (_RESOURCE_MIXED_QUOTES_RE, "resource", 1, 2),
+    (_DATA_RE, "data source", 1, 2),
+    (_DATA_NO_QUOTES_RE, "data source", 1, 2),
+    (_DATA_MIXED_QUOTES_RE, "data source", 1, 2),
+    (_VARIABLE_RE, "variable", 0, 1),
+    (_VARIABLE_NO_QUOTES_RE, "variable", 0, 1),
+    (_VARIABLE_SINGLE_QUOTES_RE, "variable", 0, 1),
+    (_OUTPUT_RE, "output", 0, 1),
+    (_OUTPUT_NO_QUOTES_RE, "output", 0, 1),
+    (_OUTPUT_SINGLE_QUOTES_RE, "output", 0, 1),
+    (_LOCALS_RE, "locals", 0, 0),
+    (_TERRAFORM_RE, "terraform", 0, 0),
+    (_PROVIDER_RE, "provider", 1, 0),
+    (_PROVIDER_NO_QUOTES_RE, "provider", 1, 0),
+)
+
 
 def check_st006_resource_spacing(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -66,13 +109,14 @@ def check_st006_resource_spacing(file_path: str, content: str, log_error_func: C
     if len(blocks) < 2:
         return  # No spacing issues if there's only one or no blocks
     
-    lines = content.split('\n')
+    lines = get_content_lines(content)
+    blank_index = get_blank_line_index(content)
     
     for i in range(len(blocks) - 1):
         current_block = blocks[i]
         next_block = blocks[i + 1]
         
-        error_info = _check_block_spacing_detailed(current_block, next_block, lines)
+        error_info = _check_block_spacing_detailed(current_block, next_block, lines, blank_index)
         
         if error_info:
             error_line, error_msg = error_info
@@ -89,7 +133,7 @@ def _extract_all_blocks(content: str) -> List[Tuple[str, int, int, str, str]]:
     Returns:
         List[Tuple[str, int, int, str, str]]: List of (block_type, start_line, end_line, type_name, instance_name)
     """
-    lines = content.split('\n')
+    lines = get_content_lines(content)
     blocks = []
     i = 0
     
@@ -101,98 +145,13 @@ def _extract_all_blocks(content: str) -> List[Tuple[str, int, int, str, str]]:
             i += 1
             continue
         
-        # Match different block types
-        resource_match = re.match(r'resource\s+"([^"]+)"\s+"([^"]+)"\s*\{', line)
-        data_match = re.match(r'data\s+"([^"]+)"\s+"([^"]+)"\s*\{', line)
-        # Also match data blocks without quotes around type name (ST.010 violation)
-        data_match_no_quotes = re.match(r'data\s+([a-zA-Z0-9_]+)\s+"([^"]+)"\s*\{', line)
-        # Also match data blocks with quotes around type but not name (ST.010 violation)
-        data_match_mixed_quotes = re.match(r'data\s+"([^"]+)"\s+([a-zA-Z0-9_]+)\s*\{', line)
-        # Also match resource blocks without quotes around type name (ST.010 violation)
-        resource_match_no_quotes = re.match(r'resource\s+([a-zA-Z0-9_]+)\s+"([^"]+)"\s*\{', line)
-        # Also match resource blocks with quotes around type but not name (ST.010 violation)
-        resource_match_mixed_quotes = re.match(r'resource\s+"([^"]+)"\s+([a-zA-Z0-9_]+)\s*\{', line)
-        variable_match = re.match(r'variable\s+"([^"]+)"\s*\{', line)
-        # Also match variable blocks without quotes around name (ST.010 violation)
-        variable_match_no_quotes = re.match(r'variable\s+([a-zA-Z0-9_]+)\s*\{', line)
-        # Also match variable blocks with single quotes around name (ST.010 violation)
-        variable_match_single_quotes = re.match(r'variable\s+\'([^\']+)\'\s*\{', line)
-        output_match = re.match(r'output\s+"([^"]+)"\s*\{', line)
-        # Also match output blocks without quotes around name (ST.010 violation)
-        output_match_no_quotes = re.match(r'output\s+([a-zA-Z0-9_]+)\s*\{', line)
-        # Also match output blocks with single quotes around name (ST.010 violation)
-        output_match_single_quotes = re.match(r'output\s+\'([^\']+)\'\s*\{', line)
-        locals_match = re.match(r'locals\s*\{', line)
-        terraform_match = re.match(r'terraform\s*\{', line)
-        # Match provider blocks with quotes around type name
-        provider_match = re.match(r'provider\s+"([^"]+)"\s*\{', line)
-        # Match provider blocks without quotes around type name (ST.010 violation)
-        provider_match_no_quotes = re.match(r'provider\s+([a-zA-Z0-9_]+)\s*\{', line)
-        
-        if resource_match:
-            block_type = "resource"
-            type_name = resource_match.group(1)
-            instance_name = resource_match.group(2)
-        elif resource_match_no_quotes:
-            block_type = "resource"
-            type_name = resource_match_no_quotes.group(1)
-            instance_name = resource_match_no_quotes.group(2)
-        elif resource_match_mixed_quotes:
-            block_type = "resource"
-            type_name = resource_match_mixed_quotes.group(1)
-            instance_name = resource_match_mixed_quotes.group(2)
-        elif data_match:
-            block_type = "data source"
-            type_name = data_match.group(1)
-            instance_name = data_match.group(2)
-        elif data_match_no_quotes:
-            block_type = "data source"
-            type_name = data_match_no_quotes.group(1)
-            instance_name = data_match_no_quotes.group(2)
-        elif data_match_mixed_quotes:
-            block_type = "data source"
-            type_name = data_match_mixed_quotes.group(1)
-            instance_name = data_match_mixed_quotes.group(2)
-        elif variable_match:
-            block_type = "variable"
-            type_name = ""
-            instance_name = variable_match.group(1)
-        elif variable_match_no_quotes:
-            block_type = "variable"
-            type_name = ""
-            instance_name = variable_match_no_quotes.group(1)
-        elif variable_match_single_quotes:
-            block_type = "variable"
-            type_name = ""
-            instance_name = variable_match_single_quotes.group(1)
-        elif output_match:
-            block_type = "output"
-            type_name = ""
-            instance_name = output_match.group(1)
-        elif output_match_no_quotes:
-            block_type = "output"
-            type_name = ""
-            instance_name = output_match_no_quotes.group(1)
-        elif output_match_single_quotes:
-            block_type = "output"
-            type_name = ""
-            instance_name = output_match_single_quotes.group(1)
-        elif locals_match:
-            block_type = "locals"
-            type_name = ""
-            instance_name = ""
-        elif terraform_match:
-            block_type = "terraform"
-            type_name = ""
-            instance_name = ""
-        elif provider_match:
-            block_type = "provider"
-            type_name = provider_match.group(1)
-            instance_name = ""
-        elif provider_match_no_quotes:
-            block_type = "provider"
-            type_name = provider_match_no_quotes.group(1)
-            instance_name = ""
+        # The first matching header pattern decides the block kind
+        for pattern, block_type, type_group, instance_group in _BLOCK_HEADER_PATTERNS:
+            header_match = pattern.match(line)
+            if header_match:
+                type_name = header_match.group(type_group) if type_group else ""
+                instance_name = header_match.group(instance_group) if instance_group else ""
+                break
         else:
             i += 1
             continue
@@ -214,11 +173,7 @@ def _extract_all_blocks(content: str) -> List[Tuple[str, int, int, str, str]]:
         # Find the end of the block
         while i < len(lines) and brace_count > 0:
             current_line = lines[i]
-            for char in current_line:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
+            brace_count += current_line.count('{') - current_line.count('}')
             if brace_count == 0:
                 break
             i += 1
@@ -233,7 +188,8 @@ def _extract_all_blocks(content: str) -> List[Tuple[str, int, int, str, str]]:
 def _check_block_spacing_detailed(
     current_block: Tuple[str, int, int, str, str],
     next_block: Tuple[str, int, int, str, str],
-    lines: List[str]
+    lines: List[str],
+    blank_index: BlankLineIndex
 ) -> Optional[Tuple[int, str]]:
     """
     Check spacing between two consecutive blocks with detailed error reporting.
@@ -242,6 +198,7 @@ def _check_block_spacing_detailed(
         current_block: Tuple of (block_type, start_line, end_line, type_name, instance_name)
         next_block: Tuple of (block_type, start_line, end_line, type_name, instance_name)
         lines: List of file lines
+        blank_index: Blank-line index built from the same lines
 
     Returns:
         Optional[Tuple[int, str]]: (error_line, error_message) if violation found, None otherwise
@@ -250,19 +207,7 @@ def _check_block_spacing_detailed(
     next_type, next_start, next_end, next_type_name, next_instance = next_block
     
     # Count blank lines between the end of current block and start of next block
-    blank_lines = 0
-    first_blank_line = None
-    comment_lines = 0
-    
-    for line_idx in range(current_end, next_start - 1):
-        if line_idx < len(lines):
-            line = lines[line_idx].strip()
-            if line == '':
-                blank_lines += 1
-                if first_blank_line is None:
-                    first_blank_line = line_idx + 1
-            elif line.startswith('#'):
-                comment_lines += 1
+    blank_lines = blank_index.count_blank(current_end, next_start - 1)
     
     # Generate block identifiers for error messages
     current_block_id = _format_block_identifier(current_type, current_type_name, current_instance)
@@ -270,30 +215,25 @@ def _check_block_spacing_detailed(
     
     if blank_lines == 0:
         # Missing blank line - report at the start of next block
-        if comment_lines > 0:
-            error_msg = f"Missing blank line between {current_block_id} and {next_block_id}, the number of blank line should be 1."
-        else:
-            error_msg = f"Missing blank line between {current_block_id} and {next_block_id}, the number of blank line should be 1."
+        error_msg = f"Missing blank line between {current_block_id} and {next_block_id}, the number of blank line should be 1."
         return next_start, error_msg
     elif blank_lines > 1:
         # Too many blank lines - report at the first non-empty non-comment line after the problem
-        if first_blank_line is not None:
-            # Find the first non-empty non-comment line after the current block
-            error_line = None
-            for line_idx in range(current_end, next_start - 1):
-                if line_idx < len(lines):
-                    line = lines[line_idx].strip()
-                    # Skip empty lines and comment lines
-                    if line and not line.startswith('#'):
-                        error_line = line_idx + 1
-                        break
+        error_line = None
+        for line_idx in range(current_end, next_start - 1):
+            if line_idx < len(lines):
+                line = lines[line_idx].strip()
+                # Skip empty lines and comment lines
+                if line and not line.startswith('#'):
+                    error_line = line_idx + 1
+                    break
+        
+        # If no non-empty non-comment line found, use the start of next block
+        if error_line is None:
+            error_line = next_start
             
-            # If no non-empty non-comment line found, use the start of next block
-            if error_line is None:
-                error_line = next_start
-                
-            error_msg = f"Too many blank lines between {current_block_id} and {next_block_id}, the number of blank line should be 1."
-            return error_line, error_msg
+        error_msg = f"Too many blank lines between {current_block_id} and {next_block_id}, the number of blank line should be 1."
+        return error_line, error_msg
     
     return None
 
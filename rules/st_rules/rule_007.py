@@ -77,6 +77,22 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Tuple, Dict, Optional
 
+from rules.common.blank_lines import BlankLineIndex, get_blank_line_index
+from rules.common.lines import get_content_lines
+
+# Block, nested-block and parameter patterns matched against stripped lines
+_BLOCK_HEADER_RE = re.compile(r'(resource|data|provider|terraform|locals)\s*(?:(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))(?:\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*)))?)?\s*\{')
+_DYNAMIC_BLOCK_RE = re.compile(r'dynamic\s+"([^"]+)"\s*\{')
+_NESTED_BLOCK_RE = re.compile(r'(\w+)\s*\{')
+_OBJECT_ASSIGNMENT_RE = re.compile(r'(\w+)\s*=\s*\{')
+_PARAM_ASSIGNMENT_RE = re.compile(r'(\w+)\s*=')
+_QUOTED_PARAM_ASSIGNMENT_RE = re.compile(r'(\w+|"[^"]+"|\'[^\']+\')\s*=')
+# Common Terraform functions that contain object/array literals
+_FUNCTION_CALL_RE = re.compile(
+    r'\b(?:jsonencode|jsondecode|merge|try|coalesce|coalescelist|concat|flatten|'
+    r'setintersection|setunion|setproduct|zipmap)\s*\('
+)
+
 
 def check_st007_parameter_block_spacing(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -106,6 +122,9 @@ def check_st007_parameter_block_spacing(file_path: str, content: str, log_error_
         None: Reports errors through the log_error_func callback
     """
     block_list = _extract_resource_blocks_with_parameters(content)
+    # Split once; every block and scope below reads the same line list
+    lines = get_content_lines(content)
+    blank_index = get_blank_line_index(content)
     
     # Collect all errors first
     all_errors = []
@@ -116,7 +135,7 @@ def check_st007_parameter_block_spacing(file_path: str, content: str, log_error_
         
         # Check spacing between consecutive parameters
         spacing_errors = _check_parameter_spacing_rules(
-            parameters, block_name, content
+            parameters, block_name, lines, blank_index
         )
         
         for error_msg, line_num in spacing_errors:
@@ -140,7 +159,7 @@ def _extract_resource_blocks_with_parameters(content: str) -> List[Dict]:
     Returns:
         List[Dict]: List of block information with parameters
     """
-    lines = content.split('\n')
+    lines = get_content_lines(content)
     resources = []
     i = 0
     
@@ -148,7 +167,7 @@ def _extract_resource_blocks_with_parameters(content: str) -> List[Dict]:
         line = lines[i].strip()
         
         # Match resource, data, provider, terraform, or locals blocks (support quoted, single-quoted, and unquoted syntax)
-        resource_match = re.match(r'(resource|data|provider|terraform|locals)\s*(?:(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))(?:\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*)))?)?\s*\{', line)
+        resource_match = _BLOCK_HEADER_RE.match(line)
         
         if resource_match:
             block_type = resource_match.group(1)
@@ -223,22 +242,6 @@ def _is_inside_function_call(resource_lines: List[str], line_index: int) -> bool
     Returns:
         bool: True if inside a function call, False otherwise
     """
-    # Common Terraform functions that contain object/array literals
-    function_patterns = [
-        r'\bjsonencode\s*\(',
-        r'\bjsondecode\s*\(',
-        r'\bmerge\s*\(',
-        r'\btry\s*\(',
-        r'\bcoalesce\s*\(',
-        r'\bcoalescelist\s*\(',
-        r'\bconcat\s*\(',
-        r'\bflatten\s*\(',
-        r'\bsetintersection\s*\(',
-        r'\bsetunion\s*\(',
-        r'\bsetproduct\s*\(',
-        r'\bzipmap\s*\(',
-    ]
-    
     # Track nesting levels - we'll scan from the beginning to current line
     paren_level = 0
     brace_level = 0
@@ -256,27 +259,15 @@ def _is_inside_function_call(resource_lines: List[str], line_index: int) -> bool
         
         # Check if this line contains a function call pattern
         if not in_function_call:
-            for pattern in function_patterns:
-                if re.search(pattern, line):
-                    in_function_call = True
-                    function_start_line = i
-                    brace_level_at_function_start = brace_level  # Remember brace level at function start
-                    break
+            if _FUNCTION_CALL_RE.search(line):
+                in_function_call = True
+                function_start_line = i
+                brace_level_at_function_start = brace_level  # Remember brace level at function start
         
-        # Count parentheses, braces, and brackets
-        for char in line:
-            if char == '(':
-                paren_level += 1
-            elif char == ')':
-                paren_level -= 1
-            elif char == '{':
-                brace_level += 1
-            elif char == '}':
-                brace_level -= 1
-            elif char == '[':
-                bracket_level += 1
-            elif char == ']':
-                bracket_level -= 1
+        # Count parentheses, braces, and brackets (levels are only read per line)
+        paren_level += line.count('(') - line.count(')')
+        brace_level += line.count('{') - line.count('}')
+        bracket_level += line.count('[') - line.count(']')
         
         # After processing all characters in the line, check if we've exited the function call
         # We've exited if:
@@ -317,7 +308,7 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
             continue
         
         # Look for dynamic blocks first (dynamic "name" { ... })
-        dynamic_match = re.match(r'dynamic\s+"([^"]+)"\s*\{', line)
+        dynamic_match = _DYNAMIC_BLOCK_RE.match(line)
         
         if dynamic_match:
             param_name = dynamic_match.group(1)
@@ -337,16 +328,12 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
             # Check if we're inside a function call - if so, skip parameter block detection
             if _is_inside_function_call(resource_lines, i):
                 # Track nesting level but don't extract parameters
-                for char in line:
-                    if char == '{':
-                        nesting_level += 1
-                    elif char == '}':
-                        nesting_level -= 1
+                nesting_level += line.count('{') - line.count('}')
                 i += 1
                 continue
             
             # Look for structure blocks (parameter_name { ... }) at any nesting level
-            block_match = re.match(r'(\w+)\s*\{', line)
+            block_match = _NESTED_BLOCK_RE.match(line)
             
             if block_match:
                 param_name = block_match.group(1)
@@ -373,16 +360,12 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
                 # Check if we're inside a function call - if so, skip parameter block detection
                 if _is_inside_function_call(resource_lines, i):
                     # Track nesting level but don't extract parameters
-                    for char in line:
-                        if char == '{':
-                            nesting_level += 1
-                        elif char == '}':
-                            nesting_level -= 1
+                    nesting_level += line.count('{') - line.count('}')
                     i += 1
                     continue
                 
                 # Look for advanced parameter assignments (parameter_name = { ... }) first
-                advanced_assignment_match = re.match(r'(\w+)\s*=\s*\{', line)
+                advanced_assignment_match = _OBJECT_ASSIGNMENT_RE.match(line)
                 
                 if advanced_assignment_match:
                     # This is an advanced parameter assignment (map or array)
@@ -411,7 +394,7 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
                     i = block_end_index
                 else:
                     # Look for basic parameter assignments (parameter_name = value)
-                    param_match = re.match(r'(\w+)\s*=', line)
+                    param_match = _PARAM_ASSIGNMENT_RE.match(line)
                     
                     if param_match:
                         param_name = param_match.group(1)
@@ -425,11 +408,7 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
                         })
                 
                 # Track nesting level for other constructs
-                for char in line:
-                    if char == '{':
-                        nesting_level += 1
-                    elif char == '}':
-                        nesting_level -= 1
+                nesting_level += line.count('{') - line.count('}')
                 i += 1
     
     return parameters
@@ -447,20 +426,12 @@ def _find_block_end_index(lines: List[str], start_index: int) -> int:
         int: Index after the block's closing brace
     """
     brace_count = 0
-    for char in lines[start_index]:
-        if char == '{':
-            brace_count += 1
-        elif char == '}':
-            brace_count -= 1
+    brace_count += lines[start_index].count('{') - lines[start_index].count('}')
 
     j = start_index + 1
 
     while j < len(lines) and brace_count > 0:
-        for char in lines[j]:
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
+        brace_count += lines[j].count('{') - lines[j].count('}')
         j += 1
 
     return j
@@ -492,7 +463,7 @@ def _extract_required_provider_children(
         if not line or line.startswith('#'):
             continue
 
-        provider_match = re.match(r'(\w+)\s*=\s*\{', line)
+        provider_match = _OBJECT_ASSIGNMENT_RE.match(line)
 
         if provider_match:
             provider_name = provider_match.group(1)
@@ -542,7 +513,7 @@ def _extract_direct_children(
             i += 1
             continue
 
-        dynamic_match = re.match(r'dynamic\s+"([^"]+)"\s*\{', line)
+        dynamic_match = _DYNAMIC_BLOCK_RE.match(line)
 
         if dynamic_match:
             param_name = dynamic_match.group(1)
@@ -558,7 +529,7 @@ def _extract_direct_children(
             i = block_end_index
             continue
 
-        block_match = re.match(r'(\w+)\s*\{', line)
+        block_match = _NESTED_BLOCK_RE.match(line)
 
         if block_match:
             param_name = block_match.group(1)
@@ -581,7 +552,7 @@ def _extract_direct_children(
             i = block_end_index
             continue
 
-        advanced_assignment_match = re.match(r'(\w+)\s*=\s*\{', line)
+        advanced_assignment_match = _OBJECT_ASSIGNMENT_RE.match(line)
 
         if advanced_assignment_match:
             param_name = advanced_assignment_match.group(1)
@@ -604,7 +575,7 @@ def _extract_direct_children(
             i = block_end_index
             continue
 
-        param_match = re.match(r'(\w+|"[^"]+"|\'[^\']+\')\s*=', line)
+        param_match = _QUOTED_PARAM_ASSIGNMENT_RE.match(line)
 
         if param_match:
             param_name = param_match.group(1)
@@ -653,7 +624,7 @@ def _extract_basic_params_in_map_block(
         if _is_inside_function_call(block_lines, k):
             continue
 
-        param_match = re.match(r'(\w+|"[^"]+"|\'[^\']+\')\s*=', line)
+        param_match = _QUOTED_PARAM_ASSIGNMENT_RE.match(line)
 
         if param_match:
             parameters.append({
@@ -697,8 +668,8 @@ def _extract_nested_parameters(
             i += 1
             continue
 
-        block_match = re.match(r'(\w+)\s*\{', line)
-        advanced_match = re.match(r'(\w+)\s*=\s*\{', line)
+        block_match = _NESTED_BLOCK_RE.match(line)
+        advanced_match = _OBJECT_ASSIGNMENT_RE.match(line)
 
         if block_match:
             param_name = block_match.group(1)
@@ -757,14 +728,14 @@ def _group_parameters_by_parent_block(parameters: List[Dict]) -> Dict[Optional[s
     return scopes
 
 
-def _check_structure_block_end_spacing(parameters: List[Dict], block_name: str, content: str) -> List[Tuple[str, Optional[int]]]:
+def _check_structure_block_end_spacing(parameters: List[Dict], block_name: str, blank_index: BlankLineIndex) -> List[Tuple[str, Optional[int]]]:
     """
     Check spacing rules after structure blocks end (when encountering closing braces).
     
     Args:
         parameters (List[Dict]): List of parameters in order
         block_name (str): The block containing these parameters
-        content (str): The full file content
+        blank_index (BlankLineIndex): Blank-line index of the file content
         
     Returns:
         List[Tuple[str, Optional[int]]]: List of error messages and optional line numbers
@@ -774,7 +745,7 @@ def _check_structure_block_end_spacing(parameters: List[Dict], block_name: str,
 
     for scope_params in scopes.values():
         errors.extend(_check_structure_block_end_spacing_in_scope(
-            scope_params, block_name, content
+            scope_params, block_name, blank_index
         ))
 
     return errors
@@ -783,7 +754,7 @@ def _check_structure_block_end_spacing(parameters: List[Dict], block_name: str,
 def _check_structure_block_end_spacing_in_scope(
     scope_params: List[Dict],
     block_name: str,
-    content: str,
+    blank_index: BlankLineIndex,
 ) -> List[Tuple[str, Optional[int]]]:
     """
     Check structure block end spacing within a single parent_block scope.
@@ -791,13 +762,12 @@ def _check_structure_block_end_spacing_in_scope(
     Args:
         scope_params (List[Dict]): Parameters sharing the same parent_block scope
         block_name (str): The block containing these parameters
-        content (str): The full file content
+        blank_index (BlankLineIndex): Blank-line index of the file content
         
     Returns:
         List[Tuple[str, Optional[int]]]: List of error messages and optional line numbers
     """
     errors = []
-    lines = content.split('\n')
     
     for i in range(len(scope_params) - 1):
         current_param = scope_params[i]
@@ -812,18 +782,8 @@ def _check_structure_block_end_spacing_in_scope(
         next_start = next_param['start_line'] - 1    # Convert to 0-based indexing
         
         # Count blank lines between the structure block end and next parameter
-        blank_lines = 0
-        for line_idx in range(current_end + 1, next_start):
-            if line_idx < len(lines):
-                line_content = lines[line_idx].strip()
-                if line_content == '':
-                    blank_lines += 1
-                elif line_content.startswith('#'):
-                    # Comment lines don't count as blank lines but also don't reset the count
-                    continue
-                else:
-                    # If there's any non-comment, non-blank content, reset blank line count
-                    blank_lines = 0
+        # (comments are skipped, any other content resets the count)
+        blank_lines = blank_index.count_blank_after_content(current_end + 1, next_start)
         
         # Apply spacing rules based on parameter types
         # Skip spacing check for meta-parameters (these are handled by ST.008)
@@ -847,14 +807,20 @@ def _check_structure_block_end_spacing_in_scope(
     return errors
 
 
-def _check_parameter_spacing_rules(parameters: List[Dict], block_name: str, content: str) -> List[Tuple[str, Optional[int]]]:
+def _check_parameter_spacing_rules(
+    parameters: List[Dict],
+    block_name: str,
+    lines: List[str],
+    blank_index: BlankLineIndex,
+) -> List[Tuple[str, Optional[int]]]:
     """
     Check spacing rules between consecutive parameters.
 
     Args:
         parameters (List[Dict]): List of parameters in order
         block_name (str): The block containing these parameters
-        content (str): The full file content
+        lines (List[str]): The full file content split into lines
+        blank_index (BlankLineIndex): Blank-line index built from the same lines
 
     Returns:
         List[Tuple[str, Optional[int]]]: List of error messages and optional line numbers
@@ -862,12 +828,10 @@ def _check_parameter_spacing_rules(parameters: List[Dict], block_name: str, cont
     errors = []
     
     # First, check structure block end spacing
-    structure_errors = _check_structure_block_end_spacing(parameters, block_name, content)
+    structure_errors = _check_structure_block_end_spacing(parameters, block_name, blank_index)
     errors.extend(structure_errors)
     
     # Then check non-structure parameter spacing
-    lines = content.split('\n')
-    
     # Sort parameters by their start line to check consecutive parameters
     sorted_params = sorted(parameters, key=lambda x: x['start_line'])
     
@@ -888,18 +852,7 @@ def _check_parameter_spacing_rules(parameters: List[Dict], block_name: str, cont
         next_start = next_param['start_line'] - 1    # Convert to 0-based indexing
         
         # Count blank lines between the parameters (excluding comment lines)
-        blank_lines = 0
-        for line_idx in range(current_end + 1, next_start):
-            if line_idx < len(lines):
-                line_content = lines[line_idx].strip()
-                if line_content == '':
-                    blank_lines += 1
-                elif line_content.startswith('#'):
-                    # Comment lines don't count as blank lines but also don't reset the count
-                    continue
-                else:
-                    # If there's any non-comment, non-blank content, reset blank line count
-                    blank_lines = 0
+        blank_lines = blank_index.count_blank_after_content(current_end + 1, next_start)
         
         # Apply spacing rules based on parameter types
         # Skip spacing check if one parameter is inside a structure block and the other is the structure block itself
@@ -46,6 +46,19 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Tuple, Dict, Optional
 
+from rules.common.blank_lines import BlankLineIndex, get_blank_line_index
+from rules.common.lines import get_content_lines
+
+
+_RESOURCE_HEADER_RE = re.compile(r'(resource|data)\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{')
+_META_PARAM_ASSIGNMENT_RES = tuple(
+    (meta_param, re.compile(f'{meta_param}\\s*='))
+    for meta_param in ('count', 'for_each', 'provider', 'depends_on')
+)
+_DYNAMIC_BLOCK_RE = re.compile(r'dynamic\s+"[^"]+"\s*\{')
+_NESTED_BLOCK_RE = re.compile(r'(\w+)\s*\{')
+_PARAM_ASSIGNMENT_RE = re.compile(r'(\w+)\s*=')
+
 
 def check_st008_count_depends_on_spacing(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -73,6 +86,9 @@ def check_st008_count_depends_on_spacing(file_path: str, content: str, log_error
         None: Reports errors through the log_error_func callback
     """
     resource_blocks = _extract_resource_blocks_with_meta_parameters(content)
+    # Split once; every resource below reads the same line list
+    lines = get_content_lines(content)
+    blank_index = get_blank_line_index(content)
     
     for resource_info in resource_blocks:
         resource_name = resource_info['name']
@@ -80,7 +96,7 @@ def check_st008_count_depends_on_spacing(file_path: str, content: str, log_error
         
         # Check spacing for count and depends_on parameters
         spacing_errors = _check_meta_parameter_spacing(
-            parameters, resource_name, content
+            parameters, resource_name, lines, blank_index
         )
         
         for error_msg, line_num in spacing_errors:
@@ -97,7 +113,7 @@ def _extract_resource_blocks_with_meta_parameters(content: str) -> List[Dict]:
     Returns:
         List[Dict]: List of resource information with parameters
     """
-    lines = content.split('\n')
+    lines = get_content_lines(content)
     resources = []
     i = 0
     
@@ -105,7 +121,7 @@ def _extract_resource_blocks_with_meta_parameters(content: str) -> List[Dict]:
         line = lines[i].strip()
         
         # Match resource or data blocks (support quoted, single-quoted, and unquoted syntax)
-        resource_match = re.match(r'(resource|data)\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
+        resource_match = _RESOURCE_HEADER_RE.match(line)
         
         if resource_match:
             block_type = resource_match.group(1)
@@ -173,8 +189,8 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
         
         # Check for other meta-parameters (simple assignments)
         meta_param_found = False
-        for meta_param in ['count', 'for_each', 'provider', 'depends_on']:
-            meta_match = re.match(f'{meta_param}\\s*=', line)
+        for meta_param, meta_param_re in _META_PARAM_ASSIGNMENT_RES:
+            meta_match = meta_param_re.match(line)
             if meta_match:
                 # Special case: for_each inside dynamic blocks should not be treated as meta-parameter
                 if meta_param == 'for_each':
@@ -182,7 +198,7 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
                     is_inside_dynamic = False
                     for j in range(i):
                         prev_line = resource_lines[j].strip()
-                        if re.match(r'dynamic\s+"[^"]+"\s*\{', prev_line):
+                        if _DYNAMIC_BLOCK_RE.match(prev_line):
                             is_inside_dynamic = True
                             break
                     
@@ -211,7 +227,7 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
         # If not a meta-parameter, check for other parameters (for spacing context)
         if not meta_param_found:
             # Check for structure blocks (like content {, lifecycle {, etc.)
-            block_match = re.match(r'(\w+)\s*\{', line)
+            block_match = _NESTED_BLOCK_RE.match(line)
             if block_match:
                 param_name = block_match.group(1)
                 param_line = resource_start_line + i
@@ -247,7 +263,7 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
                 continue  # Continue to next iteration of the while loop
             else:
                 # Check for simple parameter assignments (only at top level, not inside blocks)
-                param_match = re.match(r'(\w+)\s*=', line)
+                param_match = _PARAM_ASSIGNMENT_RE.match(line)
                 if param_match:
                     param_name = param_match.group(1)
                     param_line = resource_start_line + i
@@ -263,20 +279,25 @@ def _extract_parameters_from_resource(resource_lines: List[str], resource_start_
     return parameters
 
 
-def _check_meta_parameter_spacing(parameters: List[Dict], resource_name: str, content: str) -> List[Tuple[str, Optional[int]]]:
+def _check_meta_parameter_spacing(
+    parameters: List[Dict],
+    resource_name: str,
+    lines: List[str],
+    blank_index: BlankLineIndex,
+) -> List[Tuple[str, Optional[int]]]:
     """
     Check spacing rules for meta-parameters.
 
     Args:
         parameters (List[Dict]): List of parameters in order
         resource_name (str): The resource containing these parameters
-        content (str): The full file content
+        lines (List[str]): The full file content split into lines
+        blank_index (BlankLineIndex): Blank-line index built from the same lines
 
     Returns:
         List[Tuple[str, Optional[int]]]: List of error messages and optional line numbers
     """
     errors = []
-    lines = content.split('\n')
     
     # Filter for meta-parameters and dynamic-internal parameters
     meta_params = [p for p in parameters if p['type'] in ['meta', 'dynamic_internal']]
@@ -311,7 +332,7 @@ def _check_meta_parameter_spacing(parameters: List[Dict], resource_name: str, co
                 pass
             else:
                 prev_end = prev_param['end_line'] - 1  # Convert to 0-based indexing
-                blank_lines = _count_blank_lines_between(lines, prev_end, param_line)
+                blank_lines = blank_index.count_blank_after_content(prev_end + 1, param_line)
                 
                 # Check spacing rules based on parameter types
                 if blank_lines != 1:
@@ -343,7 +364,7 @@ def _check_meta_parameter_spacing(parameters: List[Dict], resource_name: str, co
                 if not has_other_meta_between and next_param['type'] == 'other':
                     param_end = param['end_line'] - 1  # Convert to 0-based indexing
                     next_line = next_param['start_line'] - 1  # Convert to 0-based indexing
-                    blank_lines = _count_blank_lines_between(lines, param_end, next_line)
+                    blank_lines = blank_index.count_blank_after_content(param_end + 1, next_line)
                     
                     if blank_lines != 1:
                         error_msg = _generate_spacing_error(
@@ -373,34 +394,6 @@ def _check_meta_parameter_spacing(parameters: List[Dict], resource_name: str, co
     return errors
 
 
-def _count_blank_lines_between(lines: List[str], start_idx: int, end_idx: int) -> int:
-    """
-    Count blank lines between two line indices.
-
-    Args:
-        lines (List[str]): File lines
-        start_idx (int): Start line index (0-based)
-        end_idx (int): End line index (0-based)
-
-    Returns:
-        int: Number of blank lines between the indices
-    """
-    blank_lines = 0
-    for line_idx in range(start_idx + 1, end_idx):
-        if line_idx < len(lines):
-            line_content = lines[line_idx].strip()
-            if line_content == '':
-                blank_lines += 1
-            elif line_content.startswith('#'):
-                # Comment lines don't count as blank lines but also don't reset the count
-                continue
-            else:
-                # If there's any non-comment, non-blank content, reset blank line count
-                blank_lines = 0
-    
-    return blank_lines
-
-
 def _count_blank_lines_before_first_param(lines: List[str], resource_start_line: int) -> int:
     """
     Count blank lines before the first parameter in a resource block.
@@ -87,6 +87,9 @@ from typing import Callable, List, Optional, Set, Tuple
 
 from rules.common.provider_variables import is_provider_related_variable
 
+_VAR_REFERENCE_RE = re.compile(r'var\.([a-zA-Z_][a-zA-Z0-9_]*)')
+_VARIABLE_HEADER_RE = re.compile(r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{')
+
 
 def check_st009_variable_order(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -149,9 +152,8 @@ def _append_variable_usage_order(
     seen_variables: Set[str],
 ) -> None:
     """Append newly seen non-provider var.* names from *content* into *usage_order*."""
-    var_pattern = r'var\.([a-zA-Z_][a-zA-Z0-9_]*)'
-    for match in re.finditer(var_pattern, content):
-        var_name = match.group(1)
+    # Deduplicate within the file first, keeping first-use order
+    for var_name in dict.fromkeys(_VAR_REFERENCE_RE.findall(content)):
         if var_name not in seen_variables and not is_provider_related_variable(var_name):
             usage_order.append(var_name)
             seen_variables.add(var_name)
@@ -188,7 +190,7 @@ def _extract_variable_definition_order(variables_tf_content: str) -> List[Tuple[
     for line_num, line in enumerate(lines, 1):
         line = line.strip()
         # Match variable definitions - support quoted, single-quoted, and unquoted syntax
-        var_match = re.match(r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
+        var_match = _VARIABLE_HEADER_RE.match(line)
         if var_match:
             # Extract variable name from quoted, single-quoted, or unquoted group
             var_name = var_match.group(1) if var_match.group(1) else (var_match.group(2) if var_match.group(2) else var_match.group(3))
@@ -218,15 +220,17 @@ def _check_order_consistency(
     defined_vars = [var_name for var_name, _ in definition_order]
     definition_lines = {var_name: line_num for var_name, line_num in definition_order}
 
-    # Find variables that are both used and defined
-    common_vars = [var for var in usage_order if var in defined_vars]
+    # Find variables that are both used and defined (set lookups keep this linear)
+    defined_set = set(defined_vars)
+    common_vars = [var for var in usage_order if var in defined_set]
 
     if len(common_vars) < 2:
         return errors  # Need at least 2 variables to check ordering
 
     # Check if the order matches
     expected_order = common_vars
-    actual_order = [var for var in defined_vars if var in common_vars]
+    common_set = set(common_vars)
+    actual_order = [var for var in defined_vars if var in common_set]
 
     if expected_order != actual_order:
         # Find the first variable that's out of order
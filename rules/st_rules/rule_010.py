@@ -35,6 +35,19 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Optional
 
+from rules.common.lines import get_content_lines
+
+
+_DATA_DECLARATION_RE = re.compile(r'^\s*data\s+(.+?)\s*\{')
+_RESOURCE_DECLARATION_RE = re.compile(r'^\s*resource\s+(.+?)\s*\{')
+_VARIABLE_DECLARATION_RE = re.compile(r'^\s*variable\s+(.+?)\s*\{')
+_OUTPUT_DECLARATION_RE = re.compile(r'^\s*output\s+(.+?)\s*\{')
+_PROVIDER_DECLARATION_RE = re.compile(r'^\s*provider\s+(.+?)\s*\{')
+# Exactly two double-quoted strings separated by whitespace
+_QUOTED_TYPE_AND_NAME_RE = re.compile(r'^"[^"]*"\s+"[^"]*"$')
+# Exactly one double-quoted string
+_QUOTED_NAME_RE = re.compile(r'^"[^"]*"$')
+
 
 def check_st010_quote_usage(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -88,7 +101,7 @@ def check_st010_quote_usage(file_path: str, content: str, log_error_func: Callab
         >>> check_st010_quote_usage("main.tf", content, sample_log_func)
         ST.010 at main.tf:2: Unnecessary quotes around variable reference...
     """
-    lines = content.split('\n')
+    lines = get_content_lines(content)
 
     for line_num, line in enumerate(lines, 1):
         stripped_line = line.strip()
@@ -98,7 +111,7 @@ def check_st010_quote_usage(file_path: str, content: str, log_error_func: Callab
             continue
 
         # Check for data source declarations
-        data_match = re.match(r'^\s*data\s+(.+?)\s*\{', line)
+        data_match = _DATA_DECLARATION_RE.match(line)
         if data_match:
             declaration = data_match.group(1).strip()
             if not _is_properly_quoted_declaration(declaration):
@@ -109,7 +122,7 @@ def check_st010_quote_usage(file_path: str, content: str, log_error_func: Callab
                 )
 
         # Check for resource declarations
-        resource_match = re.match(r'^\s*resource\s+(.+?)\s*\{', line)
+        resource_match = _RESOURCE_DECLARATION_RE.match(line)
         if resource_match:
             declaration = resource_match.group(1).strip()
             if not _is_properly_quoted_declaration(declaration):
@@ -120,7 +133,7 @@ def check_st010_quote_usage(file_path: str, content: str, log_error_func: Callab
                 )
 
         # Check for variable declarations
-        variable_match = re.match(r'^\s*variable\s+(.+?)\s*\{', line)
+        variable_match = _VARIABLE_DECLARATION_RE.match(line)
         if variable_match:
             declaration = variable_match.group(1).strip()
             if not _is_properly_quoted_single_name(declaration):
@@ -131,7 +144,7 @@ def check_st010_quote_usage(file_path: str, content: str, log_error_func: Callab
                 )
 
         # Check for output declarations
-        output_match = re.match(r'^\s*output\s+(.+?)\s*\{', line)
+        output_match = _OUTPUT_DECLARATION_RE.match(line)
         if output_match:
             declaration = output_match.group(1).strip()
             if not _is_properly_quoted_single_name(declaration):
@@ -142,7 +155,7 @@ def check_st010_quote_usage(file_path: str, content: str, log_error_func: Callab
                 )
 
         # Check for provider declarations
-        provider_match = re.match(r'^\s*provider\s+(.+?)\s*\{', line)
+        provider_match = _PROVIDER_DECLARATION_RE.match(line)
         if provider_match:
             declaration = provider_match.group(1).strip()
             if not _is_properly_quoted_single_name(declaration):
@@ -175,9 +188,7 @@ def _is_properly_quoted_declaration(declaration: str) -> bool:
         >>> _is_properly_quoted_declaration('"huaweicloud_compute_instance" test')
         False
     """
-    # Pattern to match exactly two double-quoted strings separated by whitespace
-    pattern = r'^"[^"]*"\s+"[^"]*"$'
-    return bool(re.match(pattern, declaration))
+    return bool(_QUOTED_TYPE_AND_NAME_RE.match(declaration))
 
 
 def _is_properly_quoted_single_name(declaration: str) -> bool:
@@ -202,9 +213,7 @@ def _is_properly_quoted_single_name(declaration: str) -> bool:
         >>> _is_properly_quoted_single_name("'instance_name'")
         False
     """
-    # Pattern to match exactly one double-quoted string
-    pattern = r'^"[^"]*"$'
-    return bool(re.match(pattern, declaration))
+    return bool(_QUOTED_NAME_RE.match(declaration))
 
 
 def get_rule_description() -> dict:
@@ -25,6 +25,8 @@ License: Apache 2.0
 import re
 from typing import Callable, Optional
 
+from rules.common.lines import get_content_lines
+
 
 def check_st011_trailing_whitespace(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -55,7 +57,7 @@ def check_st011_trailing_whitespace(file_path: str, content: str, log_error_func
         ... }'''
         >>> # Errors reported for lines with trailing space and tab
     """
-    lines = content.split('\n')
+    lines = get_content_lines(content)
     
     for line_num, line in enumerate(lines, 1):
         # Check if line ends with whitespace characters
@@ -35,6 +35,8 @@ License: Apache 2.0
 import re
 from typing import Callable, List, Tuple, Optional
 
+from rules.common.lines import get_content_lines
+
 
 def check_st012_file_whitespace(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -86,7 +88,7 @@ def check_st012_file_whitespace(file_path: str, content: str, log_error_func: Ca
         >>> check_st012_file_whitespace("main.tf", content, sample_log_func)
         ST.012 at main.tf:2: File has 2 empty lines before first non-empty line (should have 0)
     """
-    lines = content.split('\n')
+    lines = get_content_lines(content)
     
     # Find first non-empty line
     first_non_empty_line = None